@@ -0,0 +1,137 @@
+"""
+Command-line tools.
+
+    python -m app.cli ingest protests feed.ndjson
+    python -m app.cli ingest market ticks.csv --api http://localhost:8000
+
+    python -m app.cli replay protest-heavy --model protest-heavy --start 2026-01-01 --compare baseline
+
+Without --api, records are written straight to DATABASE_URL. A running
+server only sees the new PSI on its next recompute then, so prefer --api
+when the dashboard is up.
+"""
+import argparse
+import sys
+import time
+import urllib.request
+
+from app.services.ingest import CHUNK_SIZE, KINDS, Ingestor, iter_line_chunks
+
+
+def _guess_format(path: str) -> str:
+    return "csv" if path.lower().endswith(".csv") else "ndjson"
+
+
+def ingest_direct(kind: str, fmt: str, stream, chunk_size: int) -> dict:
+    from app.database import SessionLocal
+    ingestor = Ingestor(kind, fmt)
+    db = SessionLocal()
+    try:
+        for lines in iter_line_chunks(stream, chunk_size):
+            ingestor.feed(db, lines)
+        report = ingestor.finish(db)
+    finally:
+        db.close()
+    return {
+        "kind": kind,
+        "accepted": report.accepted,
+        "rejected": report.rejected,
+        "countries": report.recomputed,
+        "errors": report.errors,
+    }
+
+
+def ingest_api(kind: str, fmt: str, stream, api: str) -> dict:
+    import json
+    content_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    request = urllib.request.Request(
+        f"{api.rstrip('/')}/ingest/{kind}?format={fmt}",
+        data=iter(lambda: stream.read(1 << 16), b""),
+        headers={"Content-Type": content_type, "Transfer-Encoding": "chunked"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def cmd_ingest(args) -> int:
+    fmt = args.format or _guess_format(args.path)
+    stream = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+    start = time.perf_counter()
+    try:
+        if args.api:
+            result = ingest_api(args.kind, fmt, stream, args.api)
+        else:
+            result = ingest_direct(args.kind, fmt, stream, args.chunk_size)
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+    elapsed = time.perf_counter() - start
+    rate = result["accepted"] / elapsed if elapsed else 0.0
+    print(
+        f"{result['kind']}: {result['accepted']} accepted, {result['rejected']} rejected, "
+        f"{result['countries']} countries recomputed in {elapsed:.2f}s ({rate:,.0f} rows/s)"
+    )
+    for error in result["errors"]:
+        print(f"  {error}")
+    return 0 if result["accepted"] or not result["rejected"] else 1
+
+
+def cmd_replay(args) -> int:
+    from datetime import datetime
+    from app.database import SessionLocal
+    from app.services.model_registry import model_registry
+    from app.services.replay import compare_scenarios, run_replay
+    start = datetime.fromisoformat(args.start)
+    end = datetime.fromisoformat(args.end) if args.end else datetime.utcnow()
+    model_registry.reload(log=lambda _message: None)
+    try:
+        model = model_registry.get(args.model).model
+    except KeyError:
+        print(f"Unknown PSI model: {args.model}")
+        return 1
+    db = SessionLocal()
+    began = time.perf_counter()
+    try:
+        report = run_replay(db, args.scenario, start, end, args.step, args.workers, model=model)
+        print(
+            f"{report.scenario}: {report.countries} countries x {report.steps} {args.step} steps, "
+            f"{report.rows} rows, {report.transitions} risk-level transitions "
+            f"in {time.perf_counter() - began:.2f}s"
+        )
+        if args.compare:
+            compared, differing, mean_delta = compare_scenarios(db, args.scenario, args.compare)
+            print(
+                f"  vs {args.compare}: {differing} of {compared} steps change risk level, "
+                f"mean |PSI delta| {mean_delta:.2f}"
+            )
+    finally:
+        db.close()
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Command Center tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("ingest", help="bulk-load an NDJSON or CSV feed")
+    p.add_argument("kind", choices=sorted(KINDS))
+    p.add_argument("path", help="input file, or - for stdin")
+    p.add_argument("--format", choices=["ndjson", "csv"], help="default: from the file extension")
+    p.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    p.add_argument("--api", help="post to a running server (e.g. http://localhost:8000) instead of the database")
+    p.set_defaults(func=cmd_ingest)
+    p = sub.add_parser("replay", help="backtest the PSI model over stored history into scenario_psi")
+    p.add_argument("scenario", help="name the results are stored under (replaced if it exists)")
+    p.add_argument("--start", required=True, help="ISO date or datetime (UTC)")
+    p.add_argument("--end", help="ISO date or datetime (UTC); default: now")
+    p.add_argument("--step", choices=["hour", "day"], default="day")
+    p.add_argument("--workers", type=int, help="replay processes (default: CPU count; 1 replays in-process)")
+    p.add_argument("--model", help="PSI model version from PSI_MODELS_DIR (default: the built-in model)")
+    p.add_argument("--compare", metavar="SCENARIO", help="report risk-level differences against another scenario")
+    p.set_defaults(func=cmd_replay)
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
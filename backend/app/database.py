@@ -1,6 +1,8 @@
 """Database configuration and session management."""
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -8,18 +10,106 @@ SQLALCHEMY_DATABASE_URL = os.getenv(
     "DATABASE_URL", "sqlite:///./command_center.db"
 )
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-)
+# "production" applies SQLITE_PRAGMAS to every connection; "default" leaves SQLite as-is
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "production")
+READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "8"))
+
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",  # readers never block on the writer
+    "synchronous": "NORMAL",  # durable at checkpoints; safe with WAL
+    "cache_size": -64000,  # 64 MiB page cache per connection
+    "mmap_size": 268435456,  # 256 MiB memory-mapped reads
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,  # ms a writer waits for the write lock
+}
+
+
+def _is_memory_url(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+
+def _async_url(url: str) -> str:
+    return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+
+
+def _apply_profile(engine: Engine, read_only: bool, profile: str) -> None:
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        if profile == "production":
+            for name, value in SQLITE_PRAGMAS.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+
+def create_sqlite_engine(
+    url: str,
+    read_only: bool = False,
+    pool_size: int = 1,
+    profile: str = SQLITE_PROFILE,
+) -> Engine:
+    """
+    Engine with the storage profile applied on every new connection.
+    Read-only engines also set query_only so a stray write fails fast.
+    """
+    if _is_memory_url(url):
+        return create_engine(url, connect_args={"check_same_thread": False})
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    _apply_profile(engine, read_only, profile)
+    return engine
+
+
+def create_async_sqlite_engine(
+    url: str,
+    read_only: bool = False,
+    pool_size: int = 1,
+    profile: str = SQLITE_PROFILE,
+) -> AsyncEngine:
+    """aiosqlite counterpart of create_sqlite_engine, for async request handlers."""
+    engine = create_async_engine(_async_url(url), pool_size=pool_size, max_overflow=0)
+    _apply_profile(engine.sync_engine, read_only, profile)
+    return engine
+
+
+# The API opens the database from several engines (sync writer, async readers
+# and writer), which a connection-private in-memory database cannot support
+if _is_memory_url(SQLALCHEMY_DATABASE_URL):
+    raise RuntimeError(
+        f"DATABASE_URL={SQLALCHEMY_DATABASE_URL!r} is an in-memory database, which the API cannot "
+        "share between its engines; point it at a file (a temporary one for tests) instead"
+    )
+
+# A single writer connection for ingestion/recompute, and a pool of readers
+# for GET endpoints.
+engine = create_sqlite_engine(SQLALCHEMY_DATABASE_URL)
+read_engine = create_sqlite_engine(SQLALCHEMY_DATABASE_URL, read_only=True, pool_size=READ_POOL_SIZE)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 Base = declarative_base()
 
+# Async engines for request handlers. Ingestion and recompute stay on the sync
+# writer above, in the worker executor (app.services.worker).
+async_engine = create_async_sqlite_engine(SQLALCHEMY_DATABASE_URL)
+async_read_engine = create_async_sqlite_engine(SQLALCHEMY_DATABASE_URL, read_only=True, pool_size=READ_POOL_SIZE)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    """Dependency for async read-write sessions."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
 
-def get_db():
-    """Dependency for database sessions."""
-    db = SessionLocal()
-    try:
+async def get_async_read_db():
+    """Dependency for async read-only sessions (GET endpoints)."""
+    async with AsyncReadSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -2,20 +2,16 @@
 import os
 from contextlib import asynccontextmanager
 import asyncio
-from fastapi import FastAPI, Depends, HTTPException, Query
+from datetime import date, datetime
+from typing import Literal, Optional
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db, engine, Base
-from app.models import (
-    Country,
-    Election as ElectionModel,
-    ProtestEvent as ProtestEventModel,
-    SentimentScore as SentimentScoreModel,
-    MarketIndicator as MarketIndicatorModel,
-    PSIScore,
-    Alert,
-)
+from app.database import get_async_db, get_async_read_db, engine, async_engine, async_read_engine, Base
+from app.migrations import migrate
+from app.models import Country, PSIScore, Alert
 from app.schemas import (
     CountryWithPSI,
     CountryDetail,
@@ -23,49 +19,219 @@ from app.schemas import (
     TimelineEntry,
     AlertCreate,
     AlertResponse,
-    Election,
-    ProtestEvent as ProtestEventSchema,
-    SentimentScore as SentimentScoreSchema,
-    MarketIndicator as MarketIndicatorSchema,
+    IngestResult,
 )
 from app.services.mock_data import run_mock_cycle, seed_countries
+from app.services.broadcaster import LiveBroadcaster
+from app.services.psi_stream import PSIStream
+from app.services.events import bus, PSI_RECOMPUTED, DATA_COMMITTED, ALERT_TRIGGERED
+from app.services.queries import country_psi_rows, latest_per_country, latest_psi_by_country
+from app.services.serialize import RowLayout, dumps
+from app.services.country_detail import MAX_CACHED_ID_SETS, load_country_details
+from app.services.leaderboard import DEFAULT_LIMIT, MAX_LIMIT, Leaderboard, leaderboard
+from app.services import columnar
+from app.services.elections import UPCOMING_WINDOW_DAYS, election_calendar
+from app.services.psi_history import load_timeline
+from app.services import retention
+from app.services.snapshot_cache import snapshot_cache
+from app.services.alerts import alert_engine
+from app.services.protest_window import protest_window
+from app.services.trends import trend_engine
+from app.services.psi_batch import input_snapshot, load_psi_inputs, score_inputs
+from app.services.model_registry import CompiledModel, describe_model, model_registry
+from app.psi_engine import DEFAULT_MODEL, PSIModel
+from app.services.worker import run_with_session
+from app.services.cluster import cluster
+from app.services.dirty import recompute_dirty
+from app.services.ingest import Ingestor, aiter_line_chunks
 
 
 # Background task for mock data updates (every 30 seconds)
 async def mock_data_updater():
-    from app.database import SessionLocal
     while True:
         await asyncio.sleep(30)
-        db = SessionLocal()
         try:
-            run_mock_cycle(db)
+            # Ingest + recompute on the worker thread; the loop keeps serving
+            await run_with_session(run_mock_cycle)
         except Exception as e:
             print(f"Mock data update error: {e}")
-        finally:
-            db.close()
+
+
+# Hot-reload PSI model versions (every PSI_MODELS_RELOAD_SECONDS)
+async def model_reloader():
+    while True:
+        await asyncio.sleep(model_registry.reload_interval)
+        try:
+            model_registry.reload()
+        except Exception as e:
+            print(f"PSI model reload error: {e}")
+
+
+# Background retention compaction (every RETENTION_INTERVAL_SECONDS)
+async def retention_compactor():
+    while True:
+        await asyncio.sleep(retention.COMPACTION_INTERVAL)
+        reclaimed = {}
+        try:
+            for spec in retention.SPECS:
+                for stage in (retention.compact_raw_batch, retention.compact_hourly_batch):
+                    while True:
+                        # One short transaction per batch, off the event loop
+                        n = await run_with_session(stage, spec, datetime.utcnow())
+                        if not n:
+                            break
+                        reclaimed[spec.name] = reclaimed.get(spec.name, 0) + n
+                        await asyncio.sleep(retention.COMPACTION_PAUSE)
+        except Exception as e:
+            print(f"Retention compaction error: {e}")
+        if reclaimed:
+            print(f"Retention: reclaimed {sum(reclaimed.values())} rows {reclaimed}")
+
+
+def load_psi_snapshot() -> None:
+    """Prime the /live stream with the current PSI of every country."""
+    from app.database import ReadSessionLocal
+    db = ReadSessionLocal()
+    try:
+        latest = latest_psi_by_country(db)
+    finally:
+        db.close()
+    rows = [
+        (
+            c.id,
+            psi.psi_score if psi else 0.0,
+            psi.risk_level if psi else "Stable",
+            psi.escalation_probability if psi else 0.0,
+        )
+        for c, psi in latest
+    ]
+    psi_stream.update(rows, datetime.utcnow().isoformat())
+
+
+def on_psi_recomputed(event: dict) -> None:
+    """Push the recomputed rows to /live subscribers (and follower workers) as a delta."""
+    rows = [
+        (r["country_id"], r["psi_score"], r["risk_level"], r["escalation_probability"])
+        for r in event["rows"]
+    ]
+    message = psi_stream.update(rows, event["timestamp"])
+    if message is not None:
+        live.publish(message)
+        cluster.publish(message)
+
+
+def on_alert_triggered(event: dict) -> None:
+    """Push fired alerts to /live subscribers and follower workers."""
+    message = {"type": "alert_triggered", "data": event["alerts"]}
+    live.publish(message)
+    cluster.publish(message)
+
+
+def on_data_committed(event: dict) -> None:
+    """Let follower workers invalidate their caches and refresh scenario inputs."""
+    cluster.publish(_data_committed_message(event["timestamp"]))
+
+
+def _data_committed_message(timestamp: str) -> dict:
+    return {"type": "data_committed", "timestamp": timestamp, "inputs": input_snapshot.rows()}
+
+
+def cluster_greeting() -> list[dict]:
+    """What a newly connected follower needs to match this leader."""
+    return [psi_stream.snapshot(), _data_committed_message(datetime.utcnow().isoformat())]
+
+
+def on_leader_message(message: dict) -> None:
+    """Follower: apply a message relayed by the leader."""
+    kind = message["type"]
+    if kind == "psi_update":
+        psi_stream.apply(message)
+        leaderboard.apply(message)
+        live.publish(message)
+    elif kind == "alert_triggered":
+        live.publish(message)
+    elif kind == "data_committed":
+        input_snapshot.replace(message["inputs"])
+        snapshot_cache.bump()
+        election_calendar.bump()
+
+
+async def on_follower_request(message: dict) -> None:
+    """Leader: act on a change made through a follower worker."""
+    kind = message["type"]
+    if kind == "alert_added":
+        alert_engine.remove(message["alert_id"])  # idempotent if sent twice
+        alert_engine.add(message["alert_id"], message["country_id"], message["psi_threshold"])
+    elif kind == "alert_removed":
+        alert_engine.remove(message["alert_id"])
+    elif kind == "recompute":
+        await run_with_session(recompute_dirty)
+
+
+def load_leader_state(db: Session) -> None:
+    """State only the recompute path reads, rebuilt whenever this process takes over."""
+    alert_engine.rebuild(db)
+    protest_window.rebuild(db, datetime.utcnow())
+    trend_engine.rebuild(db, datetime.utcnow())
+
+
+async def lead() -> None:
+    """Leader-only loops: mock ingest + recompute and retention compaction."""
+    await run_with_session(load_leader_state)
+    await asyncio.gather(mock_data_updater(), retention_compactor())
+
+
+psi_stream = PSIStream()
+live = LiveBroadcaster()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize DB and start background tasks."""
     from app.database import SessionLocal
-    Base.metadata.create_all(bind=engine)
+    model_registry.reload()
     db = SessionLocal()
     try:
-        if db.query(Country).count() == 0:
-            seed_countries(db)
-            run_mock_cycle(db)
+        # Workers start together; one migrates and seeds, the rest find it done
+        with cluster.init_lock():
+            Base.metadata.create_all(bind=engine)
+            migrate(engine)
+            if db.query(Country).count() == 0:
+                seed_countries(db)
+                run_mock_cycle(db)
+        # Scenario views rescore these until the first recompute refreshes them
+        input_snapshot.update(load_psi_inputs(db, datetime.utcnow()))
+        leaderboard.rebuild(db)
     finally:
         db.close()
-
-    # Start mock data updater
-    task = asyncio.create_task(mock_data_updater())
+    load_psi_snapshot()
+    bus.subscribe(PSI_RECOMPUTED, on_psi_recomputed, loop=asyncio.get_running_loop())
+    # Invalidate synchronously in the committing thread, before the next read
+    bus.subscribe(DATA_COMMITTED, snapshot_cache.bump)
+    bus.subscribe(DATA_COMMITTED, election_calendar.bump)
+    bus.subscribe(PSI_RECOMPUTED, alert_engine.on_psi_recomputed)
+    bus.subscribe(PSI_RECOMPUTED, leaderboard.on_psi_recomputed)
+    bus.subscribe(ALERT_TRIGGERED, on_alert_triggered, loop=asyncio.get_running_loop())
+    bus.subscribe(DATA_COMMITTED, on_data_committed, loop=asyncio.get_running_loop())
+
+    # The leader worker runs mock updates and retention; the others relay its messages
+    tasks = [
+        asyncio.create_task(cluster.run(lead, cluster_greeting, on_follower_request, on_leader_message)),
+        asyncio.create_task(model_reloader()),
+    ]
     yield
-    task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    bus.unsubscribe(PSI_RECOMPUTED, on_psi_recomputed)
+    bus.unsubscribe(DATA_COMMITTED, snapshot_cache.bump)
+    bus.unsubscribe(DATA_COMMITTED, election_calendar.bump)
+    bus.unsubscribe(PSI_RECOMPUTED, alert_engine.on_psi_recomputed)
+    bus.unsubscribe(PSI_RECOMPUTED, leaderboard.on_psi_recomputed)
+    bus.unsubscribe(ALERT_TRIGGERED, on_alert_triggered)
+    bus.unsubscribe(DATA_COMMITTED, on_data_committed)
+    for e in (async_engine, async_read_engine):
+        await e.dispose()
 
 
 app = FastAPI(
@@ -90,199 +256,336 @@ app.add_middleware(
 
 # REST API Endpoints - API_SPEC.md
 
+# Dashboard reads below are served from snapshot_cache until the next recompute.
+# List endpoints encode row tuples through these layouts; response_model only documents them.
+COUNTRY_LAYOUT = RowLayout(CountryWithPSI)
+LEADERBOARD_LAYOUT = RowLayout(LeaderboardEntry)
+TIMELINE_LAYOUT = RowLayout(TimelineEntry)
+
+def _scenario_model(version: Optional[str]) -> Optional[CompiledModel]:
+    """The requested what-if model, or None for the stored (default) scores."""
+    if version is None or version == DEFAULT_MODEL.version:
+        return None
+    try:
+        return model_registry.get(version)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown PSI model: {version}")
+
+
+def _scenario_scores(model: CompiledModel) -> dict[int, tuple[float, str, float]]:
+    """(psi_score, risk_level, escalation) per country under `model`, from the latest inputs."""
+    inputs = input_snapshot.inputs()
+    return dict(zip(inputs.country_ids, score_inputs(inputs, model)))
+
+
+@app.get("/models")
+async def list_models():
+    """PSI model versions available to ?model=."""
+    return [describe_model(m) for m in model_registry.versions()]
+
+
 @app.get("/countries", response_model=list[CountryWithPSI])
-def get_countries(db: Session = Depends(get_db)):
-    """Returns all countries with latest PSI score."""
-    countries = db.query(Country).all()
-    result = []
-    for c in countries:
-        psi = db.query(PSIScore).filter(PSIScore.country_id == c.id).order_by(PSIScore.updated_at.desc()).first()
-        result.append(CountryWithPSI(
-            id=c.id,
-            name=c.name,
-            iso_code=c.iso_code,
-            region=c.region,
-            latitude=c.latitude,
-            longitude=c.longitude,
-            psi_score=psi.psi_score if psi else 0.0,
-            risk_level=psi.risk_level if psi else "Stable",
-        ))
-    return result
+async def get_countries(
+    request: Request,
+    model: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """Returns all countries with latest PSI score (under a what-if `model` if given)."""
+    scenario = _scenario_model(model)
+    if scenario is None:
+        return await snapshot_cache.arespond(request, "countries", lambda: db.run_sync(_build_countries))
+    # Keyed by fingerprint too: a hot-reloaded version must not serve old results
+    return await snapshot_cache.arespond(
+        request,
+        ("countries", model, scenario.fingerprint),
+        lambda: db.run_sync(_build_scenario_countries, scenario),
+    )
+
+
+def _build_countries(db: Session) -> bytes:
+    return COUNTRY_LAYOUT.encode(country_psi_rows(db))
+
+
+def _build_scenario_countries(db: Session, model: CompiledModel) -> bytes:
+    scores = _scenario_scores(model)
+    return COUNTRY_LAYOUT.encode(
+        (*row[:6], *scores.get(row[5], (0.0, "Stable"))[:2]) for row in country_psi_rows(db)
+    )
 
 
 @app.get("/country/{country_id}", response_model=CountryDetail)
-def get_country(country_id: int, db: Session = Depends(get_db)):
+async def get_country(
+    request: Request,
+    country_id: int,
+    model: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+):
     """Returns detailed breakdown: PSI components, election, protest, sentiment, market."""
-    country = db.query(Country).filter(Country.id == country_id).first()
-    if not country:
-        raise HTTPException(status_code=404, detail="Country not found")
+    scenario = _scenario_model(model)
+    today = datetime.utcnow().date()
+    # Keyed by day too: elections' days_remaining counts down at midnight
+    return await snapshot_cache.arespond(
+        request,
+        ("country", country_id, today, model, scenario and scenario.fingerprint),
+        lambda: db.run_sync(_build_country_detail, country_id, today, scenario),
+    )
+
 
-    psi = db.query(PSIScore).filter(PSIScore.country_id == country_id).order_by(PSIScore.updated_at.desc()).first()
-    elections = db.query(ElectionModel).filter(ElectionModel.country_id == country_id).order_by(ElectionModel.days_remaining).limit(5).all()
-    protests = db.query(ProtestEventModel).filter(ProtestEventModel.country_id == country_id).order_by(ProtestEventModel.date.desc()).limit(10).all()
-    sentiment = db.query(SentimentScoreModel).filter(SentimentScoreModel.country_id == country_id).order_by(SentimentScoreModel.timestamp.desc()).first()
-    market = db.query(MarketIndicatorModel).filter(MarketIndicatorModel.country_id == country_id).order_by(MarketIndicatorModel.timestamp.desc()).first()
-
-    return CountryDetail(
-        id=country.id,
-        name=country.name,
-        iso_code=country.iso_code,
-        region=country.region,
-        latitude=country.latitude,
-        longitude=country.longitude,
-        psi_score=psi.psi_score if psi else 0.0,
-        risk_level=psi.risk_level if psi else "Stable",
-        escalation_probability=psi.escalation_probability if psi else 0.0,
-        elections=[Election.model_validate(e) for e in elections],
-        protests=[ProtestEventSchema.model_validate(p) for p in protests],
-        sentiment=SentimentScoreSchema.model_validate(sentiment) if sentiment else None,
-        market_indicator=MarketIndicatorSchema.model_validate(market) if market else None,
+@app.get("/countries/detail", response_model=list[CountryDetail])
+async def get_country_details(
+    request: Request,
+    ids: Optional[str] = Query(None, description="Comma-separated country ids; omit for every country"),
+    model: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """Detail for many countries in one response (every country without `ids`), for prefetching panels."""
+    scenario = _scenario_model(model)
+    country_ids = _parse_ids(ids)
+    today = datetime.utcnow().date()
+    # ids are sorted and de-duplicated into the key; clients choose the sets,
+    # so only MAX_CACHED_ID_SETS of them are cached per generation
+    return await snapshot_cache.arespond(
+        request,
+        ("country_details" if country_ids is None else "country_detail_sets",
+         country_ids, today, model, scenario and scenario.fingerprint),
+        lambda: db.run_sync(_build_country_details, country_ids, today, scenario),
+        limit=None if country_ids is None else MAX_CACHED_ID_SETS,
     )
 
 
+def _parse_ids(ids: Optional[str]) -> Optional[tuple[int, ...]]:
+    if ids is None:
+        return None
+    try:
+        return tuple(sorted({int(part) for part in ids.split(",") if part.strip()}))
+    except ValueError:
+        raise HTTPException(status_code=422, detail="ids must be comma-separated integers")
+
+
+def _build_country_detail(db: Session, country_id: int, today: date, model: Optional[CompiledModel]) -> bytes:
+    details = _scored_details(db, [country_id], today, model)
+    if not details:
+        raise HTTPException(status_code=404, detail="Country not found")
+    return dumps(details[0])
+
+
+def _build_country_details(
+    db: Session, country_ids: Optional[tuple[int, ...]], today: date, model: Optional[CompiledModel]
+) -> bytes:
+    return dumps(_scored_details(db, country_ids, today, model))
+
+
+def _scored_details(db: Session, country_ids, today: date, model: Optional[CompiledModel]) -> list[dict]:
+    details = load_country_details(db, country_ids, today)
+    if model is not None:
+        scores = _scenario_scores(model)
+        for detail in details:
+            score = scores.get(detail["id"])
+            if score is not None:
+                detail["psi_score"], detail["risk_level"], detail["escalation_probability"] = score
+    return details
+
+
 @app.get("/elections/upcoming")
-def get_upcoming_elections(db: Session = Depends(get_db)):
+async def get_upcoming_elections(request: Request, db: AsyncSession = Depends(get_async_read_db)):
     """Returns elections in the next 60 days."""
-    from datetime import datetime, timedelta
-    cutoff = datetime.utcnow() + timedelta(days=60)
-    elections = (
-        db.query(ElectionModel, Country)
-        .join(Country, ElectionModel.country_id == Country.id)
-        .filter(ElectionModel.date <= cutoff, ElectionModel.days_remaining > 0)
-        .order_by(ElectionModel.days_remaining)
-        .limit(15)
-        .all()
+    today = datetime.utcnow().date()
+    # Keyed by day too: days_remaining counts down at midnight
+    return await snapshot_cache.arespond(
+        request, ("elections_upcoming", today), lambda: db.run_sync(_build_upcoming_elections, today)
     )
-    psi_scores = db.query(PSIScore).filter(PSIScore.country_id.in_([c.id for _, c in elections])).all()
-    psi_map = {p.country_id: p for p in psi_scores}
+
+
+def _build_upcoming_elections(db: Session, today: date) -> list[dict]:
+    elections = election_calendar.upcoming(db, today, UPCOMING_WINDOW_DAYS)[:15]
+    country_ids = {e.country_id for e in elections}
+    countries = {c.id: c for c in db.query(Country).filter(Country.id.in_(country_ids))}
+    psi_map = latest_per_country(db, PSIScore, PSIScore.updated_at, country_ids)
     return [
         {
-            "country_id": c.id,
-            "country_name": c.name,
-            "iso_code": c.iso_code,
+            "country_id": e.country_id,
+            "country_name": countries[e.country_id].name,
+            "iso_code": countries[e.country_id].iso_code,
             "days_remaining": e.days_remaining,
             "type": e.type,
-            "psi_score": (psi_map[c.id].psi_score if c.id in psi_map else 0.0),
-            "risk_level": (psi_map[c.id].risk_level if c.id in psi_map else "Stable"),
+            "psi_score": (psi_map[e.country_id].psi_score if e.country_id in psi_map else 0.0),
+            "risk_level": (psi_map[e.country_id].risk_level if e.country_id in psi_map else "Stable"),
         }
-        for e, c in elections
+        for e in elections
     ]
 
 
 @app.get("/leaderboard", response_model=list[LeaderboardEntry])
-def get_leaderboard(db: Session = Depends(get_db)):
-    """Returns top 10 unstable countries."""
-    psi_scores = (
-        db.query(PSIScore, Country)
-        .join(Country, PSIScore.country_id == Country.id)
-        .order_by(PSIScore.psi_score.desc())
-        .limit(10)
-        .all()
-    )
-    return [
-        LeaderboardEntry(
-            rank=i + 1,
-            country_id=c.id,
-            country_name=c.name,
-            iso_code=c.iso_code,
-            psi_score=psi.psi_score,
-            risk_level=psi.risk_level,
+async def get_leaderboard(
+    request: Request,
+    model: Optional[str] = None,
+    region: Optional[str] = None,
+    level: Optional[str] = None,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+):
+    """
+    Returns the `limit` most unstable countries, optionally within a `region`
+    and/or risk `level` (under a what-if `model` if given).
+    """
+    scenario = _scenario_model(model)
+    _check_level(level, scenario.model if scenario else DEFAULT_MODEL)
+    if scenario is None:
+        return snapshot_cache.respond(
+            request,
+            ("leaderboard", region, level, limit),
+            lambda: LEADERBOARD_LAYOUT.encode(leaderboard.top(limit, region, level)),
         )
-        for i, (psi, c) in enumerate(psi_scores)
-    ]
+    return snapshot_cache.respond(
+        request,
+        ("leaderboard", region, level, limit, model, scenario.fingerprint),
+        lambda: LEADERBOARD_LAYOUT.encode(_scenario_leaderboard(scenario).top(limit, region, level)),
+    )
 
 
-@app.get("/timeline", response_model=list[TimelineEntry])
-def get_timeline(days: int = Query(30, ge=1, le=90), db: Session = Depends(get_db)):
-    """Returns historical PSI data (mock: returns current snapshot for MVP)."""
-    countries = db.query(Country).all()
-    psi_scores = db.query(PSIScore).filter(PSIScore.country_id.in_([c.id for c in countries])).all()
-    psi_map = {p.country_id: p for p in psi_scores}
-    from datetime import datetime
-    date_str = datetime.utcnow().strftime("%Y-%m-%d")
-    return [
-        TimelineEntry(
-            date=date_str,
-            country_id=c.id,
-            psi_score=psi_map.get(c.id).psi_score if c.id in psi_map else 0.0,
-            risk_level=psi_map.get(c.id).risk_level if c.id in psi_map else "Stable",
+@app.get("/leaderboard/levels", response_model=dict[str, int])
+async def get_risk_level_counts(request: Request, model: Optional[str] = None, region: Optional[str] = None):
+    """Returns the number of countries at each risk level, optionally within a `region`."""
+    scenario = _scenario_model(model)
+    if scenario is None:
+        return snapshot_cache.respond(request, ("risk_levels", region), lambda: leaderboard.counts(region))
+    return snapshot_cache.respond(
+        request,
+        ("risk_levels", region, model, scenario.fingerprint),
+        lambda: _scenario_leaderboard(scenario).counts(region, scenario.model.risk_level_names),
+    )
+
+
+def _check_level(level: Optional[str], model: PSIModel) -> None:
+    """422 unless `level` is one of `model`'s risk bands."""
+    if level is not None and level not in model.risk_level_names:
+        raise HTTPException(status_code=422, detail=f"Unknown risk level for model {model.version}: {level}")
+
+
+def _scenario_leaderboard(model: CompiledModel) -> Leaderboard:
+    """The leaderboard's countries ranked by `model` (built on a response cache miss)."""
+    return leaderboard.rescored(_scenario_scores(model))
+
+
+@app.get(
+    "/timeline",
+    response_model=list[TimelineEntry],
+    responses={200: {"content": {columnar.MEDIA_TYPE: {}}}},
+)
+async def get_timeline(
+    request: Request,
+    days: int = Query(30, ge=1, le=90),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Returns daily PSI per country (last/min/max/mean) for the last `days` days.
+    Send `Accept: application/vnd.psi.columnar+msgpack` for the columnar format.
+    """
+    today = datetime.utcnow().date()
+    if columnar.accepts_columnar(request):
+        return await snapshot_cache.arespond(
+            request,
+            ("timeline", days, today, columnar.MEDIA_TYPE),
+            lambda: db.run_sync(_build_columnar_timeline, days, today),
+            media_type=columnar.MEDIA_TYPE,
         )
-        for c in countries
-    ]
+    # Keyed by day too: the window slides at midnight even without a recompute
+    return await snapshot_cache.arespond(
+        request, ("timeline", days, today), lambda: db.run_sync(_build_timeline, days, today)
+    )
+
+
+def _build_timeline(db: Session, days: int, today: date) -> bytes:
+    # load_timeline rows are already in TimelineEntry field order
+    return TIMELINE_LAYOUT.encode(
+        (*row[:6], round(row[6], 1)) for row in load_timeline(db, days, today)
+    )
 
 
 @app.get("/alerts", response_model=list[AlertResponse])
-def list_alerts(db: Session = Depends(get_db)):
+async def list_alerts(db: AsyncSession = Depends(get_async_read_db)):
     """List all active alerts."""
-    return db.query(Alert).order_by(Alert.created_at.desc()).all()
+    return await db.run_sync(lambda s: s.query(Alert).order_by(Alert.created_at.desc()).all())
 
 
 @app.post("/alerts", response_model=AlertResponse)
-def create_alert(alert: AlertCreate, db: Session = Depends(get_db)):
+async def create_alert(alert: AlertCreate, db: AsyncSession = Depends(get_async_db)):
     """Create alert for country PSI threshold."""
     db_alert = Alert(country_id=alert.country_id, psi_threshold=alert.psi_threshold)
     db.add(db_alert)
-    db.commit()
-    db.refresh(db_alert)
+    await db.commit()
+    await db.refresh(db_alert)
+    alert_engine.add(db_alert.id, db_alert.country_id, db_alert.psi_threshold)
+    if not cluster.is_leader:
+        cluster.send_to_leader({
+            "type": "alert_added",
+            "alert_id": db_alert.id,
+            "country_id": db_alert.country_id,
+            "psi_threshold": db_alert.psi_threshold,
+        })
     return db_alert
 
 
 @app.delete("/alerts/{alert_id}")
-def delete_alert(alert_id: int, db: Session = Depends(get_db)):
+async def delete_alert(alert_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete an alert."""
-    alert = db.query(Alert).filter(Alert.id == alert_id).first()
+    alert = await db.get(Alert, alert_id)
     if not alert:
         raise HTTPException(status_code=404, detail="Alert not found")
-    db.delete(alert)
-    db.commit()
+    await db.delete(alert)
+    await db.commit()
+    alert_engine.remove(alert_id)
+    if not cluster.is_leader:
+        cluster.send_to_leader({"type": "alert_removed", "alert_id": alert_id})
     return {"ok": True}
 
 
-# WebSocket /live - streams PSI updates and breaking events
-from fastapi import WebSocket, WebSocketDisconnect
-import json
-from datetime import datetime
+@app.post("/ingest/{kind}", response_model=IngestResult)
+async def ingest_records(
+    kind: Literal["protests", "sentiment", "market"],
+    request: Request,
+    format: Optional[Literal["ndjson", "csv"]] = None,
+):
+    """
+    Bulk-load an NDJSON or CSV stream (format from `format` or Content-Type).
+    Each chunk is one transaction; PSI is then recomputed for affected countries
+    (by the leader worker when this one is a follower).
+    """
+    if format is None:
+        format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    ingestor = Ingestor(kind, format)
+    async for lines in aiter_line_chunks(request.stream()):
+        await run_with_session(ingestor.feed, lines)
+    report = await run_with_session(ingestor.finish, cluster.is_leader)
+    if not cluster.is_leader:
+        cluster.send_to_leader({"type": "recompute"})
+    return IngestResult(
+        kind=kind,
+        accepted=report.accepted,
+        rejected=report.rejected,
+        countries=report.recomputed,
+        errors=report.errors,
+    )
+
 
-active_connections: list[WebSocket] = []
+def _build_columnar_timeline(db: Session, days: int, today: date) -> bytes:
+    return columnar.encode_timeline(load_timeline(db, days, today), columnar.timeline_start(today, days))
 
 
+# WebSocket /live - streams PSI updates and breaking events
 @app.websocket("/live")
-async def websocket_live(websocket: WebSocket):
-    """Streams PSI updates and breaking events."""
-    await websocket.accept()
-    active_connections.append(websocket)
-    try:
-        from app.database import SessionLocal
-        while True:
-            await asyncio.sleep(5)  # Broadcast every 5 seconds
-            db = SessionLocal()
-            try:
-                countries = db.query(Country).all()
-                psi_scores = db.query(PSIScore).filter(PSIScore.country_id.in_([c.id for c in countries])).all()
-                psi_map = {p.country_id: p for p in psi_scores}
-                for conn in active_connections[:]:
-                    try:
-                        await conn.send_json({
-                            "type": "psi_update",
-                            "data": [
-                                {
-                                    "country_id": c.id,
-                                    "psi_score": psi_map.get(c.id).psi_score if c.id in psi_map else 0.0,
-                                    "risk_level": psi_map.get(c.id).risk_level if c.id in psi_map else "Stable",
-                                    "timestamp": datetime.utcnow().isoformat(),
-                                }
-                                for c in countries
-                            ],
-                        })
-                    except Exception:
-                        active_connections.remove(conn)
-            finally:
-                db.close()
-    except WebSocketDisconnect:
-        active_connections.remove(websocket)
+async def websocket_live(websocket: WebSocket, since: Optional[int] = None, epoch: Optional[str] = None):
+    """
+    Streams PSI deltas and breaking events. Pass `since=<seq>&epoch=<epoch>`
+    from the last psi_update on reconnect to receive the missed deltas as one
+    merged delta, or a full snapshot if they were evicted or the stream restarted.
+    Offer the `psi.columnar.msgpack` subprotocol for binary columnar frames.
+    """
+    binary = columnar.wants_columnar(websocket)
+    await websocket.accept(subprotocol=columnar.SUBPROTOCOL if binary else None)
+    await live.serve(websocket, psi_stream.resume(since, epoch), binary)
 
 
 @app.get("/health")
-def health():
+async def health():
     """Health check."""
     return {"status": "ok"}
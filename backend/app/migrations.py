@@ -0,0 +1,80 @@
+"""
+Schema migrations - versioned steps applied at startup.
+
+Base.metadata.create_all only creates missing tables; it never adds indexes
+or columns to an existing command_center.db. Each step below runs once, in
+order, and the highest applied version is recorded in `schema_version`.
+Steps must be idempotent so that a fresh database (already built by
+create_all) can run them as no-ops.
+"""
+from typing import Callable
+
+from sqlalchemy import Connection, Engine, text
+
+from app import models  # noqa: F401  (registers tables on Base.metadata)
+from app.database import Base
+
+
+def _create_indexes(conn: Connection, *names: str) -> None:
+    """Create the named model indexes if they do not exist yet."""
+    wanted = set(names)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name in wanted:
+                index.create(conn, checkfirst=True)
+                wanted.discard(index.name)
+    if wanted:
+        raise RuntimeError(f"Unknown indexes in migration: {sorted(wanted)}")
+
+
+def _time_series_indexes(conn: Connection) -> None:
+    _create_indexes(
+        conn,
+        "ix_elections_country_date",
+        "ix_sentiment_scores_country_timestamp",
+        "ix_market_indicators_country_timestamp",
+        "ix_psi_scores_country_updated",
+    )
+
+
+def _covering_protest_index(conn: Connection) -> None:
+    conn.execute(text("DROP INDEX IF EXISTS ix_protests_country_date"))
+    _create_indexes(conn, "ix_protests_country_date_severity")
+
+
+def _derived_election_proximity(conn: Connection) -> None:
+    # days_remaining is now computed from date (services/elections.py)
+    conn.execute(text("DROP INDEX IF EXISTS ix_elections_country_days"))
+    columns = {row[1] for row in conn.execute(text("PRAGMA table_info(elections)"))}
+    if "days_remaining" in columns:
+        conn.execute(text("ALTER TABLE elections DROP COLUMN days_remaining"))
+    _create_indexes(conn, "ix_elections_date")
+
+
+# (version, description, step) - append only, never renumber
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "composite (country_id, time) indexes on time-series tables", _time_series_indexes),
+    (2, "covering (country_id, date, severity_score) index on protests", _covering_protest_index),
+    (3, "drop stored elections.days_remaining; index elections by date", _derived_election_proximity),
+]
+
+
+def current_version(conn: Connection) -> int:
+    """Highest applied migration version (0 for an unversioned database)."""
+    conn.execute(text("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)"))
+    return conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_version")).scalar_one()
+
+
+def migrate(engine: Engine) -> int:
+    """Apply pending migrations, one transaction per step. Returns the final version."""
+    with engine.begin() as conn:
+        version = current_version(conn)
+    for step_version, description, step in MIGRATIONS:
+        if step_version <= version:
+            continue
+        with engine.begin() as conn:
+            step(conn)
+            conn.execute(text("INSERT INTO schema_version (version) VALUES (:v)"), {"v": step_version})
+        print(f"Applied migration {step_version}: {description}")
+        version = step_version
+    return version
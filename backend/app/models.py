@@ -1,6 +1,6 @@
 """SQLAlchemy models matching DATA_MODEL.md specification."""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index, Text
 from sqlalchemy.orm import relationship
 
 from .database import Base
@@ -25,18 +25,30 @@ class Country(Base):
 
 class Election(Base):
     __tablename__ = "elections"
+    __table_args__ = (
+        Index("ix_elections_country_date", "country_id", "date"),
+        Index("ix_elections_date", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     country_id = Column(Integer, ForeignKey("countries.id"), nullable=False)
     date = Column(DateTime, nullable=False)
     type = Column(String(50), nullable=False)  # presidential, parliamentary, etc.
-    days_remaining = Column(Integer, nullable=False)
 
     country = relationship("Country", back_populates="elections")
 
+    @property
+    def days_remaining(self) -> int:
+        """Whole UTC days until the election; derived from date, never stored."""
+        return (self.date.date() - datetime.utcnow().date()).days
+
 
 class ProtestEvent(Base):
     __tablename__ = "protests"
+    __table_args__ = (
+        # Covering: the 30-day window aggregate never touches the table
+        Index("ix_protests_country_date_severity", "country_id", "date", "severity_score"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     country_id = Column(Integer, ForeignKey("countries.id"), nullable=False)
@@ -49,6 +61,9 @@ class ProtestEvent(Base):
 
 class SentimentScore(Base):
     __tablename__ = "sentiment_scores"
+    __table_args__ = (
+        Index("ix_sentiment_scores_country_timestamp", "country_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     country_id = Column(Integer, ForeignKey("countries.id"), nullable=False)
@@ -61,6 +76,9 @@ class SentimentScore(Base):
 
 class MarketIndicator(Base):
     __tablename__ = "market_indicators"
+    __table_args__ = (
+        Index("ix_market_indicators_country_timestamp", "country_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     country_id = Column(Integer, ForeignKey("countries.id"), nullable=False)
@@ -73,6 +91,9 @@ class MarketIndicator(Base):
 
 class PSIScore(Base):
     __tablename__ = "psi_scores"
+    __table_args__ = (
+        Index("ix_psi_scores_country_updated", "country_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     country_id = Column(Integer, ForeignKey("countries.id"), nullable=False)
@@ -84,6 +105,106 @@ class PSIScore(Base):
     country = relationship("Country", back_populates="psi_scores")
 
 
+class PSIHistory(Base):
+    __tablename__ = "psi_history"
+    __table_args__ = (
+        Index("ix_psi_history_country_recorded", "country_id", "recorded_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    country_id = Column(Integer, ForeignKey("countries.id"), nullable=False)
+    psi_score = Column(Float, nullable=False)
+    risk_level = Column(String(20), nullable=False)
+    escalation_probability = Column(Float, nullable=False)
+    recorded_at = Column(DateTime, nullable=False)  # append-only; one row per change
+
+
+class PSIDailyRollup(Base):
+    __tablename__ = "psi_daily_rollups"
+    # Clustered on (day, country_id) so a timeline range scan reads rows in order
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    day = Column(String(10), primary_key=True)  # ISO date, YYYY-MM-DD
+    country_id = Column(Integer, ForeignKey("countries.id"), primary_key=True)
+    psi_min = Column(Float, nullable=False)
+    psi_max = Column(Float, nullable=False)
+    psi_sum = Column(Float, nullable=False)  # mean = psi_sum / samples
+    samples = Column(Integer, nullable=False)
+    psi_last = Column(Float, nullable=False)
+    risk_level_last = Column(String(20), nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+
+# Downsampled history written by the retention job (services/retention.py).
+# resolution is "hour" or "day"; each value keeps a sum (mean = sum / samples) and a max.
+
+class SentimentRollup(Base):
+    __tablename__ = "sentiment_rollups"
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    country_id = Column(Integer, ForeignKey("countries.id"), primary_key=True)
+    resolution = Column(String(4), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    samples = Column(Integer, nullable=False)
+    score_sum = Column(Float, nullable=False)
+    score_max = Column(Float, nullable=False)
+    volatility_index_sum = Column(Float, nullable=False)
+    volatility_index_max = Column(Float, nullable=False)
+
+
+class MarketRollup(Base):
+    __tablename__ = "market_rollups"
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    country_id = Column(Integer, ForeignKey("countries.id"), primary_key=True)
+    resolution = Column(String(4), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    samples = Column(Integer, nullable=False)
+    currency_volatility_sum = Column(Float, nullable=False)
+    currency_volatility_max = Column(Float, nullable=False)
+    bond_yield_change_sum = Column(Float, nullable=False)
+    bond_yield_change_max = Column(Float, nullable=False)
+
+
+class ProtestRollup(Base):
+    __tablename__ = "protest_rollups"
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    country_id = Column(Integer, ForeignKey("countries.id"), primary_key=True)
+    resolution = Column(String(4), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    samples = Column(Integer, nullable=False)  # protest events in the bucket
+    severity_score_sum = Column(Float, nullable=False)
+    severity_score_max = Column(Float, nullable=False)
+
+
+class PSIRollup(Base):
+    __tablename__ = "psi_rollups"
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    country_id = Column(Integer, ForeignKey("countries.id"), primary_key=True)
+    resolution = Column(String(4), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    samples = Column(Integer, nullable=False)  # psi_history changes in the bucket
+    psi_score_sum = Column(Float, nullable=False)
+    psi_score_max = Column(Float, nullable=False)
+    escalation_probability_sum = Column(Float, nullable=False)
+    escalation_probability_max = Column(Float, nullable=False)
+
+
+class ScenarioPSI(Base):
+    """PSI replayed by the backtest engine (services/replay.py), one row per country per step."""
+    __tablename__ = "scenario_psi"
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    scenario = Column(String(64), primary_key=True)
+    country_id = Column(Integer, ForeignKey("countries.id"), primary_key=True)
+    step_at = Column(DateTime, primary_key=True)
+    psi_score = Column(Float, nullable=False)
+    risk_level = Column(String(20), nullable=False)
+    escalation_probability = Column(Float, nullable=False)
+
+
 class Alert(Base):
     __tablename__ = "alerts"
 
@@ -16,7 +16,10 @@ Risk Levels:
 71–85 → High (Red)
 86–100 → Crisis (Flashing Red)
 """
-from typing import Optional
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, Union
+
+import numpy as np
 
 # Component weights (must sum to 1.0)
 ELECTION_WEIGHT = 0.20
@@ -33,6 +36,11 @@ RISK_LEVELS = [
     (86, 100, "Crisis"),
 ]
 
+# Risk-level codes used by the batch API: index into RISK_LEVELS
+RISK_LEVEL_NAMES = [level for _, _, level in RISK_LEVELS]
+
+ArrayLike = Union[np.ndarray, Sequence[float]]
+
 
 def _clamp(value: float, low: float, high: float) -> float:
     """Clamp value to range [low, high]."""
@@ -127,3 +135,173 @@ def calculate_escalation_probability(
     cluster_factor = _clamp(event_clustering, 0, 1)
     vol_factor = _clamp(volatility_spike, 0, 1)
     return round((slope_factor * 0.4 + cluster_factor * 0.35 + vol_factor * 0.25), 2)
+
+
+# Batch API - columnar equivalents of calculate_psi / calculate_escalation_probability.
+# Every operation mirrors the scalar path in the same order so results are
+# bit-identical; only the final rounding needs care (see _round_like_scalar).
+
+def _as_float_array(values: ArrayLike) -> np.ndarray:
+    """Columnar input as float64; None (e.g. no upcoming election) becomes NaN."""
+    return np.asarray(values, dtype=np.float64)
+
+
+def _clip(values: np.ndarray, low: float, high: float) -> np.ndarray:
+    return np.minimum(np.maximum(values, low), high)
+
+
+def _round_like_scalar(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Round like builtin round(). np.round scales by 10**ndigits and rounds
+    the product, which can disagree with round() only when the product
+    lands within float error of a .5 tie; those rare elements are redone
+    with round() itself.
+    """
+    scaled = values * 10.0 ** ndigits
+    rounded = np.round(values, ndigits)
+    near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie):
+        rounded[i] = round(float(values[i]), ndigits)
+    return rounded
+
+
+@dataclass(frozen=True)
+class PSIModel:
+    """
+    One PSI model version: component weights, risk bands and transform
+    parameters. The defaults are the module constants above.
+    """
+    version: str = "default"
+    election_weight: float = ELECTION_WEIGHT
+    protest_weight: float = PROTEST_WEIGHT
+    sentiment_weight: float = SENTIMENT_WEIGHT
+    currency_weight: float = CURRENCY_WEIGHT
+    news_weight: float = NEWS_WEIGHT
+    risk_levels: tuple[tuple[float, float, str], ...] = tuple(RISK_LEVELS)
+    election_horizon_days: float = 365  # elections further out score 0
+    protest_severity_scale: float = 20  # severity 0-5 maps to 0-80
+    protest_count_bonus: float = 5  # per protest, up to 20
+    currency_scale: float = 25
+
+    @property
+    def risk_level_names(self) -> list[str]:
+        return [level for _, _, level in self.risk_levels]
+
+    def validate(self) -> None:
+        """Raise ValueError unless weights sum to 1.0 and bands are ordered within 0-100."""
+        total = self.election_weight + self.protest_weight + self.sentiment_weight + self.currency_weight + self.news_weight
+        if abs(total - 1.0) > 1e-9:
+            raise ValueError(f"weights must sum to 1.0, got {total:g}")
+        if not self.risk_levels:
+            raise ValueError("at least one risk level is required")
+        previous_high = -1.0
+        for low, high, level in self.risk_levels:
+            if not (0 <= low <= high <= 100) or low <= previous_high:
+                raise ValueError(f"risk level {level!r} band {low}-{high} is out of order or outside 0-100")
+            previous_high = high
+        if self.election_horizon_days <= 0 or self.currency_scale <= 0 or self.protest_severity_scale <= 0:
+            raise ValueError("transform scales must be positive")
+
+
+PSIScorer = Callable[..., tuple[np.ndarray, np.ndarray]]
+
+
+def compile_model(model: PSIModel) -> PSIScorer:
+    """
+    Bind a model's parameters into a scoring closure with the
+    calculate_psi_batch signature. Risk codes index model.risk_level_names.
+    """
+    weights = (model.election_weight, model.protest_weight, model.sentiment_weight, model.currency_weight, model.news_weight)
+    bands = [(low, high) for low, high, _ in model.risk_levels]
+    horizon = model.election_horizon_days
+    severity_scale, count_bonus = model.protest_severity_scale, model.protest_count_bonus
+    currency_scale = model.currency_scale
+
+    def score(
+        election_days_remaining: ArrayLike,
+        protest_severity: ArrayLike,
+        protest_count: ArrayLike,
+        sentiment_score: ArrayLike,
+        sentiment_volatility: ArrayLike,
+        currency_volatility: ArrayLike,
+        news_negativity: ArrayLike,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        days = _as_float_array(election_days_remaining)
+        with np.errstate(invalid="ignore"):
+            election = np.where(
+                np.isnan(days) | (days > horizon),
+                0.0,
+                np.where(days <= 0, 100.0, _clip(100 - (days / horizon) * 95, 0, 100)),
+            )
+
+        base = _clip(_as_float_array(protest_severity) * severity_scale, 0, 80)
+        count_score = np.minimum(_as_float_array(protest_count) * count_bonus, 20)
+        protest = _clip(base + count_score, 0, 100)
+
+        negativity = (1 - _as_float_array(sentiment_score)) / 2
+        sentiment = _clip(negativity * 50 + _as_float_array(sentiment_volatility) * 50, 0, 100)
+
+        currency = _clip(_as_float_array(currency_volatility) * currency_scale, 0, 100)
+        news = _clip(_as_float_array(news_negativity) * 100, 0, 100)
+
+        psi = (
+            election * weights[0]
+            + protest * weights[1]
+            + sentiment * weights[2]
+            + currency * weights[3]
+            + news * weights[4]
+        )
+        psi = _clip(psi, 0, 100) + 0.0  # + 0.0 folds -0.0 into 0.0 as max(0, ...) does
+
+        # Same first-match scan as calculate_psi, on the unrounded score;
+        # values between bands fall through to code 0
+        codes = np.zeros(psi.shape, dtype=np.int8)
+        unassigned = np.ones(psi.shape, dtype=bool)
+        for code, (low, high) in enumerate(bands):
+            match = unassigned & (psi >= low) & (psi <= high)
+            codes[match] = code
+            unassigned &= ~match
+
+        return _round_like_scalar(psi, 1), codes
+
+    return score
+
+
+DEFAULT_MODEL = PSIModel()
+_default_scorer = compile_model(DEFAULT_MODEL)
+
+
+def calculate_psi_batch(
+    election_days_remaining: ArrayLike,
+    protest_severity: ArrayLike,
+    protest_count: ArrayLike,
+    sentiment_score: ArrayLike,
+    sentiment_volatility: ArrayLike,
+    currency_volatility: ArrayLike,
+    news_negativity: ArrayLike,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized calculate_psi over equal-length columns.
+    Returns (psi_scores float64, risk_codes int8); decode codes with RISK_LEVEL_NAMES.
+    """
+    return _default_scorer(
+        election_days_remaining,
+        protest_severity,
+        protest_count,
+        sentiment_score,
+        sentiment_volatility,
+        currency_volatility,
+        news_negativity,
+    )
+
+
+def calculate_escalation_probability_batch(
+    psi_trend_slope: ArrayLike,
+    event_clustering: ArrayLike,
+    volatility_spike: ArrayLike,
+) -> np.ndarray:
+    """Vectorized calculate_escalation_probability; returns 0-1 probabilities."""
+    slope_factor = _clip(_as_float_array(psi_trend_slope), 0, 1)
+    cluster_factor = _clip(_as_float_array(event_clustering), 0, 1)
+    vol_factor = _clip(_as_float_array(volatility_spike), 0, 1)
+    return _round_like_scalar(slope_factor * 0.4 + cluster_factor * 0.35 + vol_factor * 0.25, 2)
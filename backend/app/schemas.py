@@ -117,8 +117,11 @@ class LeaderboardEntry(BaseModel):
 class TimelineEntry(BaseModel):
     date: str
     country_id: int
-    psi_score: float
+    psi_score: float  # last score of the day
     risk_level: str
+    psi_min: Optional[float] = None
+    psi_max: Optional[float] = None
+    psi_mean: Optional[float] = None
 
 
 class AlertCreate(BaseModel):
@@ -137,9 +140,42 @@ class AlertResponse(BaseModel):
 
 
 class LiveUpdate(BaseModel):
-    type: str  # psi_update, breaking_event
+    type: str  # psi_update, alert_triggered, breaking_event
     country_id: Optional[int] = None
     psi_score: Optional[float] = None
     risk_level: Optional[str] = None
     message: Optional[str] = None
     timestamp: datetime = None
+
+
+# Ingestion records - a row names its country by country_id or iso_code
+
+class IngestRecord(BaseModel):
+    country_id: Optional[int] = None
+    iso_code: Optional[str] = None
+
+
+class ProtestIngest(IngestRecord):
+    severity_score: float
+    location: str
+    date: datetime
+
+
+class SentimentIngest(IngestRecord):
+    score: float
+    volatility_index: float
+    timestamp: Optional[datetime] = None  # defaults to ingest time
+
+
+class MarketIngest(IngestRecord):
+    currency_volatility: float
+    bond_yield_change: float
+    timestamp: Optional[datetime] = None  # defaults to ingest time
+
+
+class IngestResult(BaseModel):
+    kind: str
+    accepted: int
+    rejected: int
+    countries: int  # countries whose PSI was recomputed
+    errors: list[str]  # first few rejections, "line N: reason"
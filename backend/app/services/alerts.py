@@ -0,0 +1,131 @@
+"""
+Alert Engine - evaluates PSI threshold alerts after each recompute.
+
+Alerts are indexed per country as a sorted list of (threshold, alert_id), so
+a PSI move from old to new finds the crossed thresholds with two bisects;
+cost scales with the number of crossings, not the number of alerts.
+
+An alert fires when PSI rises through its threshold (old < threshold <= new)
+and is then disarmed. It re-arms only once PSI falls below threshold minus
+ALERT_HYSTERESIS, so a score oscillating around the threshold fires once.
+"""
+import os
+import threading
+from bisect import bisect_right, insort
+from math import inf
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import Alert
+from app.services.events import bus, ALERT_TRIGGERED
+from app.services.queries import latest_psi_by_country
+
+ALERT_HYSTERESIS = float(os.getenv("ALERT_HYSTERESIS", "5.0"))
+
+
+def _span(entries: list[tuple[float, int]], low: float, high: float) -> list[tuple[float, int]]:
+    """Entries with low < threshold <= high."""
+    return entries[bisect_right(entries, (low, inf)):bisect_right(entries, (high, inf))]
+
+
+class AlertEngine:
+    """Per-country sorted threshold index with armed/disarmed state."""
+
+    def __init__(self, hysteresis: float = ALERT_HYSTERESIS):
+        self.hysteresis = hysteresis
+        self._index: dict[int, list[tuple[float, int]]] = {}
+        self._alerts: dict[int, tuple[int, float]] = {}  # alert_id -> (country_id, threshold)
+        self._disarmed: set[int] = set()
+        self._psi: dict[int, float] = {}  # last seen PSI per country
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def rebuild(self, db: Session) -> None:
+        """Load every alert and the current PSI. Alerts already above threshold start disarmed."""
+        alerts = db.query(Alert.id, Alert.country_id, Alert.psi_threshold).all()
+        psi = {c.id: p.psi_score for c, p in latest_psi_by_country(db) if p is not None}
+        with self._lock:
+            self._index.clear()
+            self._alerts.clear()
+            self._disarmed.clear()
+            self._psi = psi
+            for alert_id, country_id, threshold in alerts:
+                self._add(alert_id, country_id, threshold)
+            for entries in self._index.values():
+                entries.sort()
+
+    def add(self, alert_id: int, country_id: int, threshold: float) -> None:
+        with self._lock:
+            self._add(alert_id, country_id, threshold, sort=True)
+
+    def remove(self, alert_id: int) -> None:
+        with self._lock:
+            found = self._alerts.pop(alert_id, None)
+            if found is None:
+                return
+            country_id, threshold = found
+            entries = self._index[country_id]
+            entries.pop(bisect_right(entries, (threshold, alert_id)) - 1)
+            if not entries:
+                del self._index[country_id]
+            self._disarmed.discard(alert_id)
+
+    def _add(self, alert_id: int, country_id: int, threshold: float, sort: bool = False) -> None:
+        self._alerts[alert_id] = (country_id, threshold)
+        entries = self._index.setdefault(country_id, [])
+        if sort:
+            insort(entries, (threshold, alert_id))
+        else:
+            entries.append((threshold, alert_id))
+        # A new alert only fires on a future crossing, not on the current level
+        current = self._psi.get(country_id)
+        if current is not None and current >= threshold:
+            self._disarmed.add(alert_id)
+
+    def evaluate(self, rows: list[dict], timestamp: str) -> list[dict]:
+        """
+        Apply one recompute's changed rows (psi_recomputed payload rows) and
+        return the alerts that fired.
+        """
+        triggered = []
+        with self._lock:
+            for r in rows:
+                country_id, new = r["country_id"], r["psi_score"]
+                old: Optional[float] = r.get("previous_psi_score")
+                if old is None:
+                    old = self._psi.get(country_id)
+                self._psi[country_id] = new
+                entries = self._index.get(country_id)
+                if not entries or old is None or new == old:
+                    continue
+                if new > old:
+                    for threshold, alert_id in _span(entries, old, new):
+                        if alert_id in self._disarmed:
+                            continue
+                        self._disarmed.add(alert_id)
+                        triggered.append({
+                            "alert_id": alert_id,
+                            "country_id": country_id,
+                            "psi_threshold": threshold,
+                            "psi_score": new,
+                            "previous_psi_score": old,
+                            "timestamp": timestamp,
+                        })
+                else:
+                    # Falling: re-arm alerts whose threshold - hysteresis was crossed
+                    h = self.hysteresis
+                    for _, alert_id in _span(entries, new + h, old + h):
+                        self._disarmed.discard(alert_id)
+        return triggered
+
+    def on_psi_recomputed(self, event: dict) -> None:
+        """Bus handler: evaluate and publish alert_triggered if anything fired."""
+        triggered = self.evaluate(event["rows"], event["timestamp"])
+        if triggered:
+            bus.publish(ALERT_TRIGGERED, {"timestamp": event["timestamp"], "alerts": triggered})
+
+
+alert_engine = AlertEngine()
@@ -0,0 +1,114 @@
+"""
+Live Broadcaster - fan-out for the /live WebSocket.
+
+Each published message is serialized once per wire format (JSON text, or
+columnar MessagePack for clients that negotiated it) and the encoded frame
+is handed to every subscriber. Each subscriber drains its own bounded queue, so a slow
+client is dropped instead of stalling the others.
+"""
+import asyncio
+from typing import Iterable, Union
+
+from fastapi import WebSocket
+
+from app.services.columnar import encode_live
+from app.services.serialize import dumps
+
+SEND_QUEUE_SIZE = 8  # frames buffered per client before it is dropped
+
+Frame = Union[str, bytes]
+
+
+def encode_frame(message: dict, binary: bool) -> Frame:
+    """A message as a JSON text frame, or a columnar binary frame."""
+    return encode_live(message) if binary else dumps(message).decode()
+
+
+class Subscriber:
+    """One connected /live client with its own bounded send queue."""
+
+    def __init__(self, websocket: WebSocket, queue_size: int = SEND_QUEUE_SIZE, binary: bool = False):
+        self.websocket = websocket
+        self.queue: asyncio.Queue[Frame] = asyncio.Queue(maxsize=queue_size)
+        self.binary = binary
+        self.dropped = False
+
+    def offer(self, frame: Frame) -> bool:
+        """Enqueue a frame without blocking. Returns False if the queue is full."""
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def send_loop(self) -> None:
+        """Drain the queue onto the socket."""
+        while not self.dropped:
+            frame = await self.queue.get()
+            if self.binary:
+                await self.websocket.send_bytes(frame)
+            else:
+                await self.websocket.send_text(frame)
+
+    async def receive_loop(self) -> None:
+        """Consume client messages until the socket closes."""
+        while True:
+            await self.websocket.receive_text()
+
+
+class LiveBroadcaster:
+    """Fans each published message out to all subscribers."""
+
+    def __init__(self, queue_size: int = SEND_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.subscribers: set[Subscriber] = set()
+
+    def publish(self, message: dict) -> None:
+        """Serialize once per format and offer the frame to every subscriber."""
+        if not self.subscribers:
+            return
+        frames: dict[bool, Frame] = {}
+        for sub in list(self.subscribers):
+            frame = frames.get(sub.binary)
+            if frame is None:
+                frame = frames[sub.binary] = encode_frame(message, sub.binary)
+            if not sub.offer(frame):
+                self._drop(sub)
+
+    def _drop(self, sub: Subscriber) -> None:
+        """Disconnect a subscriber whose queue overflowed."""
+        sub.dropped = True
+        self.subscribers.discard(sub)
+        asyncio.create_task(_close_quietly(sub.websocket, code=1013))
+
+    async def serve(self, websocket: WebSocket, backlog: Iterable[dict] = (), binary: bool = False) -> None:
+        """
+        Register an accepted socket and pump frames until it disconnects.
+        `backlog` is queued ahead of live traffic (e.g. a resync snapshot);
+        `binary` selects columnar frames (see columnar.encode_live). A
+        backlog that does not fit the send queue closes the socket like an
+        overflow, so the client reconnects instead of skipping seqs.
+        """
+        sub = Subscriber(websocket, self.queue_size, binary)
+        for message in backlog:
+            if not sub.offer(encode_frame(message, binary)):
+                await _close_quietly(websocket, code=1013)
+                return
+        self.subscribers.add(sub)
+        sender = asyncio.create_task(sub.send_loop())
+        receiver = asyncio.create_task(sub.receive_loop())
+        try:
+            await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self.subscribers.discard(sub)
+            for task in (sender, receiver):
+                task.cancel()
+            await asyncio.gather(sender, receiver, return_exceptions=True)
+
+
+async def _close_quietly(websocket: WebSocket, code: int = 1000) -> None:
+    """Close a socket, ignoring errors from an already-dead connection."""
+    try:
+        await websocket.close(code=code)
+    except Exception:
+        pass
@@ -0,0 +1,221 @@
+"""
+Cluster - leader election and cross-process fan-out for multi-worker servers.
+
+With `uvicorn --workers N` every worker process runs the lifespan. The one
+holding an exclusive flock on <prefix>.leader is the leader: it alone runs
+the ingest/recompute and retention loops, and it serves a Unix socket at
+<prefix>.sock that carries every /live message to the other workers as a
+line of JSON. Followers relay those messages to their own WebSocket clients,
+so all workers stream the same sequenced deltas, and send the few things the
+leader must act on (alert changes, recompute after an ingest) back up the
+same socket.
+
+The kernel releases the flock when the leader process dies; a follower whose
+connection drops tries the lock before reconnecting, so a surviving worker
+takes over without a broker or any configuration. <prefix> defaults to the
+SQLite file path; a Cluster without a prefix runs as a single-process leader.
+"""
+import asyncio
+import fcntl
+import json
+import os
+from collections import deque
+from contextlib import contextmanager, suppress
+from functools import partial
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+from app.database import SQLALCHEMY_DATABASE_URL
+from app.services.serialize import dumps
+
+RETRY_INTERVAL = float(os.getenv("CLUSTER_RETRY_SECONDS", "1"))
+FOLLOWER_BUFFER_LIMIT = 4 * 1024 * 1024  # bytes queued to a follower before it is dropped
+FRAME_LIMIT = 16 * 1024 * 1024  # longest line a follower accepts
+OUTBOX_SIZE = 1024  # messages a follower holds for the leader while disconnected
+
+
+def cluster_prefix(url: str = SQLALCHEMY_DATABASE_URL) -> str:
+    """Path prefix for the lock and socket files."""
+    override = os.getenv("CLUSTER_PREFIX")
+    if override:
+        return override
+    return url.split(":///", 1)[1].split("?", 1)[0]
+
+
+def _encode(message: dict) -> bytes:
+    return dumps(message) + b"\n"
+
+
+class Cluster:
+    """This process's role, its follower connections, or its link to the leader."""
+
+    def __init__(self, prefix: Optional[str]):
+        self.prefix = prefix
+        self.is_leader = prefix is None
+        self._lock_file = None
+        self._followers: set[asyncio.StreamWriter] = set()
+        self._leader: Optional[asyncio.StreamWriter] = None
+        self._outbox: deque[dict] = deque(maxlen=OUTBOX_SIZE)
+
+    @property
+    def socket_path(self) -> str:
+        return f"{self.prefix}.sock"
+
+    @contextmanager
+    def init_lock(self) -> Iterator[None]:
+        """Serialize schema migration and seeding across workers starting together."""
+        if self.prefix is None:
+            yield
+            return
+        with open(f"{self.prefix}.init", "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def try_lead(self) -> bool:
+        """Take the leader lock if nobody holds it."""
+        if self.is_leader:
+            return True
+        f = open(f"{self.prefix}.leader", "a")
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            f.close()
+            return False
+        self._lock_file = f
+        self.is_leader = True
+        return True
+
+    async def run(
+        self,
+        lead: Callable[[], Awaitable[Any]],
+        greeting: Callable[[], list[dict]],
+        on_request: Callable[[dict], Awaitable[Any]],
+        on_broadcast: Callable[[dict], Any],
+    ) -> None:
+        """
+        Until cancelled: follow the leader, and become it once the lock is free.
+        As leader, `lead()` runs the leader-only loops, each new follower is
+        sent `greeting()` and its messages go to `on_request`. As follower,
+        the leader's messages go to `on_broadcast`. If leading fails (lead()
+        raises or the socket cannot be served) this process steps down,
+        releasing the lock, and rejoins the election as a follower.
+        """
+        while True:
+            while not self.try_lead():
+                with suppress(OSError, ValueError):
+                    await self._follow(on_broadcast)
+                await asyncio.sleep(RETRY_INTERVAL)
+            if self.prefix is not None:
+                print(f"Cluster: worker {os.getpid()} is the leader")
+            try:
+                await self._lead(lead, greeting, on_request)
+            except Exception as e:
+                print(f"Cluster: worker {os.getpid()} stepped down: {e!r}")
+            finally:
+                self._step_down()
+            await asyncio.sleep(RETRY_INTERVAL)
+
+    async def _lead(
+        self,
+        lead: Callable[[], Awaitable[Any]],
+        greeting: Callable[[], list[dict]],
+        on_request: Callable[[dict], Awaitable[Any]],
+    ) -> None:
+        """Run the leader loops and the follower socket until either ends."""
+        tasks = [asyncio.ensure_future(lead())]
+        if self.prefix is not None:
+            tasks.append(asyncio.ensure_future(self._serve(greeting, on_request)))
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+            raise RuntimeError("leader loops exited")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _step_down(self) -> None:
+        """Drop the followers and release the socket and the lock."""
+        for writer in list(self._followers):
+            writer.close()
+        self._followers.clear()
+        if self._lock_file is not None:
+            with suppress(FileNotFoundError):
+                os.unlink(self.socket_path)
+            self._lock_file.close()
+            self._lock_file = None
+            self.is_leader = False
+
+    def publish(self, message: dict) -> None:
+        """Leader: send a message to every follower. A follower that stopped reading is dropped."""
+        if not self._followers:
+            return
+        frame = _encode(message)
+        for writer in list(self._followers):
+            if writer.transport.get_write_buffer_size() > FOLLOWER_BUFFER_LIMIT:
+                # It reconnects and resyncs from the greeting
+                self._followers.discard(writer)
+                writer.close()
+            else:
+                writer.write(frame)
+
+    def send_to_leader(self, message: dict) -> None:
+        """Follower: send a message to the leader, or hold it until connected."""
+        if self._leader is None:
+            self._outbox.append(message)
+        else:
+            self._leader.write(_encode(message))
+
+    async def _serve(self, greeting: Callable[[], list[dict]], on_request: Callable[[dict], Awaitable[Any]]) -> None:
+        if self.prefix is None:
+            return
+        with suppress(FileNotFoundError):
+            os.unlink(self.socket_path)  # left behind by a leader that died
+        server = await asyncio.start_unix_server(partial(self._follower, greeting, on_request), self.socket_path)
+        async with server:
+            await server.serve_forever()
+
+    async def _follower(
+        self,
+        greeting: Callable[[], list[dict]],
+        on_request: Callable[[dict], Awaitable[Any]],
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Leader side of one follower connection."""
+        for message in greeting():
+            writer.write(_encode(message))
+        self._followers.add(writer)
+        try:
+            while line := await reader.readline():
+                try:
+                    await on_request(json.loads(line))
+                except Exception as e:
+                    print(f"Cluster request error: {e}")
+        except ConnectionError:
+            pass
+        finally:
+            self._followers.discard(writer)
+            writer.close()
+
+    async def _follow(self, on_broadcast: Callable[[dict], Any]) -> None:
+        """Relay the leader's messages until the connection drops."""
+        reader, writer = await asyncio.open_unix_connection(self.socket_path, limit=FRAME_LIMIT)
+        self._leader = writer
+        try:
+            while self._outbox:
+                writer.write(_encode(self._outbox.popleft()))
+            while line := await reader.readline():
+                try:
+                    on_broadcast(json.loads(line))
+                except Exception as e:
+                    print(f"Cluster broadcast error: {e}")
+        finally:
+            self._leader = None
+            writer.close()
+
+
+cluster = Cluster(cluster_prefix())
@@ -0,0 +1,150 @@
+"""
+Columnar - compact MessagePack wire format for /timeline and /live.
+
+An opt-in alternative to JSON arrays of objects. A client that sends
+`Accept: application/vnd.psi.columnar+msgpack` (HTTP) or offers the
+`psi.columnar.msgpack` WebSocket subprotocol gets one MessagePack map of
+columns per payload instead of one object per row:
+
+- numeric columns are little-endian typed arrays in bin fields (country_id
+  int32, scores float32, day offsets uint16, codes uint8); copy one into an
+  aligned ArrayBuffer to view it as an Int32Array/Float32Array in a browser
+- risk_level is a uint8 code into the payload's "risk_levels" list, which
+  starts with psi_engine.RISK_LEVEL_NAMES (older names are appended)
+- timeline dates are day offsets from "start", and a missing psi_min,
+  psi_max or psi_mean is NaN
+- /live timestamps are codes into a per-message "timestamps" list, since a
+  recompute stamps every country it moved with the same time
+
+Over WebSockets uvicorn also negotiates permessage-deflate; cached HTTP
+responses are gzipped once per generation (see snapshot_cache).
+"""
+from datetime import date, timedelta
+from typing import Iterable, Optional, Sequence
+
+import msgpack
+import numpy as np
+from starlette.requests import HTTPConnection
+
+from app.psi_engine import RISK_LEVEL_NAMES
+
+MEDIA_TYPE = "application/vnd.psi.columnar+msgpack"
+SUBPROTOCOL = "psi.columnar.msgpack"
+VERSION = 1
+
+
+def _quality(accept: str) -> dict[str, float]:
+    """media type -> q from an Accept header (q=1 when absent, 0 when malformed)."""
+    ranges = {}
+    for part in accept.split(","):
+        media, *params = (p.strip() for p in part.split(";"))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media:
+            ranges[media.lower()] = q
+    return ranges
+
+
+def accepts_columnar(request: HTTPConnection) -> bool:
+    """
+    Whether the client's Accept header asks for the columnar format: listed
+    with q > 0 (q=0 means "not acceptable") and not ranked below JSON.
+    """
+    ranges = _quality(request.headers.get("accept", ""))
+    q = ranges.get(MEDIA_TYPE, 0.0)
+    return q > 0 and q >= ranges.get("application/json", 0.0)
+
+
+def wants_columnar(websocket: HTTPConnection) -> bool:
+    """Whether a WebSocket client offered the columnar subprotocol."""
+    offered = websocket.headers.get("sec-websocket-protocol", "")
+    return SUBPROTOCOL in (p.strip() for p in offered.split(","))
+
+
+class _Codes:
+    """Dictionary encoder: value -> small integer code, in first-seen order after `initial`."""
+
+    def __init__(self, initial: Sequence[str] = ()):
+        self.values = list(initial)
+        self._codes = {v: i for i, v in enumerate(self.values)}
+
+    def __call__(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _column(values: Iterable, dtype: str) -> bytes:
+    return np.fromiter(values, dtype=dtype).tobytes()
+
+
+def _floats(values: Iterable[Optional[float]]) -> bytes:
+    return _column((np.nan if v is None else v for v in values), "<f4")
+
+
+def encode_timeline(rows: Sequence[tuple], start: date) -> bytes:
+    """
+    Columnar form of load_timeline rows (day, country_id, psi_last,
+    risk_level_last, psi_min, psi_max, psi_mean), days counted from `start`.
+    """
+    levels = _Codes(RISK_LEVEL_NAMES)
+    days: dict[str, int] = {}
+    offsets = []
+    for row in rows:
+        offset = days.get(row[0])
+        if offset is None:
+            offset = days[row[0]] = (date.fromisoformat(row[0]) - start).days
+        offsets.append(offset)
+    risk_codes = _column((levels(r[3]) for r in rows), "u1")
+    return msgpack.packb({
+        "format": "timeline",
+        "version": VERSION,
+        "start": start.isoformat(),
+        "risk_levels": levels.values,
+        "day": _column(offsets, "<u2"),
+        "country_id": _column((r[1] for r in rows), "<i4"),
+        "psi_score": _floats(r[2] for r in rows),
+        "risk_level": risk_codes,
+        "psi_min": _floats(r[4] for r in rows),
+        "psi_max": _floats(r[5] for r in rows),
+        "psi_mean": _floats(r[6] for r in rows),
+    })
+
+
+def encode_live(message: dict) -> bytes:
+    """Columnar form of a /live message (psi_update data as columns; others as-is)."""
+    if message.get("type") != "psi_update":
+        return msgpack.packb(message)
+    data = message["data"]
+    levels = _Codes(RISK_LEVEL_NAMES)
+    stamps = _Codes()
+    risk_codes = _column((levels(d["risk_level"]) for d in data), "u1")
+    stamp_codes = _column((stamps(d["timestamp"]) for d in data), "<u2")
+    return msgpack.packb({
+        "type": "psi_update",
+        "format": "live",
+        "version": VERSION,
+        "seq": message["seq"],
+        "epoch": message["epoch"],
+        "snapshot": message["snapshot"],
+        "risk_levels": levels.values,
+        "timestamps": stamps.values,
+        "country_id": _column((d["country_id"] for d in data), "<i4"),
+        "psi_score": _floats(d["psi_score"] for d in data),
+        "risk_level": risk_codes,
+        "escalation_probability": _floats(d["escalation_probability"] for d in data),
+        "timestamp": stamp_codes,
+    })
+
+
+def timeline_start(today: date, days: int) -> date:
+    """First day of a `days`-day timeline ending today (load_timeline's window)."""
+    return today - timedelta(days=days - 1)
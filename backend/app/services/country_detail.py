@@ -0,0 +1,112 @@
+"""
+Country Detail - every detail-panel section for a batch of countries.
+
+Each section is one grouped query for the whole batch instead of one query
+per country: the country row with its latest PSI, the latest sentiment and
+market rows (per-country index seeks, see queries), and the next
+ELECTIONS_PER_COUNTRY elections and latest PROTESTS_PER_COUNTRY protests,
+ranked per country with ROW_NUMBER() so each list keeps its latest-N
+semantics. Columns are selected in schema field order and mapped through
+RowLayouts, so no ORM objects are loaded.
+"""
+from datetime import date
+from typing import Any, Collection, Optional, Sequence
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.orm import Session
+
+from app.models import Country, Election, ProtestEvent, SentimentScore, MarketIndicator, PSIScore
+from app.schemas import (
+    CountryDetail,
+    Election as ElectionSchema,
+    ProtestEvent as ProtestEventSchema,
+    SentimentScore as SentimentScoreSchema,
+    MarketIndicator as MarketIndicatorSchema,
+)
+from app.services.elections import days_until, first_upcoming
+from app.services.queries import latest_id_per_country, latest_rows_per_country
+from app.services.serialize import RowLayout
+
+ELECTIONS_PER_COUNTRY = 5
+PROTESTS_PER_COUNTRY = 10
+# Distinct ?ids= sets /countries/detail caches per data generation
+MAX_CACHED_ID_SETS = 64
+
+DETAIL_LAYOUT = RowLayout(CountryDetail, nested=("elections", "protests", "sentiment", "market_indicator"))
+ELECTION_LAYOUT = RowLayout(ElectionSchema)
+PROTEST_LAYOUT = RowLayout(ProtestEventSchema)
+SENTIMENT_LAYOUT = RowLayout(SentimentScoreSchema)
+MARKET_LAYOUT = RowLayout(MarketIndicatorSchema)
+
+
+def _columns(layout: RowLayout, model: Any) -> list:
+    return [getattr(model, name) for name in layout.fields]
+
+
+def _ranked(
+    db: Session,
+    columns: Sequence[Any],
+    model: Any,
+    order_by: Sequence[Any],
+    limit: int,
+    country_ids: Optional[Collection[int]],
+    *where: Any,
+) -> list:
+    """The first `limit` rows per country by `order_by`, ordered by country then rank."""
+    if country_ids is not None:
+        where = (*where, model.country_id.in_(country_ids))
+    rank = func.row_number().over(partition_by=model.country_id, order_by=order_by).label("rank")
+    ranked = select(*columns, rank).where(*where).subquery()
+    return db.execute(
+        select(*(ranked.c[c.key] for c in columns))
+        .where(ranked.c.rank <= limit)
+        .order_by(ranked.c.country_id, ranked.c.rank)
+    ).all()
+
+
+def load_country_details(db: Session, country_ids: Optional[Collection[int]], today: date) -> list[dict]:
+    """CountryDetail mappings for `country_ids` (None: every country), ordered by id."""
+    query = (
+        select(
+            *(getattr(Country, name) for name in DETAIL_LAYOUT.fields[:6]),
+            func.coalesce(PSIScore.psi_score, literal(0.0)),
+            func.coalesce(PSIScore.risk_level, literal("Stable")),
+            func.coalesce(PSIScore.escalation_probability, literal(0.0)),
+        )
+        .outerjoin(PSIScore, PSIScore.id == latest_id_per_country(PSIScore, PSIScore.updated_at))
+        .order_by(Country.id)
+    )
+    if country_ids is not None:
+        query = query.where(Country.id.in_(country_ids))
+    details = {}
+    for row in db.execute(query):
+        detail = DETAIL_LAYOUT.mapping(row)
+        detail.update(elections=[], protests=[], sentiment=None, market_indicator=None)
+        details[detail["id"]] = detail
+    if not details:
+        return []
+
+    elections = _ranked(
+        db, [Election.date, Election.type, Election.id, Election.country_id], Election,
+        [Election.date, Election.id], ELECTIONS_PER_COUNTRY, country_ids,
+        Election.date >= first_upcoming(today),
+    )
+    for when, kind, election_id, cid in elections:
+        details[cid]["elections"].append(ELECTION_LAYOUT.mapping((when, kind, days_until(when, today), election_id, cid)))
+
+    protests = _ranked(
+        db, _columns(PROTEST_LAYOUT, ProtestEvent), ProtestEvent,
+        [ProtestEvent.date.desc(), ProtestEvent.id.desc()], PROTESTS_PER_COUNTRY, country_ids,
+    )
+    for row in protests:
+        details[row.country_id]["protests"].append(PROTEST_LAYOUT.mapping(row))
+
+    for field, layout, model in (
+        ("sentiment", SENTIMENT_LAYOUT, SentimentScore),
+        ("market_indicator", MARKET_LAYOUT, MarketIndicator),
+    ):
+        latest = latest_rows_per_country(db, _columns(layout, model), model, model.timestamp, country_ids)
+        for cid, row in latest.items():
+            if cid in details:
+                details[cid][field] = layout.mapping(row)
+    return list(details.values())
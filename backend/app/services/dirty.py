@@ -0,0 +1,97 @@
+"""
+Dirty Set - which countries need rescoring since the last recompute.
+
+A country is dirty when an input table gained rows for it (tracked with a
+per-table id high-water mark, so finding them is a primary-key range scan),
+or when one of its protests aged out of the PSI window. The first recompute
+of each UTC day rescores everyone, which refreshes election proximity and
+opens that day's timeline rollups.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import Session
+
+from app.models import Country, Election, ProtestEvent, SentimentScore, MarketIndicator
+from app.services.protest_window import window_start as protest_window_start
+from app.services.psi_batch import recompute_psi
+
+TRACKED = (Election, ProtestEvent, SentimentScore, MarketIndicator)
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Tracker state to adopt once a recompute has committed."""
+    watermarks: dict[str, int]
+    window_start: datetime
+    day: date
+
+
+class DirtyTracker:
+    """High-water marks per input table plus the clock-driven sweeps."""
+
+    def __init__(self):
+        self._watermarks: Optional[dict[str, int]] = None
+        self._window_start: Optional[datetime] = None
+        self._day: Optional[date] = None
+        self.rescored = 0  # countries the last recompute_dirty rescored
+
+    def collect(self, db: Session, now: datetime) -> tuple[Optional[set[int]], Checkpoint]:
+        """
+        Dirty country ids (None means all) and the checkpoint that marks them
+        clean. Rows committed after this call stay above the new watermark.
+        """
+        watermarks = {
+            model.__tablename__: db.query(func.max(model.id)).scalar() or 0
+            for model in TRACKED
+        }
+        window_start = protest_window_start(now)
+        checkpoint = Checkpoint(watermarks, window_start, now.date())
+        if self._watermarks is None or self._day != now.date():
+            return None, checkpoint
+
+        dirty: set[int] = set()
+        for model in TRACKED:
+            low, high = self._watermarks[model.__tablename__], watermarks[model.__tablename__]
+            if high > low:
+                dirty.update(
+                    cid for (cid,) in
+                    db.query(model.country_id).filter(model.id > low, model.id <= high).distinct()
+                )
+        if window_start > self._window_start:
+            # One (country_id, date) index seek per country
+            expired = exists().where(
+                ProtestEvent.country_id == Country.id,
+                ProtestEvent.date >= self._window_start,
+                ProtestEvent.date < window_start,
+            )
+            dirty.update(db.execute(select(Country.id).where(expired)).scalars())
+        return dirty, checkpoint
+
+    def mark_clean(self, checkpoint: Checkpoint) -> None:
+        self._watermarks = checkpoint.watermarks
+        self._window_start = checkpoint.window_start
+        self._day = checkpoint.day
+
+
+dirty_tracker = DirtyTracker()
+
+
+def recompute_dirty(db: Session, now: Optional[datetime] = None) -> list[dict]:
+    """Rescore only the dirty countries. Returns the changed rows, like recompute_psi."""
+    now = now or datetime.utcnow()
+    db.flush()  # pending ORM inserts must be visible to the watermark queries
+    country_ids, checkpoint = dirty_tracker.collect(db, now)
+    if country_ids is not None and not country_ids:
+        db.commit()
+        dirty_tracker.mark_clean(checkpoint)
+        dirty_tracker.rescored = 0
+        return []
+    changed = recompute_psi(db, now, country_ids)
+    dirty_tracker.mark_clean(checkpoint)
+    dirty_tracker.rescored = (
+        len(country_ids) if country_ids is not None else db.query(func.count(Country.id)).scalar()
+    )
+    return changed
@@ -0,0 +1,110 @@
+"""
+Election Calendar - election proximity derived from Election.date.
+
+days_remaining is the number of whole UTC days from today to the election,
+so it advances at midnight on its own instead of going stale in a stored
+column. "Next election per country" is one (country_id, date) index seek per
+country and "elections in the next N days" is one range scan on the date
+index. Results are cached until the next day boundary or the next
+DATA_COMMITTED, which bumps the generation as it does for snapshot_cache,
+so added, edited and rolled-back elections never leave a stale entry. The
+recompute reads uncached: it must see elections its own transaction wrote.
+"""
+import threading
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Country, Election
+
+UPCOMING_WINDOW_DAYS = 60
+
+
+class UpcomingElection(NamedTuple):
+    id: int
+    country_id: int
+    date: datetime
+    type: str
+    days_remaining: int
+
+
+def days_until(when: datetime, today: date) -> int:
+    """Whole days from `today` to the calendar day of `when`."""
+    return (when.date() - today).days
+
+
+def first_upcoming(today: date) -> datetime:
+    """Earliest election time still upcoming on `today` (midnight of the next day)."""
+    return datetime.combine(today + timedelta(days=1), time.min)
+
+
+def _upcoming(e: Election, today: date) -> UpcomingElection:
+    return UpcomingElection(e.id, e.country_id, e.date, e.type, days_until(e.date, today))
+
+
+class ElectionCalendar:
+    """Process-wide cache of upcoming elections, keyed by day and data generation."""
+
+    def __init__(self):
+        self.generation = 0
+        self._key: Optional[tuple[date, int]] = None
+        self._entries: dict[Any, Any] = {}
+        self._lock = threading.Lock()
+
+    def bump(self, _event: Any = None) -> None:
+        """Invalidate everything; called when a recompute commits."""
+        with self._lock:
+            self.generation += 1
+
+    def next_by_country(self, db: Session, today: date, cached: bool = True) -> dict[int, UpcomingElection]:
+        """Each country's nearest upcoming election, keyed by country_id."""
+        if not cached:
+            return self._load_next(db, today)
+        return self._cached(today, "next", lambda: self._load_next(db, today))
+
+    def upcoming(self, db: Session, today: date, days: int = UPCOMING_WINDOW_DAYS) -> list[UpcomingElection]:
+        """Elections in the next `days` days, nearest first."""
+        return self._cached(today, ("upcoming", days), lambda: self._load_upcoming(db, today, days))
+
+    def _cached(self, today: date, name: Any, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            key = (today, self.generation)
+            if self._key != key:
+                self._key = key
+                self._entries.clear()
+            entry = self._entries.get(name)
+        if entry is None:
+            entry = build()
+            with self._lock:
+                # Don't cache a build that raced with a newer day or commit
+                if self._key == key:
+                    self._entries[name] = entry
+        return entry
+
+    @staticmethod
+    def _load_next(db: Session, today: date) -> dict[int, UpcomingElection]:
+        next_id = (
+            select(Election.id)
+            .where(Election.country_id == Country.id, Election.date >= first_upcoming(today))
+            .order_by(Election.date, Election.id)
+            .limit(1)
+            .correlate(Country)
+            .scalar_subquery()
+        )
+        rows = db.query(Election).filter(Election.id.in_(select(next_id).select_from(Country)))
+        return {e.country_id: _upcoming(e, today) for e in rows}
+
+    @staticmethod
+    def _load_upcoming(db: Session, today: date, days: int) -> list[UpcomingElection]:
+        start = first_upcoming(today)
+        rows = (
+            db.query(Election)
+            .filter(Election.date >= start, Election.date < start + timedelta(days=days))
+            .order_by(Election.date, Election.id)
+        )
+        return [_upcoming(e, today) for e in rows]
+
+
+election_calendar = ElectionCalendar()
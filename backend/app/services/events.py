@@ -0,0 +1,64 @@
+"""
+Event Bus - in-process pub/sub between the recompute path and its consumers.
+
+Producers (update_psi_scores, ingestion) publish after committing; WebSocket
+fan-out and alert evaluation subscribe. Handlers registered with an event
+loop are scheduled onto that loop, so publishing from a worker thread is safe.
+"""
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Optional
+
+# Payload: {"timestamp": iso8601, "rows": [{country_id, psi_score, risk_level,
+#           escalation_probability, previous_psi_score}, ...]}
+PSI_RECOMPUTED = "psi_recomputed"
+# Payload: {"timestamp": iso8601}. Published after every recompute commit, even
+# when no score moved, since elections, protests and rollups may have changed.
+DATA_COMMITTED = "data_committed"
+# Payload: {"timestamp": iso8601, "alerts": [{alert_id, country_id, psi_threshold,
+#           psi_score, previous_psi_score, timestamp}, ...]}
+ALERT_TRIGGERED = "alert_triggered"
+
+Handler = Callable[[Any], None]
+
+
+class EventBus:
+    """Topic-based publish/subscribe with thread-safe delivery."""
+
+    def __init__(self):
+        self._handlers: dict[str, list[tuple[Handler, Optional[asyncio.AbstractEventLoop]]]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def subscribe(self, topic: str, handler: Handler, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Register a handler. With `loop`, it runs on that loop instead of the publisher's thread."""
+        with self._lock:
+            self._handlers[topic].append((handler, loop))
+
+    def unsubscribe(self, topic: str, handler: Handler) -> None:
+        # == rather than `is`: every attribute access makes a new bound-method
+        # object, but bound methods of the same function and instance compare equal
+        with self._lock:
+            self._handlers[topic] = [(h, l) for h, l in self._handlers[topic] if h != handler]
+
+    def publish(self, topic: str, payload: Any) -> None:
+        """Deliver payload to every subscriber of topic."""
+        with self._lock:
+            handlers = list(self._handlers.get(topic, ()))
+        for handler, loop in handlers:
+            if loop is not None:
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(_safe_call, handler, topic, payload)
+            else:
+                _safe_call(handler, topic, payload)
+
+
+def _safe_call(handler: Handler, topic: str, payload: Any) -> None:
+    """Isolate subscribers from each other's failures."""
+    try:
+        handler(payload)
+    except Exception as e:
+        print(f"Event handler error ({topic}): {e}")
+
+
+bus = EventBus()
@@ -0,0 +1,61 @@
+"""
+Hour Buckets - per-country hourly buckets over a sliding time window.
+
+The ring behind protest_window and trends: values are bucketed by whole
+hours since EPOCH, and sliding the window hands back the buckets that fell
+out of it so the owner can subtract them from its running totals. Expiry
+walks the expired hour range, or the live buckets when that range is longer
+(a long idle gap), so it costs O(min(hours passed, buckets)).
+"""
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+EPOCH = datetime(1970, 1, 1)
+HOUR = timedelta(hours=1)
+
+
+def hour_of(ts: datetime) -> int:
+    """Whole hours from EPOCH to `ts`."""
+    return (ts - EPOCH) // HOUR
+
+
+class HourBuckets:
+    """hour -> country_id -> bucket, for hours from `first_hour` on."""
+
+    def __init__(self):
+        self.first_hour = 0  # oldest bucket still in the window
+        self._buckets: dict[int, dict[int, Any]] = {}
+
+    def reset(self, first_hour: int) -> None:
+        self._buckets.clear()
+        self.first_hour = first_hour
+
+    def covers(self, first_hour: int) -> bool:
+        """
+        Whether a window starting at `first_hour` is still complete. False on
+        first use or when the clock moved back (replay): buckets before the
+        current first_hour are gone, so the owner must rebuild.
+        """
+        return first_hour >= self.first_hour
+
+    def bucket(self, hour: int, country_id: int, new: Callable[[], Any]) -> Optional[Any]:
+        """The bucket for (hour, country_id), created with `new()`; None if the hour has expired."""
+        if hour < self.first_hour:
+            return None
+        buckets = self._buckets.setdefault(hour, {})
+        bucket = buckets.get(country_id)
+        if bucket is None:
+            bucket = buckets[country_id] = new()
+        return bucket
+
+    def expire(self, first_hour: int) -> list[tuple[int, dict[int, Any]]]:
+        """Slide the window to start at `first_hour`, returning the expired (hour, {country_id: bucket})."""
+        if first_hour <= self.first_hour:
+            return []
+        if first_hour - self.first_hour > len(self._buckets):
+            hours = [h for h in self._buckets if h < first_hour]
+        else:
+            hours = range(self.first_hour, first_hour)
+        expired = [(hour, self._buckets.pop(hour)) for hour in hours if hour in self._buckets]
+        self.first_hour = first_hour
+        return expired
@@ -0,0 +1,143 @@
+"""
+Leaderboard - PSI rankings and risk-level counts kept in memory.
+
+Every country sits in four lists sorted by (-psi_score, country_id): the
+global ranking, its region's, its risk level's, and its region-and-level
+list. A recompute moves only the countries it changed (a bisect and a list
+delete/insert per list), so ?region= and ?level= boards are a slice of one
+list and a risk-level count is a list length; no request touches psi_scores.
+
+The leader applies psi_recomputed rows synchronously, before DATA_COMMITTED
+bumps the response cache; followers apply the leader's /live messages. Rows
+are keyed by country, so PSI history can never rank a country twice.
+"""
+import threading
+from bisect import bisect_left, insort
+from typing import Iterable, NamedTuple, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.psi_engine import RISK_LEVEL_NAMES
+from app.services.queries import latest_psi_by_country
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 100
+
+# (region, risk_level); None matches any
+_Board = tuple[Optional[str], Optional[str]]
+# (-psi_score, country_id): ascending order is the ranking, ties by id
+_Key = tuple[float, int]
+
+
+class CountryInfo(NamedTuple):
+    name: str
+    iso_code: str
+    region: str
+
+
+def _boards(region: str, risk_level: str) -> tuple[_Board, ...]:
+    return (None, None), (region, None), (None, risk_level), (region, risk_level)
+
+
+class Leaderboard:
+    """Sorted PSI boards per region and risk level, updated per changed country."""
+
+    def __init__(self):
+        self._countries: dict[int, CountryInfo] = {}
+        self._scores: dict[int, tuple[float, str]] = {}  # country_id -> (psi_score, risk_level)
+        self._boards: dict[_Board, list[_Key]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def rebuild(self, db: Session) -> None:
+        """Load every country and its latest stored PSI."""
+        latest = latest_psi_by_country(db)
+        with self._lock:
+            self._countries = {c.id: CountryInfo(c.name, c.iso_code, c.region) for c, _ in latest}
+            self._reset(
+                (c.id, psi.psi_score if psi else 0.0, psi.risk_level if psi else "Stable")
+                for c, psi in latest
+            )
+
+    def rescored(self, scores: dict[int, tuple]) -> "Leaderboard":
+        """A separate board over the same countries with (psi_score, risk_level, ...) per country."""
+        board = Leaderboard()
+        with self._lock:
+            board._countries = self._countries
+        board._reset((cid, s[0], s[1]) for cid, s in scores.items())
+        return board
+
+    def apply(self, message: dict) -> None:
+        """Adopt a /live psi_update message (a snapshot replaces every score)."""
+        rows = ((d["country_id"], d["psi_score"], d["risk_level"]) for d in message["data"])
+        with self._lock:
+            if message["snapshot"]:
+                self._reset(rows)
+            else:
+                self._update(rows)
+
+    def on_psi_recomputed(self, event: dict) -> None:
+        """Bus handler: move the countries a recompute changed."""
+        with self._lock:
+            self._update((r["country_id"], r["psi_score"], r["risk_level"]) for r in event["rows"])
+
+    def top(
+        self, limit: int = DEFAULT_LIMIT, region: Optional[str] = None, risk_level: Optional[str] = None
+    ) -> list[tuple]:
+        """
+        The `limit` highest-PSI countries, optionally within one region and/or
+        risk level, as LeaderboardEntry rows ranked from 1.
+        """
+        with self._lock:
+            keys = self._boards.get((region, risk_level), [])[:limit]
+            return [
+                (rank, cid, *self._countries[cid][:2], -neg_psi, self._scores[cid][1])
+                for rank, (neg_psi, cid) in enumerate(keys, 1)
+            ]
+
+    def counts(self, region: Optional[str] = None, levels: Sequence[str] = RISK_LEVEL_NAMES) -> dict[str, int]:
+        """Countries per risk level (every one of `levels`, then any others seen), optionally in one region."""
+        with self._lock:
+            counts = {level: len(self._boards.get((region, level), ())) for level in levels}
+            for board_region, level in self._boards:
+                if board_region == region and level is not None and level not in counts:
+                    counts[level] = len(self._boards[(board_region, level)])
+            return counts
+
+    def _reset(self, rows: Iterable[tuple[int, float, str]]) -> None:
+        self._scores.clear()
+        self._boards = {}
+        for country_id, psi_score, risk_level in rows:
+            if country_id not in self._countries:
+                continue
+            self._scores[country_id] = (psi_score, risk_level)
+            key = (-psi_score, country_id)
+            for board in _boards(self._countries[country_id].region, risk_level):
+                self._boards.setdefault(board, []).append(key)
+        for keys in self._boards.values():
+            keys.sort()
+
+    def _update(self, rows: Iterable[tuple[int, float, str]]) -> None:
+        for country_id, psi_score, risk_level in rows:
+            info = self._countries.get(country_id)
+            if info is None:
+                continue  # not a country this process loaded
+            prev = self._scores.get(country_id)
+            if prev == (psi_score, risk_level):
+                continue
+            if prev is not None:
+                key = (-prev[0], country_id)
+                for board in _boards(info.region, prev[1]):
+                    keys = self._boards[board]
+                    del keys[bisect_left(keys, key)]
+                    if not keys:
+                        del self._boards[board]
+            self._scores[country_id] = (psi_score, risk_level)
+            key = (-psi_score, country_id)
+            for board in _boards(info.region, risk_level):
+                insort(self._boards.setdefault(board, []), key)
+
+
+leaderboard = Leaderboard()
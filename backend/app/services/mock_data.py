@@ -15,8 +15,8 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 
-from app.models import Country, Election, ProtestEvent, SentimentScore, MarketIndicator, PSIScore
-from app.psi_engine import calculate_psi, calculate_escalation_probability, RISK_LEVELS
+from app.models import Country, Election, ProtestEvent, SentimentScore, MarketIndicator
+from app.services.dirty import recompute_dirty
 
 
 # Election types with weights
@@ -107,7 +107,6 @@ def generate_election(db: Session, country: Country) -> Optional[Election]:
         country_id=country.id,
         date=election_date,
         type=election_type,
-        days_remaining=days_ahead,
     )
     db.add(election)
     return election
@@ -158,85 +157,8 @@ def generate_market_indicator(db: Session, country: Country) -> MarketIndicator:
 
 
 def update_psi_scores(db: Session) -> None:
-    """Recalculate and update all PSI scores."""
-    countries = db.query(Country).all()
-    for country in countries:
-        # Get latest election (closest upcoming)
-        election = (
-            db.query(Election)
-            .filter(Election.country_id == country.id, Election.days_remaining > 0)
-            .order_by(Election.days_remaining)
-            .first()
-        )
-        election_days = election.days_remaining if election else None
-
-        # Aggregate protests
-        protests = db.query(ProtestEvent).filter(
-            ProtestEvent.country_id == country.id,
-            ProtestEvent.date >= datetime.utcnow() - timedelta(days=30),
-        ).all()
-        protest_severity = sum(p.severity_score for p in protests) / max(len(protests), 1)
-        protest_count = len(protests)
-
-        # Latest sentiment
-        sentiment = (
-            db.query(SentimentScore)
-            .filter(SentimentScore.country_id == country.id)
-            .order_by(SentimentScore.timestamp.desc())
-            .first()
-        )
-        sentiment_score = sentiment.score if sentiment else 0.0
-        sentiment_vol = sentiment.volatility_index if sentiment else 0.5
-
-        # Latest market
-        market = (
-            db.query(MarketIndicator)
-            .filter(MarketIndicator.country_id == country.id)
-            .order_by(MarketIndicator.timestamp.desc())
-            .first()
-        )
-        currency_vol = market.currency_volatility if market else 1.0
-
-        # News negativity (simulated)
-        news_negativity = random.uniform(0.1, 0.6)
-
-        psi, risk_level = calculate_psi(
-            election_days_remaining=election_days,
-            protest_severity=protest_severity,
-            protest_count=protest_count,
-            sentiment_score=sentiment_score,
-            sentiment_volatility=sentiment_vol,
-            currency_volatility=currency_vol,
-            news_negativity=news_negativity,
-        )
-
-        escalation = calculate_escalation_probability(
-            psi_trend_slope=random.uniform(0, 0.5),
-            event_clustering=min(protest_count / 5, 1.0),
-            volatility_spike=min(currency_vol / 5, 1.0),
-        )
-
-        # Upsert PSI score
-        existing = (
-            db.query(PSIScore)
-            .filter(PSIScore.country_id == country.id)
-            .first()
-        )
-        if existing:
-            existing.psi_score = psi
-            existing.risk_level = risk_level
-            existing.escalation_probability = escalation
-            existing.updated_at = datetime.utcnow()
-        else:
-            psi_record = PSIScore(
-                country_id=country.id,
-                psi_score=psi,
-                risk_level=risk_level,
-                escalation_probability=escalation,
-            )
-            db.add(psi_record)
-
-    db.commit()
+    """Rescore countries whose inputs changed, then publish the rows that moved."""
+    recompute_dirty(db)
 
 
 def run_mock_cycle(db: Session) -> None:
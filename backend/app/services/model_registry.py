@@ -0,0 +1,135 @@
+"""
+Model Registry - versioned PSI model configurations, hot-reloaded from disk.
+
+Each PSI_MODELS_DIR/*.json file defines one what-if version:
+
+    {
+      "version": "protest-heavy",
+      "weights": {"election": 0.15, "protest": 0.35, "sentiment": 0.2, "currency": 0.15, "news": 0.15},
+      "risk_levels": [[0, 30, "Stable"], [31, 50, "Moderate"], ...],
+      "transforms": {"election_horizon_days": 365, "currency_scale": 25}
+    }
+
+Omitted fields keep the psi_engine defaults, and "version" defaults to the
+file name. Every version is validated and compiled into a scoring closure
+once, when its file changes; a file that fails to load keeps its previous
+version. The built-in "default" model is always available.
+"""
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+from app.psi_engine import DEFAULT_MODEL, PSIModel, PSIScorer, compile_model
+
+PSI_MODELS_DIR = Path(os.getenv("PSI_MODELS_DIR", Path(__file__).resolve().parents[2] / "psi_models"))
+RELOAD_INTERVAL = float(os.getenv("PSI_MODELS_RELOAD_SECONDS", "5"))
+
+_WEIGHT_FIELDS = {
+    "election": "election_weight",
+    "protest": "protest_weight",
+    "sentiment": "sentiment_weight",
+    "currency": "currency_weight",
+    "news": "news_weight",
+}
+_TRANSFORM_FIELDS = ("election_horizon_days", "protest_severity_scale", "protest_count_bonus", "currency_scale")
+
+
+class CompiledModel(NamedTuple):
+    model: PSIModel
+    score: PSIScorer
+    fingerprint: str  # changes whenever the configuration does
+
+
+def compile_entry(model: PSIModel) -> CompiledModel:
+    model.validate()
+    digest = hashlib.blake2b(json.dumps(asdict(model), sort_keys=True).encode(), digest_size=8).hexdigest()
+    return CompiledModel(model, compile_model(model), digest)
+
+
+def parse_model(config: dict, default_version: str) -> PSIModel:
+    """PSIModel from a JSON configuration; raises ValueError on unknown or malformed fields."""
+    fields: dict = {"version": str(config.get("version", default_version))}
+    for name, weight in config.get("weights", {}).items():
+        if name not in _WEIGHT_FIELDS:
+            raise ValueError(f"unknown weight {name!r}")
+        fields[_WEIGHT_FIELDS[name]] = float(weight)
+    for name, value in config.get("transforms", {}).items():
+        if name not in _TRANSFORM_FIELDS:
+            raise ValueError(f"unknown transform {name!r}")
+        fields[name] = float(value)
+    if "risk_levels" in config:
+        fields["risk_levels"] = tuple((float(low), float(high), str(level)) for low, high, level in config["risk_levels"])
+    unknown = set(config) - {"version", "weights", "transforms", "risk_levels"}
+    if unknown:
+        raise ValueError(f"unknown keys {sorted(unknown)}")
+    return PSIModel(**fields)
+
+
+def describe_model(model: PSIModel) -> dict:
+    """The JSON configuration form of a model (inverse of parse_model)."""
+    return {
+        "version": model.version,
+        "weights": {name: getattr(model, attr) for name, attr in _WEIGHT_FIELDS.items()},
+        "risk_levels": [list(band) for band in model.risk_levels],
+        "transforms": {name: getattr(model, name) for name in _TRANSFORM_FIELDS},
+    }
+
+
+class ModelRegistry:
+    """Compiled PSI models by version, reloaded when their files change."""
+
+    def __init__(self, directory: Path = PSI_MODELS_DIR, reload_interval: float = RELOAD_INTERVAL):
+        self.directory = Path(directory)
+        self.reload_interval = reload_interval
+        self._default = compile_entry(DEFAULT_MODEL)
+        self._models: dict[str, CompiledModel] = {DEFAULT_MODEL.version: self._default}
+        self._files: dict[Path, tuple[float, Optional[CompiledModel]]] = {}  # path -> (mtime, loaded model)
+        self._lock = threading.Lock()
+
+    def get(self, version: Optional[str] = None) -> CompiledModel:
+        """The compiled model for version (default when None); raises KeyError if unknown."""
+        if version is None:
+            return self._default
+        with self._lock:
+            return self._models[version]
+
+    def versions(self) -> list[PSIModel]:
+        with self._lock:
+            return [entry.model for entry in self._models.values()]
+
+    def reload(self, log: Callable[[str], None] = print) -> bool:
+        """Re-read changed, added or removed model files. Returns True if anything changed."""
+        try:
+            paths = {p: p.stat().st_mtime for p in self.directory.glob("*.json")}
+        except OSError:
+            paths = {}
+        if {p: mtime for p, (mtime, _) in self._files.items()} == paths:
+            return False
+        files = {}
+        for path, mtime in sorted(paths.items()):
+            previous = self._files.get(path)
+            if previous is not None and previous[0] == mtime:
+                files[path] = previous
+                continue
+            try:
+                entry = compile_entry(parse_model(json.loads(path.read_text()), path.stem))
+                log(f"Loaded PSI model {entry.model.version!r} from {path.name}")
+            except (OSError, ValueError, TypeError) as e:
+                entry = previous[1] if previous else None
+                log(f"PSI model {path.name} not loaded: {e}")
+            files[path] = (mtime, entry)
+        models = {DEFAULT_MODEL.version: self._default}
+        for _, entry in files.values():
+            if entry is not None and entry.model.version not in models:
+                models[entry.model.version] = entry
+        with self._lock:
+            self._files = files
+            self._models = models
+        return True
+
+
+model_registry = ModelRegistry()
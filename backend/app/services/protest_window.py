@@ -0,0 +1,126 @@
+"""
+Protest Window - rolling PSI-window protest aggregates per country.
+
+In-window events are kept as hourly buckets (severity sum and event count per
+country), with running totals per country, so an arriving event is one bucket
+update and expiry drops whole buckets as the window slides. The window edge
+is rounded down to the hour. New events are picked up by protests id
+high-water mark (a primary-key range scan), whichever path wrote them, and
+the window is rebuilt at startup from per-hour sums over the covering
+protest index. A sync inside the recompute transaction sees that
+transaction's own rows; if it rolls back, the recompute invalidates the
+window so the next sync rebuilds it from committed rows.
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Collection, NamedTuple, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import ProtestEvent
+from app.services.hour_buckets import EPOCH, HOUR, HourBuckets, hour_of
+
+PROTEST_WINDOW_DAYS = 30
+# Window event count at which event_clustering saturates at 1.0
+CLUSTER_SATURATION = 5
+
+def window_start(now: datetime) -> datetime:
+    """Start of the protest window at `now` (bucket aligned)."""
+    return EPOCH + hour_of(now - timedelta(days=PROTEST_WINDOW_DAYS)) * HOUR
+
+
+class ProtestStats(NamedTuple):
+    severity_sum: float
+    count: int
+
+    @property
+    def mean_severity(self) -> float:
+        return self.severity_sum / max(self.count, 1)
+
+    @property
+    def event_clustering(self) -> float:
+        """0-1 input to calculate_escalation_probability."""
+        return min(self.count / CLUSTER_SATURATION, 1.0)
+
+
+NO_PROTESTS = ProtestStats(0.0, 0)
+
+
+class ProtestWindow:
+    """Running protest sums and counts per country over the last PROTEST_WINDOW_DAYS."""
+
+    def __init__(self):
+        self._high_water: Optional[int] = None
+        self._window = HourBuckets()  # hour -> country_id -> [sum, count]
+        self._totals: dict[int, list] = {}  # country_id -> [sum, count]
+        self._lock = threading.Lock()
+
+    def rebuild(self, db: Session, now: datetime) -> None:
+        """Reload the window from the database."""
+        start = window_start(now)
+        high_water = db.query(func.max(ProtestEvent.id)).scalar() or 0
+        # Summed per (country, hour) in SQL: 'YYYY-MM-DD HH' prefixes of the stored dates
+        hour = func.substr(ProtestEvent.date, 1, 13)
+        rows = (
+            db.query(ProtestEvent.country_id, hour, func.sum(ProtestEvent.severity_score), func.count())
+            .filter(ProtestEvent.date >= start, ProtestEvent.id <= high_water)
+            .group_by(ProtestEvent.country_id, hour)
+        )
+        with self._lock:
+            self._window.reset(hour_of(start))
+            self._totals.clear()
+            for cid, prefix, severity, count in rows:
+                self._add(cid, hour_of(datetime.fromisoformat(prefix + ":00")), severity, count)
+            self._high_water = high_water
+
+    def sync(self, db: Session, now: datetime) -> None:
+        """Add protests written since the last sync, then expire buckets older than the window."""
+        if self._high_water is None or not self._window.covers(hour_of(window_start(now))):
+            self.rebuild(db, now)
+            return
+        rows = (
+            db.query(ProtestEvent.id, ProtestEvent.country_id, ProtestEvent.date, ProtestEvent.severity_score)
+            .filter(ProtestEvent.id > self._high_water)
+            .all()
+        )
+        with self._lock:
+            for pid, cid, when, severity in rows:
+                self._add(cid, hour_of(when), severity)
+                self._high_water = max(self._high_water, pid)
+            self._advance(hour_of(window_start(now)))
+
+    def invalidate(self) -> None:
+        """Rebuild on the next sync: a sync picked up rows that were rolled back."""
+        with self._lock:
+            self._high_water = None
+
+    def stats(self, country_ids: Optional[Collection[int]] = None) -> dict[int, ProtestStats]:
+        """Window totals per country with at least one event, keyed by country_id."""
+        with self._lock:
+            if country_ids is None:
+                return {cid: ProtestStats(*t) for cid, t in self._totals.items()}
+            return {cid: ProtestStats(*self._totals[cid]) for cid in country_ids if cid in self._totals}
+
+    def _add(self, country_id: int, hour: int, severity: float, count: int = 1) -> None:
+        bucket = self._window.bucket(hour, country_id, lambda: [0.0, 0])
+        if bucket is None:
+            return
+        bucket[0] += severity
+        bucket[1] += count
+        total = self._totals.setdefault(country_id, [0.0, 0])
+        total[0] += severity
+        total[1] += count
+
+    def _advance(self, first_hour: int) -> None:
+        for _, expired in self._window.expire(first_hour):
+            for cid, (severity, count) in expired.items():
+                total = self._totals[cid]
+                total[1] -= count
+                if total[1]:
+                    total[0] -= severity
+                else:
+                    del self._totals[cid]  # also drops accumulated float error
+
+
+protest_window = ProtestWindow()
@@ -0,0 +1,213 @@
+"""
+Batch PSI Recompute - set-based replacement for the per-country query loop.
+
+All model inputs are fetched in a handful of grouped queries, every country
+is scored in one pass over columnar inputs, and PSIScore rows are written
+with a single executemany UPDATE plus one INSERT for countries without a row.
+History and daily rollups are written in the same transaction.
+"""
+import random
+import threading
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Collection, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from app.models import Country, SentimentScore, MarketIndicator, PSIScore
+from app.psi_engine import calculate_escalation_probability_batch
+from app.services.elections import election_calendar
+from app.services.events import bus, PSI_RECOMPUTED, DATA_COMMITTED
+from app.services.model_registry import CompiledModel, model_registry
+from app.services.protest_window import NO_PROTESTS, protest_window
+from app.services.psi_history import record_psi_history
+from app.services.queries import latest_per_country
+from app.services.trends import trend_engine
+
+# Defaults used when a country has no row in an input table
+DEFAULT_SENTIMENT_SCORE = 0.0
+DEFAULT_SENTIMENT_VOLATILITY = 0.5
+DEFAULT_CURRENCY_VOLATILITY = 1.0
+
+
+@dataclass
+class PSIInputs:
+    """Columnar PSI model inputs, one position per country."""
+    country_ids: list[int] = field(default_factory=list)
+    election_days: list[Optional[int]] = field(default_factory=list)
+    protest_severity: list[float] = field(default_factory=list)
+    protest_count: list[int] = field(default_factory=list)
+    event_clustering: list[float] = field(default_factory=list)
+    trend_slope: list[float] = field(default_factory=list)
+    volatility_spike: list[float] = field(default_factory=list)
+    sentiment_score: list[float] = field(default_factory=list)
+    sentiment_volatility: list[float] = field(default_factory=list)
+    currency_volatility: list[float] = field(default_factory=list)
+    news_negativity: list[float] = field(default_factory=list)
+
+
+class InputSnapshot:
+    """Latest model inputs per country, so other model versions can rescore without queries."""
+
+    def __init__(self):
+        self._rows: dict[int, tuple] = {}
+        self._lock = threading.Lock()
+
+    def update(self, inputs: PSIInputs) -> None:
+        columns = [getattr(inputs, f.name) for f in fields(PSIInputs)]
+        with self._lock:
+            for row in zip(*columns):
+                self._rows[row[0]] = row
+
+    def rows(self) -> list[tuple]:
+        """Per-country input rows (PSIInputs field order), for another process to replace()."""
+        with self._lock:
+            return list(self._rows.values())
+
+    def replace(self, rows: list) -> None:
+        with self._lock:
+            self._rows = {row[0]: tuple(row) for row in rows}
+
+    def inputs(self) -> PSIInputs:
+        """Every country's latest inputs as columns, ordered by country_id."""
+        with self._lock:
+            rows = [self._rows[cid] for cid in sorted(self._rows)]
+        return PSIInputs(*(list(column) for column in zip(*rows))) if rows else PSIInputs()
+
+
+input_snapshot = InputSnapshot()
+
+
+def load_psi_inputs(db: Session, now: datetime, country_ids: Optional[Collection[int]] = None) -> PSIInputs:
+    """
+    Fetch every country's model inputs (or only `country_ids`) in four
+    queries plus the protest and trend windows, whatever the history size.
+    Elections are read uncached, so this transaction's own rows count.
+    """
+    query = db.query(Country.id)
+    if country_ids is not None:
+        query = query.filter(Country.id.in_(country_ids))
+    ids = [cid for (cid,) in query.order_by(Country.id)]
+    protest_window.sync(db, now)
+    protests = protest_window.stats(ids)
+    trend_engine.sync(db, now)
+    sentiment = latest_per_country(db, SentimentScore, SentimentScore.timestamp, country_ids)
+    market = latest_per_country(db, MarketIndicator, MarketIndicator.timestamp, country_ids)
+    elections = election_calendar.next_by_country(db, now.date(), cached=False)
+
+    inputs = PSIInputs()
+    for cid in ids:
+        s = sentiment.get(cid)
+        mk = market.get(cid)
+        e = elections.get(cid)
+        p = protests.get(cid, NO_PROTESTS)
+        inputs.country_ids.append(cid)
+        inputs.election_days.append(e.days_remaining if e else None)
+        inputs.protest_severity.append(p.mean_severity)
+        inputs.protest_count.append(p.count)
+        inputs.event_clustering.append(p.event_clustering)
+        inputs.sentiment_score.append(s.score if s else DEFAULT_SENTIMENT_SCORE)
+        inputs.sentiment_volatility.append(s.volatility_index if s else DEFAULT_SENTIMENT_VOLATILITY)
+        currency_volatility = mk.currency_volatility if mk else DEFAULT_CURRENCY_VOLATILITY
+        inputs.currency_volatility.append(currency_volatility)
+        inputs.trend_slope.append(trend_engine.trend_slope(cid))
+        inputs.volatility_spike.append(trend_engine.volatility_spike(cid, currency_volatility))
+        # News negativity is simulated until a real feed exists
+        inputs.news_negativity.append(random.uniform(0.1, 0.6))
+    return inputs
+
+
+def score_inputs(inputs: PSIInputs, model: Optional[CompiledModel] = None) -> list[tuple[float, str, float]]:
+    """
+    Score every country in one vectorized pass with `model` (the default
+    model when None); returns (psi_score, risk_level, escalation).
+    """
+    model = model or model_registry.get()
+    psi, codes = model.score(
+        election_days_remaining=inputs.election_days,
+        protest_severity=inputs.protest_severity,
+        protest_count=inputs.protest_count,
+        sentiment_score=inputs.sentiment_score,
+        sentiment_volatility=inputs.sentiment_volatility,
+        currency_volatility=inputs.currency_volatility,
+        news_negativity=inputs.news_negativity,
+    )
+    escalation = calculate_escalation_probability_batch(
+        psi_trend_slope=inputs.trend_slope,
+        event_clustering=inputs.event_clustering,
+        volatility_spike=inputs.volatility_spike,
+    )
+    names = model.model.risk_level_names
+    return [
+        (p, names[c], e)
+        for p, c, e in zip(psi.tolist(), codes.tolist(), escalation.tolist())
+    ]
+
+
+def recompute_psi(
+    db: Session, now: Optional[datetime] = None, country_ids: Optional[Collection[int]] = None
+) -> list[dict]:
+    """
+    Recompute and store PSI for every country (or only `country_ids`), then
+    publish the rows that moved. Returns the changed rows (the psi_recomputed
+    event payload).
+    """
+    now = now or datetime.utcnow()
+    if country_ids is not None:
+        country_ids = sorted(country_ids)
+    try:
+        inputs, changed = _store_psi(db, now, country_ids)
+    except BaseException:
+        # The windows may hold rows this transaction wrote (synced above
+        # their watermarks); rebuild them from what actually committed
+        protest_window.invalidate()
+        trend_engine.invalidate()
+        raise
+    trend_engine.record_psi(now, changed)
+    input_snapshot.update(inputs)
+    if changed:
+        bus.publish(PSI_RECOMPUTED, {"timestamp": now.isoformat(), "rows": changed})
+    bus.publish(DATA_COMMITTED, {"timestamp": now.isoformat()})
+    return changed
+
+
+def _store_psi(
+    db: Session, now: datetime, country_ids: Optional[list[int]]
+) -> tuple[PSIInputs, list[dict]]:
+    """Score and write PSI in one transaction; returns the inputs and the changed rows."""
+    inputs = load_psi_inputs(db, now, country_ids)
+    scores = score_inputs(inputs)
+    existing = latest_per_country(db, PSIScore, PSIScore.updated_at, country_ids)
+
+    scored, updates, inserts, changed = [], [], [], []
+    for cid, (psi, risk_level, escalation) in zip(inputs.country_ids, scores):
+        row = {
+            "country_id": cid,
+            "psi_score": psi,
+            "risk_level": risk_level,
+            "escalation_probability": escalation,
+            "updated_at": now,
+        }
+        scored.append(row)
+        prev = existing.get(cid)
+        if prev is not None:
+            updates.append({"id": prev.id, **row})
+        else:
+            inserts.append(row)
+        if prev is None or (prev.psi_score, prev.risk_level, prev.escalation_probability) != (psi, risk_level, escalation):
+            changed.append({
+                "country_id": cid,
+                "psi_score": psi,
+                "risk_level": risk_level,
+                "escalation_probability": escalation,
+                "previous_psi_score": prev.psi_score if prev else None,
+            })
+
+    if updates:
+        db.execute(update(PSIScore), updates)
+    if inserts:
+        db.execute(insert(PSIScore), inserts)
+    record_psi_history(db, now, scored, changed)
+    db.commit()
+    return inputs, changed
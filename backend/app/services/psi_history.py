@@ -0,0 +1,91 @@
+"""
+PSI History - append-only change log plus daily rollups for Timeline Replay.
+
+Each recompute appends one psi_history row per country whose score moved
+(compacted into psi_rollups by the retention job) and folds every scored
+country into its psi_daily_rollups row for the day (min/max/sum/samples/
+last) with a single executemany upsert. Rollups are clustered on (day,
+country_id), so /timeline is one ordered range scan.
+"""
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import PSIHistory, PSIDailyRollup
+
+
+def record_psi_history(db: Session, now: datetime, scored: list[dict], changed: list[dict]) -> None:
+    """
+    Append changed rows to psi_history and upsert today's rollups for all scored rows.
+    `scored` rows carry country_id, psi_score, risk_level; the caller commits.
+    """
+    if changed:
+        db.execute(
+            insert(PSIHistory),
+            [
+                {
+                    "country_id": r["country_id"],
+                    "psi_score": r["psi_score"],
+                    "risk_level": r["risk_level"],
+                    "escalation_probability": r["escalation_probability"],
+                    "recorded_at": now,
+                }
+                for r in changed
+            ],
+        )
+    if not scored:
+        return
+    stmt = sqlite_insert(PSIDailyRollup)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PSIDailyRollup.day, PSIDailyRollup.country_id],
+        set_={
+            "psi_min": func.min(PSIDailyRollup.psi_min, stmt.excluded.psi_min),
+            "psi_max": func.max(PSIDailyRollup.psi_max, stmt.excluded.psi_max),
+            "psi_sum": PSIDailyRollup.psi_sum + stmt.excluded.psi_sum,
+            "samples": PSIDailyRollup.samples + 1,
+            "psi_last": stmt.excluded.psi_last,
+            "risk_level_last": stmt.excluded.risk_level_last,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    day = now.date().isoformat()
+    db.execute(
+        stmt,
+        [
+            {
+                "country_id": r["country_id"],
+                "day": day,
+                "psi_min": r["psi_score"],
+                "psi_max": r["psi_score"],
+                "psi_sum": r["psi_score"],
+                "samples": 1,
+                "psi_last": r["psi_score"],
+                "risk_level_last": r["risk_level"],
+                "updated_at": now,
+            }
+            for r in scored
+        ],
+    )
+
+
+def load_timeline(db: Session, days: int, today: date) -> list[tuple]:
+    """
+    Daily rollups for the last `days` days (including today), ordered by day
+    then country. Rows: (day, country_id, psi_last, risk_level_last, psi_min, psi_max, psi_mean).
+    """
+    start = (today - timedelta(days=days - 1)).isoformat()
+    return db.execute(
+        select(
+            PSIDailyRollup.day,
+            PSIDailyRollup.country_id,
+            PSIDailyRollup.psi_last,
+            PSIDailyRollup.risk_level_last,
+            PSIDailyRollup.psi_min,
+            PSIDailyRollup.psi_max,
+            PSIDailyRollup.psi_sum / PSIDailyRollup.samples,
+        )
+        .where(PSIDailyRollup.day >= start)
+        .order_by(PSIDailyRollup.day, PSIDailyRollup.country_id)
+    ).all()
@@ -0,0 +1,109 @@
+"""
+PSI Stream - delta protocol for the /live WebSocket.
+
+Keeps the last published PSI snapshot and emits only the countries whose
+psi_score, risk_level or escalation_probability changed. Every message
+carries a monotonically increasing `seq` and the stream's `epoch`, a random
+id minted when the stream starts (seq restarts at 1 with a new process). A
+reconnecting client passes its last seq and epoch and receives the missed
+deltas from a bounded ring buffer merged into one delta (latest state per
+country), or a full snapshot when the epoch differs or it has fallen too
+far behind. Follower workers apply the leader's messages instead of
+diffing, so seq and epoch are the same in every worker.
+"""
+import secrets
+from collections import deque
+from typing import Optional
+
+RESYNC_BUFFER_SIZE = 64  # deltas kept for reconnecting clients
+
+# (psi_score, risk_level, escalation_probability, timestamp)
+PSIState = tuple[float, str, float, str]
+
+
+class PSIStream:
+    """Sequenced PSI diffs with a ring buffer for resync."""
+
+    def __init__(self, buffer_size: int = RESYNC_BUFFER_SIZE):
+        self.seq = 0
+        self.epoch = secrets.token_hex(8)
+        self.last: dict[int, PSIState] = {}
+        self.history: deque[dict] = deque(maxlen=buffer_size)
+        # Wire form of each country's state, built once per change and shared
+        # by every message that carries it
+        self._entries: dict[int, dict] = {}
+        self._snapshot: Optional[dict] = None
+
+    def update(self, rows: list[tuple[int, float, str, float]], timestamp: str) -> Optional[dict]:
+        """
+        Diff (country_id, psi_score, risk_level, escalation_probability) rows
+        against the last snapshot. Returns a delta message, or None if nothing moved.
+        """
+        changed = []
+        for country_id, psi_score, risk_level, escalation in rows:
+            prev = self.last.get(country_id)
+            if prev is not None and prev[:3] == (psi_score, risk_level, escalation):
+                continue
+            self.last[country_id] = (psi_score, risk_level, escalation, timestamp)
+            self._entries[country_id] = {
+                "country_id": country_id,
+                "psi_score": psi_score,
+                "risk_level": risk_level,
+                "escalation_probability": escalation,
+                "timestamp": timestamp,
+            }
+            changed.append(country_id)
+        if not changed:
+            return None
+        self.seq += 1
+        self._snapshot = None
+        message = self._message(changed, snapshot=False)
+        self.history.append(message)
+        return message
+
+    def apply(self, message: dict) -> None:
+        """Adopt a message published by another process's stream, seq included."""
+        if message["snapshot"]:
+            self.epoch = message["epoch"]
+            self.last.clear()
+            self._entries.clear()
+            self.history.clear()  # buffered deltas were numbered by a different stream
+        for d in message["data"]:
+            self.last[d["country_id"]] = (d["psi_score"], d["risk_level"], d["escalation_probability"], d["timestamp"])
+            self._entries[d["country_id"]] = d
+        if not message["snapshot"]:
+            self.history.append(message)
+        self.seq = message["seq"]
+        self._snapshot = None
+
+    def snapshot(self) -> dict:
+        """Full state at the current seq (built once per change)."""
+        if self._snapshot is None:
+            self._snapshot = self._message(list(self.last), snapshot=True)
+        return self._snapshot
+
+    def resume(self, since: Optional[int], epoch: Optional[str] = None) -> list[dict]:
+        """
+        What a client at (`since`, `epoch`) needs to catch up to the current
+        seq: nothing, one merged delta, or a snapshot. Never more than one
+        message, so the catch-up always fits a subscriber's send queue.
+        """
+        if since is None or epoch != self.epoch or since > self.seq:
+            return [self.snapshot()]
+        if since == self.seq:
+            return []
+        if self.history and self.history[0]["seq"] <= since + 1:
+            changed = dict.fromkeys(
+                d["country_id"] for m in self.history if m["seq"] > since for d in m["data"]
+            )
+            return [self._message(list(changed), snapshot=False)]
+        return [self.snapshot()]
+
+    def _message(self, country_ids: list[int], snapshot: bool) -> dict:
+        return {
+            "type": "psi_update",
+            "seq": self.seq,
+            "epoch": self.epoch,
+            "snapshot": snapshot,
+            "data": [self._entries[cid] for cid in country_ids],
+        }
@@ -0,0 +1,74 @@
+"""Shared read queries for the dashboard endpoints and the recompute path."""
+from typing import Any, Collection, Optional, Sequence
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.orm import Session
+
+from app.models import Country, PSIScore
+
+
+def latest_id_per_country(model: Any, time_column: Any):
+    """
+    Correlated scalar subquery: id of the newest `model` row for Country.id.
+    Each lookup is one seek on the (country_id, time) index, so cost grows
+    with the number of countries, not with the length of the history.
+    """
+    return (
+        select(model.id)
+        .where(model.country_id == Country.id)
+        .order_by(time_column.desc(), model.id.desc())
+        .limit(1)
+        .correlate(Country)
+        .scalar_subquery()
+    )
+
+
+def latest_per_country(
+    db: Session, model: Any, time_column: Any, country_ids: Optional[Collection[int]] = None
+) -> dict[int, Any]:
+    """Most recent `model` row per country by `time_column`, keyed by country_id."""
+    latest_ids = select(latest_id_per_country(model, time_column)).select_from(Country)
+    if country_ids is not None:
+        latest_ids = latest_ids.where(Country.id.in_(country_ids))
+    return {row.country_id: row for row in db.query(model).filter(model.id.in_(latest_ids))}
+
+
+def latest_rows_per_country(
+    db: Session, columns: Sequence[Any], model: Any, time_column: Any, country_ids: Optional[Collection[int]] = None
+) -> dict[int, Any]:
+    """Like latest_per_country, but only `columns` (which must include model.country_id), as rows."""
+    latest_ids = select(latest_id_per_country(model, time_column)).select_from(Country)
+    if country_ids is not None:
+        latest_ids = latest_ids.where(Country.id.in_(country_ids))
+    return {row.country_id: row for row in db.execute(select(*columns).where(model.id.in_(latest_ids)))}
+
+
+def latest_psi_by_country(db: Session) -> list[tuple[Country, Optional[PSIScore]]]:
+    """Every country paired with its most recent PSIScore (or None), in one query."""
+    return (
+        db.query(Country, PSIScore)
+        .outerjoin(PSIScore, PSIScore.id == latest_id_per_country(PSIScore, PSIScore.updated_at))
+        .order_by(Country.id)
+        .all()
+    )
+
+
+def country_psi_rows(db: Session) -> list[tuple]:
+    """
+    (name, iso_code, region, latitude, longitude, id, psi_score, risk_level)
+    per country, in CountryWithPSI field order, without loading ORM objects.
+    """
+    return db.execute(
+        select(
+            Country.name,
+            Country.iso_code,
+            Country.region,
+            Country.latitude,
+            Country.longitude,
+            Country.id,
+            func.coalesce(PSIScore.psi_score, literal(0.0)),
+            func.coalesce(PSIScore.risk_level, literal("Stable")),
+        )
+        .outerjoin(PSIScore, PSIScore.id == latest_id_per_country(PSIScore, PSIScore.updated_at))
+        .order_by(Country.id)
+    ).all()
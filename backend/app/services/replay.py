@@ -0,0 +1,354 @@
+"""
+Replay - backtest the PSI model over stored history into scenario_psi.
+
+Each country is replayed on its own. Its protest, sentiment and market
+samples (raw rows merged with the retention rollups that replaced older
+ones) and its elections are streamed in time order through generators, so
+memory is bounded by the model windows rather than the history. The model
+state - protest window, latest sentiment, market z-score window, PSI trend -
+advances to each step, PSI is scored for all steps in one vectorized call,
+and the rows are written under the scenario name. Countries are spread over
+a process pool; the parent process is the only writer.
+
+Any PSIModel version can be replayed, so weightings can be compared on the
+same history. News negativity has no stored feed, so a replay uses its live mean
+(NEWS_NEGATIVITY_BASELINE) to keep scenarios deterministic and comparable.
+"""
+import heapq
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, Optional
+
+from sqlalchemy import Connection, Engine, case, delete, func, literal, select
+from sqlalchemy.orm import Session
+
+from app.database import SQLALCHEMY_DATABASE_URL, create_sqlite_engine
+from app.models import Country, Election, ScenarioPSI
+from app.psi_engine import DEFAULT_MODEL, PSIModel, PSIScorer, calculate_escalation_probability_batch, compile_model
+from app.services.elections import days_until, first_upcoming
+from app.services.protest_window import PROTEST_WINDOW_DAYS, ProtestStats, window_start
+from app.services.psi_batch import DEFAULT_SENTIMENT_SCORE, DEFAULT_SENTIMENT_VOLATILITY, DEFAULT_CURRENCY_VOLATILITY
+from app.services.retention import SPECS, RetentionSpec
+from app.services.trends import TREND_WINDOW_DAYS, Moments, spike_input, trend_input
+
+STEPS = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+NEWS_NEGATIVITY_BASELINE = 0.35  # mean of the simulated live feed
+# Samples older than the replay start that still fall inside a model window
+LOOKBACK = timedelta(days=max(PROTEST_WINDOW_DAYS, TREND_WINDOW_DAYS))
+STREAM_BATCH = 5000
+WRITE_BATCH = 20000
+
+PROTEST, SENTIMENT, MARKET = range(3)
+_SOURCES = {PROTEST: "protests", SENTIMENT: "sentiment_scores", MARKET: "market_indicators"}
+_DAY = timedelta(days=1)
+
+
+@dataclass
+class ReplayReport:
+    scenario: str
+    countries: int = 0
+    steps: int = 0
+    rows: int = 0
+    transitions: int = 0
+
+
+def _stream(conn: Connection, stmt: Any) -> Iterator[Any]:
+    yield from conn.execution_options(yield_per=STREAM_BATCH).execute(stmt)
+
+
+def _samples(
+    conn: Connection, spec: RetentionSpec, country_id: int, since: datetime, until: datetime
+) -> Iterator[tuple]:
+    """(time, *value sums, count) for one country: raw rows and rollups merged in time order."""
+    raw, rollup = spec.raw, spec.rollup
+    time_col = getattr(raw, spec.time_column)
+    streams = [_stream(
+        conn,
+        select(time_col, *(getattr(raw, v) for v in spec.values), literal(1))
+        .where(raw.country_id == country_id, time_col >= since, time_col <= until)
+        .order_by(time_col),
+    )]
+    for resolution in ("day", "hour"):
+        streams.append(_stream(
+            conn,
+            select(rollup.bucket_start, *(getattr(rollup, f"{v}_sum") for v in spec.values), rollup.samples)
+            .where(
+                rollup.country_id == country_id,
+                rollup.resolution == resolution,
+                rollup.bucket_start >= since,
+                rollup.bucket_start <= until,
+            )
+            .order_by(rollup.bucket_start),
+        ))
+    return heapq.merge(*streams, key=itemgetter(0))
+
+
+def _tagged(kind: int, samples: Iterable[tuple]) -> Iterator[tuple]:
+    for sample in samples:
+        yield sample[0], kind, sample
+
+
+def _inputs(conn: Connection, country_id: int, since: datetime, until: datetime) -> Iterator[tuple]:
+    """(time, kind, sample) across all input tables, in time order."""
+    specs = {spec.name: spec for spec in SPECS}
+    return heapq.merge(
+        *(_tagged(kind, _samples(conn, specs[name], country_id, since, until)) for kind, name in _SOURCES.items()),
+        key=itemgetter(0),
+    )
+
+
+def _election_dates(conn: Connection, country_id: int, since: datetime) -> Iterator[datetime]:
+    stmt = (
+        select(Election.date)
+        .where(Election.country_id == country_id, Election.date >= since)
+        .order_by(Election.date)
+    )
+    for (when,) in _stream(conn, stmt):
+        yield when
+
+
+class _CountryState:
+    """Model inputs for one country as of the current replay step."""
+
+    def __init__(self):
+        self.protests: deque = deque()  # (time, severity_sum, count), oldest first
+        self.protest_sum = 0.0
+        self.protest_count = 0
+        self.sentiment = (DEFAULT_SENTIMENT_SCORE, DEFAULT_SENTIMENT_VOLATILITY)
+        self.market: deque = deque()  # (time, currency_volatility), oldest first
+        self.market_moments = Moments()
+        self.currency_volatility = DEFAULT_CURRENCY_VOLATILITY
+
+    def feed(self, when: datetime, kind: int, sample: tuple) -> None:
+        if kind == PROTEST:
+            _, severity_sum, count = sample
+            self.protests.append((when, severity_sum, count))
+            self.protest_sum += severity_sum
+            self.protest_count += count
+        elif kind == SENTIMENT:
+            _, score_sum, volatility_sum, count = sample
+            self.sentiment = (score_sum / count, volatility_sum / count)
+        else:
+            _, volatility_sum, _bond_sum, count = sample
+            self.currency_volatility = volatility_sum / count
+            self.market.append((when, self.currency_volatility))
+            self.market_moments.add(0.0, self.currency_volatility)
+
+    def expire(self, at: datetime) -> None:
+        """Drop samples that left the windows, with the same edges as the live path."""
+        protest_start = window_start(at)
+        while self.protests and self.protests[0][0] < protest_start:
+            _, severity_sum, count = self.protests.popleft()
+            self.protest_sum -= severity_sum
+            self.protest_count -= count
+        if not self.protests:
+            self.protest_sum, self.protest_count = 0.0, 0
+        market_start = at.replace(minute=0, second=0, microsecond=0) - timedelta(days=TREND_WINDOW_DAYS)
+        while self.market and self.market[0][0] < market_start:
+            self.market_moments.remove(0.0, self.market.popleft()[1])
+        if not self.market:
+            self.market_moments = Moments()
+
+
+def _step_times(start: datetime, end: datetime, step: timedelta) -> list[datetime]:
+    times, at = [], start
+    while at <= end:
+        times.append(at)
+        at += step
+    return times
+
+
+def _trend_inputs(times: list[datetime], psi: list[float]) -> list[float]:
+    """psi_trend_slope at each step from the replayed PSI of the preceding window."""
+    moments, window, out = Moments(), deque(), []
+    for at, y in zip(times, psi):
+        start = at - timedelta(days=TREND_WINDOW_DAYS)
+        while window and window[0][0] < start:
+            _, t, y0 = window.popleft()
+            moments.remove(t, y0)
+        out.append(trend_input(moments.slope()))
+        t = (at - times[0]) / _DAY
+        window.append((at, t, y))
+        moments.add(t, y)
+    return out
+
+
+def replay_country(
+    conn: Connection,
+    country_id: int,
+    start: datetime,
+    end: datetime,
+    step: timedelta,
+    model: PSIModel = DEFAULT_MODEL,
+) -> list[tuple]:
+    """Replay one country; returns (country_id, step_at, psi_score, risk_level, escalation) rows."""
+    times = _step_times(start, end, step)
+    samples = _inputs(conn, country_id, start - LOOKBACK, end)
+    elections = _election_dates(conn, country_id, first_upcoming(start.date()))
+    state = _CountryState()
+    sample = next(samples, None)
+    election = next(elections, None)
+
+    election_days, severity, count, clustering = [], [], [], []
+    sentiment_score, sentiment_volatility, currency_volatility, spikes = [], [], [], []
+    for at in times:
+        while sample is not None and sample[0] <= at:
+            state.feed(*sample)
+            sample = next(samples, None)
+        state.expire(at)
+        upcoming = first_upcoming(at.date())
+        while election is not None and election < upcoming:
+            election = next(elections, None)
+        election_days.append(days_until(election, at.date()) if election is not None else None)
+        protests = ProtestStats(state.protest_sum, state.protest_count)
+        severity.append(protests.mean_severity)
+        count.append(protests.count)
+        clustering.append(protests.event_clustering)
+        sentiment_score.append(state.sentiment[0])
+        sentiment_volatility.append(state.sentiment[1])
+        currency_volatility.append(state.currency_volatility)
+        spikes.append(spike_input(state.market_moments.zscore(state.currency_volatility)))
+
+    psi, codes = _scorer(model)(
+        election_days_remaining=election_days,
+        protest_severity=severity,
+        protest_count=count,
+        sentiment_score=sentiment_score,
+        sentiment_volatility=sentiment_volatility,
+        currency_volatility=currency_volatility,
+        news_negativity=[NEWS_NEGATIVITY_BASELINE] * len(times),
+    )
+    psi_scores = psi.tolist()
+    escalation = calculate_escalation_probability_batch(
+        psi_trend_slope=_trend_inputs(times, psi_scores),
+        event_clustering=clustering,
+        volatility_spike=spikes,
+    )
+    names = model.risk_level_names
+    return [
+        (country_id, at, p, names[c], e)
+        for at, p, c, e in zip(times, psi_scores, codes.tolist(), escalation.tolist())
+    ]
+
+
+# Per-process caches: worker processes compile each model and open each engine once
+_scorers: dict[PSIModel, PSIScorer] = {}
+_worker_engines: dict[str, Engine] = {}
+
+
+def _scorer(model: PSIModel) -> PSIScorer:
+    scorer = _scorers.get(model)
+    if scorer is None:
+        scorer = _scorers[model] = compile_model(model)
+    return scorer
+
+
+def _replay_in_worker(
+    url: str, start: datetime, end: datetime, step: timedelta, model: PSIModel, country_id: int
+) -> list[tuple]:
+    """Process-pool entry point: one read-only engine per worker process."""
+    engine = _worker_engines.get(url)
+    if engine is None:
+        engine = _worker_engines[url] = create_sqlite_engine(url, read_only=True)
+    with engine.connect() as conn:
+        return replay_country(conn, country_id, start, end, step, model)
+
+
+def run_replay(
+    db: Session,
+    scenario: str,
+    start: datetime,
+    end: datetime,
+    step: str = "day",
+    workers: Optional[int] = None,
+    country_ids: Optional[list[int]] = None,
+    url: str = SQLALCHEMY_DATABASE_URL,
+    model: PSIModel = DEFAULT_MODEL,
+) -> ReplayReport:
+    """
+    Replay every country (or `country_ids`) from start to end under `model`
+    and replace the scenario's rows in scenario_psi. workers=1 replays in
+    this process.
+    """
+    if step not in STEPS:
+        raise ValueError(f"Unknown replay step: {step}")
+    model.validate()
+    if country_ids is None:
+        country_ids = [cid for (cid,) in db.query(Country.id).order_by(Country.id)]
+    report = ReplayReport(scenario, countries=len(country_ids))
+    db.execute(delete(ScenarioPSI).where(ScenarioPSI.scenario == scenario))
+    db.commit()
+
+    replay = partial(_replay_in_worker, url, start, end, STEPS[step], model)
+    if workers == 1:
+        _write(db, scenario, map(replay, country_ids), report)
+    else:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(country_ids) // (workers * 4))
+            _write(db, scenario, pool.map(replay, country_ids, chunksize=chunksize), report)
+    report.steps = len(_step_times(start, end, STEPS[step]))
+    report.transitions = count_transitions(db, scenario)
+    return report
+
+
+def _write(db: Session, scenario: str, results: Iterable[list[tuple]], report: ReplayReport) -> None:
+    """Insert replayed rows in WRITE_BATCH transactions as countries complete."""
+    # Positional driver-level INSERT, as in ingest: ORM parameter processing
+    # would cost more than the replay itself
+    sql = (
+        "INSERT INTO scenario_psi (scenario, country_id, step_at, psi_score, risk_level, escalation_probability) "
+        "VALUES (?, ?, ?, ?, ?, ?)"
+    )
+    batch: list[tuple] = []
+    for rows in results:
+        for country_id, at, psi, risk_level, escalation in rows:
+            batch.append((scenario, country_id, at.isoformat(" ", "microseconds"), psi, risk_level, escalation))
+        if len(batch) >= WRITE_BATCH:
+            db.connection().exec_driver_sql(sql, batch)
+            db.commit()
+            report.rows += len(batch)
+            batch = []
+    if batch:
+        db.connection().exec_driver_sql(sql, batch)
+        db.commit()
+        report.rows += len(batch)
+
+
+def count_transitions(db: Session, scenario: str) -> int:
+    """Number of step-to-step risk-level changes across all countries in a scenario."""
+    previous = func.lag(ScenarioPSI.risk_level).over(
+        partition_by=ScenarioPSI.country_id, order_by=ScenarioPSI.step_at
+    )
+    steps = (
+        select(ScenarioPSI.risk_level.label("level"), previous.label("previous"))
+        .where(ScenarioPSI.scenario == scenario)
+        .subquery()
+    )
+    return db.execute(
+        select(func.count()).select_from(steps).where(steps.c.previous.is_not(None), steps.c.level != steps.c.previous)
+    ).scalar_one()
+
+
+def compare_scenarios(db: Session, scenario: str, baseline: str) -> tuple[int, int, float]:
+    """(steps compared, steps with a different risk level, mean absolute PSI difference)."""
+    other = ScenarioPSI.__table__.alias("baseline")
+    ours = ScenarioPSI.__table__
+    compared, differing, mean_delta = db.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(case((ours.c.risk_level != other.c.risk_level, 1), else_=0)), 0),
+            func.coalesce(func.avg(func.abs(ours.c.psi_score - other.c.psi_score)), 0.0),
+        )
+        .select_from(ours.join(
+            other,
+            (other.c.country_id == ours.c.country_id) & (other.c.step_at == ours.c.step_at),
+        ))
+        .where(ours.c.scenario == scenario, other.c.scenario == baseline)
+    ).one()
+    return compared, differing, mean_delta
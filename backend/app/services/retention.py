@@ -0,0 +1,164 @@
+"""
+Retention - time-based compaction for sentiment, market, protest and PSI history.
+
+Raw rows older than RETENTION_RAW_DAYS are folded into hourly rollups and
+deleted; hourly rollups older than RETENTION_HOURLY_DAYS are folded into
+daily rollups, which are kept forever. Protest events keep at least the PSI
+protest window in raw form, and psi_history at least the trend window; raw
+cutoffs are rounded down to the hour, as those windows' buckets are. Work
+is done in small batches, each in its own short transaction, so the job
+never holds the database for long.
+"""
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import bindparam, delete, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import (
+    SentimentScore,
+    MarketIndicator,
+    ProtestEvent,
+    PSIHistory,
+    SentimentRollup,
+    MarketRollup,
+    ProtestRollup,
+    PSIRollup,
+)
+from app.services.protest_window import PROTEST_WINDOW_DAYS
+from app.services.trends import TREND_WINDOW_DAYS
+
+RAW_RETENTION_DAYS = int(os.getenv("RETENTION_RAW_DAYS", "7"))
+HOURLY_RETENTION_DAYS = int(os.getenv("RETENTION_HOURLY_DAYS", "90"))
+COMPACTION_INTERVAL = int(os.getenv("RETENTION_INTERVAL_SECONDS", "3600"))
+COMPACTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", "1000"))
+COMPACTION_PAUSE = 0.05  # seconds between batches, lets API writers in
+
+
+@dataclass(frozen=True)
+class RetentionSpec:
+    """How one raw table is downsampled."""
+    name: str
+    raw: Any
+    time_column: str
+    values: tuple[str, ...]
+    rollup: Any
+    raw_retention_days: int
+
+
+SPECS = (
+    RetentionSpec("sentiment_scores", SentimentScore, "timestamp", ("score", "volatility_index"),
+                  SentimentRollup, RAW_RETENTION_DAYS),
+    RetentionSpec("market_indicators", MarketIndicator, "timestamp", ("currency_volatility", "bond_yield_change"),
+                  MarketRollup, RAW_RETENTION_DAYS),
+    # The 30-day protest window feeds PSI, so raw protests outlive the raw default
+    RetentionSpec("protests", ProtestEvent, "date", ("severity_score",),
+                  ProtestRollup, max(RAW_RETENTION_DAYS, PROTEST_WINDOW_DAYS)),
+    # One row per changed score per recompute; trend_engine rebuilds from the raw window
+    RetentionSpec("psi_history", PSIHistory, "recorded_at", ("psi_score", "escalation_probability"),
+                  PSIRollup, max(RAW_RETENTION_DAYS, TREND_WINDOW_DAYS)),
+)
+
+
+def _truncate(ts: datetime, resolution: str) -> datetime:
+    if resolution == "hour":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _upsert_buckets(db: Session, spec: RetentionSpec, resolution: str, buckets: dict) -> None:
+    """Additively merge {(country_id, bucket_start): [samples, sums..., maxes...]} into the rollup."""
+    rollup = spec.rollup
+    stmt = sqlite_insert(rollup)
+    set_ = {"samples": rollup.samples + stmt.excluded.samples}
+    for v in spec.values:
+        set_[f"{v}_sum"] = getattr(rollup, f"{v}_sum") + getattr(stmt.excluded, f"{v}_sum")
+        set_[f"{v}_max"] = func.max(getattr(rollup, f"{v}_max"), getattr(stmt.excluded, f"{v}_max"))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[rollup.country_id, rollup.resolution, rollup.bucket_start], set_=set_
+    )
+    rows = []
+    for (country_id, bucket_start), (samples, sums, maxes) in buckets.items():
+        row = {"country_id": country_id, "resolution": resolution, "bucket_start": bucket_start, "samples": samples}
+        for i, v in enumerate(spec.values):
+            row[f"{v}_sum"] = sums[i]
+            row[f"{v}_max"] = maxes[i]
+        rows.append(row)
+    db.execute(stmt, rows)
+
+
+def compact_raw_batch(db: Session, spec: RetentionSpec, now: datetime, batch_size: int = COMPACTION_BATCH_SIZE) -> int:
+    """Fold one batch of expired raw rows into hourly rollups. Returns rows deleted."""
+    raw = spec.raw
+    time_col = getattr(raw, spec.time_column)
+    # Hour aligned like protest_window/trends, whose oldest bucket can start
+    # up to an hour before now - days; rebuilds must find the same rows
+    cutoff = _truncate(now - timedelta(days=spec.raw_retention_days), "hour")
+    rows = db.execute(
+        select(raw.id, raw.country_id, time_col, *(getattr(raw, v) for v in spec.values))
+        .where(time_col < cutoff)
+        .order_by(raw.id)
+        .limit(batch_size)
+    ).all()
+    if not rows:
+        return 0
+    buckets: dict = {}
+    for _, country_id, ts, *values in rows:
+        key = (country_id, _truncate(ts, "hour"))
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = [1, list(values), list(values)]
+            continue
+        bucket[0] += 1
+        for i, value in enumerate(values):
+            bucket[1][i] += value
+            bucket[2][i] = max(bucket[2][i], value)
+    _upsert_buckets(db, spec, "hour", buckets)
+    db.execute(delete(raw).where(raw.id.in_([r[0] for r in rows])))
+    db.commit()
+    return len(rows)
+
+
+def compact_hourly_batch(db: Session, spec: RetentionSpec, now: datetime, batch_size: int = COMPACTION_BATCH_SIZE) -> int:
+    """Fold one batch of expired hourly rollups into daily rollups. Returns rows deleted."""
+    rollup = spec.rollup
+    cutoff = now - timedelta(days=HOURLY_RETENTION_DAYS)
+    columns = [rollup.country_id, rollup.bucket_start, rollup.samples]
+    columns += [getattr(rollup, f"{v}_sum") for v in spec.values]
+    columns += [getattr(rollup, f"{v}_max") for v in spec.values]
+    rows = db.execute(
+        select(*columns)
+        .where(rollup.resolution == "hour", rollup.bucket_start < cutoff)
+        .order_by(rollup.bucket_start)
+        .limit(batch_size)
+    ).all()
+    if not rows:
+        return 0
+    n = len(spec.values)
+    buckets: dict = {}
+    for country_id, bucket_start, samples, *rest in rows:
+        sums, maxes = rest[:n], rest[n:]
+        key = (country_id, _truncate(bucket_start, "day"))
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = [samples, list(sums), list(maxes)]
+            continue
+        bucket[0] += samples
+        for i in range(n):
+            bucket[1][i] += sums[i]
+            bucket[2][i] = max(bucket[2][i], maxes[i])
+    _upsert_buckets(db, spec, "day", buckets)
+    table = rollup.__table__
+    db.execute(
+        delete(table).where(
+            table.c.country_id == bindparam("cid"),
+            table.c.resolution == "hour",
+            table.c.bucket_start == bindparam("bucket"),
+        ),
+        [{"cid": r[0], "bucket": r[1]} for r in rows],
+    )
+    db.commit()
+    return len(rows)
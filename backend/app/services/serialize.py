@@ -0,0 +1,45 @@
+"""
+Serialization - row tuples straight to JSON bytes.
+
+The dashboard payloads are flat rows. Building a Pydantic object per row
+only for FastAPI to re-encode it costs more than the query, so the hot
+endpoints select plain tuples in a schema's field order and encode them with
+orjson against a precomputed RowLayout. The schemas stay each endpoint's
+response_model for OpenAPI, and a layout refuses to build if its fields stop
+matching them.
+"""
+from typing import Any, Iterable, Optional, Sequence
+
+import orjson
+from pydantic import BaseModel
+
+
+def dumps(content: Any) -> bytes:
+    """Compact JSON bytes (orjson: datetimes as ISO 8601, non-str keys allowed)."""
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class RowLayout:
+    """Field names of a response schema; rows are tuples in the same order."""
+
+    def __init__(self, schema: type[BaseModel], fields: Optional[Sequence[str]] = None, nested: Sequence[str] = ()):
+        """`nested` names fields the caller adds to each mapping() itself."""
+        declared = schema.model_fields
+        names = tuple(fields or (name for name in declared if name not in nested))
+        unknown = [name for name in (*names, *nested) if name not in declared]
+        missing = [
+            name for name, f in declared.items()
+            if f.is_required() and name not in names and name not in nested
+        ]
+        if unknown or missing:
+            raise ValueError(f"{schema.__name__} layout: unknown {unknown}, missing {missing}")
+        self.schema = schema
+        self.fields = names
+
+    def mapping(self, row: Sequence[Any]) -> dict:
+        return dict(zip(self.fields, row))
+
+    def encode(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        """A JSON array of one object per row."""
+        names = self.fields
+        return dumps([dict(zip(names, row)) for row in rows])
@@ -0,0 +1,163 @@
+"""
+Snapshot Cache - pre-encoded dashboard responses keyed by data generation.
+
+The dashboard data only changes when a recompute commits, which publishes
+DATA_COMMITTED and bumps the generation. Until then each endpoint's response
+is encoded once and served as bytes with an ETag (builders may also return
+bytes they encoded themselves, see serialize.RowLayout); a client sending a
+matching If-None-Match gets 304 without touching the database. Bodies of
+GZIP_MIN_SIZE or more are also gzipped once, for clients that accept it.
+"""
+import gzip
+import hashlib
+import threading
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.services.serialize import dumps
+
+
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    media_type: str
+    gzipped: Optional[bytes]  # None below GZIP_MIN_SIZE
+
+
+def encode_json(content: Any) -> bytes:
+    """Compact JSON bytes for any FastAPI-encodable content."""
+    return dumps(jsonable_encoder(content))
+
+
+class SnapshotCache:
+    """Process-wide response cache invalidated by a generation counter."""
+
+    def __init__(self):
+        self.generation = 0
+        self._entries: dict[Any, CachedResponse] = {}
+        self._families: dict[Any, int] = {}  # key[0] -> entries stored with a limit
+        self._lock = threading.Lock()
+
+    def bump(self, _event: Any = None) -> None:
+        """Invalidate everything; called when a recompute commits."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._families.clear()
+
+    def get(
+        self, key: Any, build: Callable[[], Any], media_type: str = "application/json", limit: Optional[int] = None
+    ) -> CachedResponse:
+        """
+        Cached entry for key, building and encoding it at most once per
+        generation. With a `limit`, at most that many keys sharing key[0] are
+        stored per generation (for client-chosen keys); later ones are built
+        per request.
+        """
+        entry, generation = self._lookup(key)
+        if entry is None:
+            entry = self._store(key, generation, build(), media_type, limit)
+        return entry
+
+    async def aget(
+        self,
+        key: Any,
+        build: Callable[[], Awaitable[Any]],
+        media_type: str = "application/json",
+        limit: Optional[int] = None,
+    ) -> CachedResponse:
+        """Like get(), for an async builder."""
+        entry, generation = self._lookup(key)
+        if entry is None:
+            entry = self._store(key, generation, await build(), media_type, limit)
+        return entry
+
+    def respond(
+        self,
+        request: Request,
+        key: Any,
+        build: Callable[[], Any],
+        media_type: str = "application/json",
+        limit: Optional[int] = None,
+    ) -> Response:
+        """
+        Serve the cached snapshot, or 304 if the client already has it.
+        Non-JSON builders must return bytes and pass their media_type.
+        """
+        return _response(request, self.get(key, build, media_type, limit))
+
+    async def arespond(
+        self,
+        request: Request,
+        key: Any,
+        build: Callable[[], Awaitable[Any]],
+        media_type: str = "application/json",
+        limit: Optional[int] = None,
+    ) -> Response:
+        """Like respond(), for an async builder."""
+        return _response(request, await self.aget(key, build, media_type, limit))
+
+    def _lookup(self, key: Any) -> tuple[Optional[CachedResponse], int]:
+        with self._lock:
+            return self._entries.get(key), self.generation
+
+    def _store(
+        self, key: Any, generation: int, content: Any, media_type: str, limit: Optional[int] = None
+    ) -> CachedResponse:
+        body = content if isinstance(content, bytes) else encode_json(content)
+        # Content hash, so identical data keeps its ETag across generations and workers
+        etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        gzipped = gzip.compress(body, GZIP_LEVEL, mtime=0) if len(body) >= GZIP_MIN_SIZE else None
+        entry = CachedResponse(body, etag, media_type, gzipped)
+        with self._lock:
+            # Don't cache a build that raced with an invalidation
+            if self.generation != generation or key in self._entries:
+                return entry
+            if limit is not None:
+                stored = self._families.get(key[0], 0)
+                if stored >= limit:
+                    return entry
+                self._families[key[0]] = stored + 1
+            self._entries[key] = entry
+        return entry
+
+
+def _response(request: Request, entry: CachedResponse) -> Response:
+    body, etag = entry.body, entry.etag
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept, Accept-Encoding"}
+    if entry.gzipped is not None and _accepts_gzip(request.headers.get("accept-encoding")):
+        # Each representation needs its own strong ETag
+        body, etag = entry.gzipped, etag[:-1] + '-gzip"'
+        headers["Content-Encoding"] = "gzip"
+    headers["ETag"] = etag
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=entry.media_type, headers=headers)
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+snapshot_cache = SnapshotCache()
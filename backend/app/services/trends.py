@@ -0,0 +1,228 @@
+"""
+Trends - streaming PSI trend and currency volatility spikes per country.
+
+Both signals keep least-squares moments (n, sums of t, y, t*t, t*y, y*y) over
+a TREND_WINDOW_DAYS sliding window, in hourly buckets like the protest
+window, so a new point and an expiring bucket are O(1) updates:
+
+- psi_trend_slope: slope of PSI over time (points per day) from psi_history
+  points, scaled so TREND_SATURATION points/day maps to 1.0.
+- volatility_spike: rolling z-score of the latest currency_volatility
+  against the window, scaled so SPIKE_Z_SATURATION maps to 1.0.
+
+Times are stored relative to each bucket's start and to a moving origin for
+the totals, which keeps the sums small enough to subtract without drift.
+Market rows are synced inside the recompute transaction; if it rolls back,
+the recompute invalidates the engine and the next sync rebuilds it.
+"""
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from math import sqrt
+from typing import Iterable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import MarketIndicator, PSIHistory
+from app.services.hour_buckets import EPOCH, HOUR, HourBuckets, hour_of
+
+TREND_WINDOW_DAYS = 7
+TREND_SATURATION = 10.0  # PSI points per day
+SPIKE_Z_SATURATION = 3.0
+MIN_SAMPLES = 3
+# Minimum spread (std dev, days) of PSI points before a slope is trusted;
+# a few minutes of noise would otherwise extrapolate to a steep daily trend
+MIN_TREND_SPREAD_DAYS = 0.25
+
+@dataclass
+class Moments:
+    """Running sums for least squares of y on t (t in days)."""
+    n: int = 0
+    st: float = 0.0
+    sy: float = 0.0
+    stt: float = 0.0
+    sty: float = 0.0
+    syy: float = 0.0
+
+    def add(self, t: float, y: float) -> None:
+        self.n += 1
+        self.st += t
+        self.sy += y
+        self.stt += t * t
+        self.sty += t * y
+        self.syy += y * y
+
+    def remove(self, t: float, y: float) -> None:
+        self.n -= 1
+        self.st -= t
+        self.sy -= y
+        self.stt -= t * t
+        self.sty -= t * y
+        self.syy -= y * y
+
+    def merge(self, other: "Moments", shift: float, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) `other`, whose t plus `shift` days is t in our frame."""
+        n = other.n
+        self.n += sign * n
+        self.st += sign * (other.st + n * shift)
+        self.sy += sign * other.sy
+        self.stt += sign * (other.stt + 2 * shift * other.st + n * shift * shift)
+        self.sty += sign * (other.sty + shift * other.sy)
+        self.syy += sign * other.syy
+
+    def slope(self) -> float:
+        """Least-squares slope of y per day (0 when undetermined)."""
+        if self.n < MIN_SAMPLES:
+            return 0.0
+        denominator = self.n * self.stt - self.st * self.st
+        if denominator <= 1e-12 or denominator < (self.n * MIN_TREND_SPREAD_DAYS) ** 2:
+            return 0.0
+        return (self.n * self.sty - self.st * self.sy) / denominator
+
+    def zscore(self, y: float) -> float:
+        """z-score of y against the window (0 when undetermined)."""
+        if self.n < MIN_SAMPLES:
+            return 0.0
+        mean = self.sy / self.n
+        variance = self.syy / self.n - mean * mean
+        if variance <= 1e-12:
+            return 0.0
+        return (y - mean) / sqrt(variance)
+
+
+def trend_input(slope: float) -> float:
+    """PSI points per day scaled to the 0-1 psi_trend_slope input (falling trends give 0)."""
+    return max(0.0, min(slope / TREND_SATURATION, 1.0))
+
+
+def spike_input(z: float) -> float:
+    """Currency volatility z-score scaled to the 0-1 volatility_spike input."""
+    return max(0.0, min(z / SPIKE_Z_SATURATION, 1.0))
+
+
+class SlidingMoments:
+    """Moments per country over a sliding time window, in hourly buckets."""
+
+    def __init__(self, days: int = TREND_WINDOW_DAYS):
+        self.window_hours = days * 24
+        self._window = HourBuckets()  # hour -> country_id -> Moments
+        self._origin = 0  # hour that totals' t is measured from
+        self._totals: dict[int, Moments] = {}
+
+    def reset(self, now: datetime) -> None:
+        self._window.reset(hour_of(now) - self.window_hours)
+        self._totals.clear()
+        self._origin = self._window.first_hour
+
+    def add(self, country_id: int, when: datetime, y: float) -> None:
+        hour = hour_of(when)
+        bucket = self._window.bucket(hour, country_id, Moments)
+        if bucket is None:
+            return
+        offset = (when - EPOCH) / HOUR - hour
+        bucket.add(offset / 24, y)
+        self._totals.setdefault(country_id, Moments()).add((hour - self._origin + offset) / 24, y)
+
+    def advance(self, now: datetime) -> None:
+        """Drop buckets that left the window and move the totals' origin along."""
+        first_hour = hour_of(now) - self.window_hours
+        for hour, expired in self._window.expire(first_hour):
+            for cid, m in expired.items():
+                total = self._totals[cid]
+                if total.n == m.n:
+                    del self._totals[cid]  # also drops accumulated float error
+                else:
+                    total.merge(m, (hour - self._origin) / 24, sign=-1)
+        if first_hour - self._origin > self.window_hours:
+            shift = (self._origin - first_hour) / 24
+            for cid, total in self._totals.items():
+                rebased = Moments()
+                rebased.merge(total, shift)
+                self._totals[cid] = rebased
+            self._origin = first_hour
+
+    def get(self, country_id: int) -> Moments:
+        return self._totals.get(country_id) or Moments()
+
+    def covers(self, now: datetime) -> bool:
+        """Whether the window at `now` has not already been expired past."""
+        return self._window.covers(hour_of(now) - self.window_hours)
+
+
+class TrendEngine:
+    """PSI trend and currency volatility windows, kept in step with the database."""
+
+    def __init__(self, days: int = TREND_WINDOW_DAYS):
+        self.days = days
+        self._psi = SlidingMoments(days)
+        self._market = SlidingMoments(days)
+        self._market_high_water: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def rebuild(self, db: Session, now: datetime) -> None:
+        """Reload both windows from psi_history and market_indicators."""
+        start = EPOCH + (hour_of(now) - self.days * 24) * HOUR
+        high_water = db.query(func.max(MarketIndicator.id)).scalar() or 0
+        psi_rows = (
+            db.query(PSIHistory.country_id, PSIHistory.recorded_at, PSIHistory.psi_score)
+            .filter(PSIHistory.recorded_at >= start)
+        )
+        market_rows = (
+            db.query(MarketIndicator.country_id, MarketIndicator.timestamp, MarketIndicator.currency_volatility)
+            .filter(MarketIndicator.timestamp >= start, MarketIndicator.id <= high_water)
+        )
+        with self._lock:
+            for window, rows in ((self._psi, psi_rows), (self._market, market_rows)):
+                window.reset(now)
+                for cid, when, value in rows:
+                    window.add(cid, when, value)
+            self._market_high_water = high_water
+
+    def sync(self, db: Session, now: datetime) -> None:
+        """Add market rows written since the last sync and slide both windows to `now`."""
+        if self._market_high_water is None or not self._psi.covers(now):
+            self.rebuild(db, now)
+            return
+        rows = (
+            db.query(
+                MarketIndicator.id,
+                MarketIndicator.country_id,
+                MarketIndicator.timestamp,
+                MarketIndicator.currency_volatility,
+            )
+            .filter(MarketIndicator.id > self._market_high_water)
+            .all()
+        )
+        with self._lock:
+            for mid, cid, when, value in rows:
+                self._market.add(cid, when, value)
+                self._market_high_water = max(self._market_high_water, mid)
+            self._psi.advance(now)
+            self._market.advance(now)
+
+    def invalidate(self) -> None:
+        """Rebuild on the next sync: a sync picked up market rows that were rolled back."""
+        with self._lock:
+            self._market_high_water = None
+
+    def record_psi(self, now: datetime, rows: Iterable[dict]) -> None:
+        """Add committed PSI changes (the rows psi_history received)."""
+        with self._lock:
+            for r in rows:
+                self._psi.add(r["country_id"], now, r["psi_score"])
+
+    def trend_slope(self, country_id: int) -> float:
+        """PSI trend scaled to the 0-1 psi_trend_slope input (falling trends give 0)."""
+        with self._lock:
+            slope = self._psi.get(country_id).slope()
+        return trend_input(slope)
+
+    def volatility_spike(self, country_id: int, currency_volatility: float) -> float:
+        """z-score of the latest currency volatility scaled to the 0-1 volatility_spike input."""
+        with self._lock:
+            z = self._market.get(country_id).zscore(currency_volatility)
+        return spike_input(z)
+
+
+trend_engine = TrendEngine()
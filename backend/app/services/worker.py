@@ -0,0 +1,36 @@
+"""
+Worker - a dedicated single-thread executor for ingest and recompute.
+
+All heavy synchronous database work (mock cycles, recompute, retention
+batches) runs here instead of on the event loop, so WebSockets and async
+requests keep being served during a commit. One thread also means one
+writer at a time, matching the single-connection writer engine.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="psi-worker")
+
+
+async def run_in_worker(fn: Callable[..., T], *args: Any) -> T:
+    """Run fn(*args) on the worker thread and await its result."""
+    return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+
+
+async def run_with_session(fn: Callable[..., T], *args: Any) -> T:
+    """Run fn(db, *args) on the worker thread with a fresh writer session."""
+    return await run_in_worker(_with_session, fn, *args)
+
+
+def _with_session(fn: Callable[..., T], *args: Any) -> T:
+    from app.database import SessionLocal
+    db: Session = SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
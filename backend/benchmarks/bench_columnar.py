@@ -0,0 +1,78 @@
+"""
+Benchmark the columnar wire format against JSON for /timeline and /live.
+
+Fills a scratch database like bench_serialize (--countries countries with
+--days of timeline rollups), then reports payload size raw and gzipped, and
+encode time, for a full /timeline and a /live snapshot in both formats.
+
+    cd backend && python -m benchmarks.bench_columnar --countries 200 --days 90
+"""
+import argparse
+import gzip
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401
+from app.database import Base, create_sqlite_engine
+from app.main import _build_columnar_timeline, _build_timeline
+from app.services.broadcaster import encode_frame
+from app.services.psi_stream import PSIStream
+from benchmarks.bench_serialize import _fill
+
+
+def _report(name: str, encode_json, encode_columnar, repeat: int) -> None:
+    print(f"  {name}")
+    for label, encode in (("json", encode_json), ("columnar", encode_columnar)):
+        body = encode()
+        body = body.encode() if isinstance(body, str) else body
+        began = time.perf_counter()
+        for _ in range(repeat):
+            encode()
+        elapsed = (time.perf_counter() - began) / repeat
+        print(
+            f"    {label:<9} {len(body):>10,} B   gzip {len(gzip.compress(body, 6)):>9,} B   "
+            f"encode {elapsed * 1e3:7.2f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    today = datetime.utcnow().date()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        _fill(session, args.countries, args.days, today)
+
+        stream = PSIStream()
+        stream.update(
+            [(i, 50.0 + i % 40 + 0.1, "Elevated", 0.25) for i in range(1, args.countries + 1)],
+            datetime.utcnow().isoformat(),
+        )
+        print(f"{args.countries} countries:")
+        _report(
+            f"/timeline?days={args.days}",
+            lambda: _build_timeline(session, args.days, today),
+            lambda: _build_columnar_timeline(session, args.days, today),
+            args.repeat,
+        )
+        _report(
+            "/live snapshot",
+            lambda: encode_frame(stream.snapshot(), binary=False),
+            lambda: encode_frame(stream.snapshot(), binary=True),
+            args.repeat * 10,
+        )
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Benchmark country detail: five queries per country vs one grouped query per table.
+
+Fills a scratch database with --countries countries, each with elections,
+--protests protests and --ticks sentiment/market rows, then loads every
+country's detail panel the old way (GET /country/{id} per country: five ORM
+queries plus Pydantic each) and with load_country_details in one batch, and
+checks both produce the same payload.
+
+    cd backend && python -m benchmarks.bench_country_detail --countries 200
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401
+from app.database import Base, create_sqlite_engine
+from app.migrations import migrate
+from app.models import Country, Election, ProtestEvent, SentimentScore, MarketIndicator, PSIScore
+from app.schemas import (
+    CountryDetail,
+    Election as ElectionSchema,
+    ProtestEvent as ProtestEventSchema,
+    SentimentScore as SentimentScoreSchema,
+    MarketIndicator as MarketIndicatorSchema,
+)
+from app.services.country_detail import load_country_details
+from app.services.elections import first_upcoming
+from app.services.serialize import dumps
+
+
+def _per_country(db, country_id: int, today) -> CountryDetail:
+    """The previous GET /country/{id} builder."""
+    country = db.query(Country).filter(Country.id == country_id).first()
+    psi = db.query(PSIScore).filter(PSIScore.country_id == country_id).order_by(PSIScore.updated_at.desc()).first()
+    elections = (
+        db.query(Election).filter(Election.country_id == country_id, Election.date >= first_upcoming(today))
+        .order_by(Election.date).limit(5).all()
+    )
+    protests = (
+        db.query(ProtestEvent).filter(ProtestEvent.country_id == country_id)
+        .order_by(ProtestEvent.date.desc()).limit(10).all()
+    )
+    sentiment = (
+        db.query(SentimentScore).filter(SentimentScore.country_id == country_id)
+        .order_by(SentimentScore.timestamp.desc()).first()
+    )
+    market = (
+        db.query(MarketIndicator).filter(MarketIndicator.country_id == country_id)
+        .order_by(MarketIndicator.timestamp.desc()).first()
+    )
+    return CountryDetail(
+        id=country.id, name=country.name, iso_code=country.iso_code, region=country.region,
+        latitude=country.latitude, longitude=country.longitude,
+        psi_score=psi.psi_score if psi else 0.0,
+        risk_level=psi.risk_level if psi else "Stable",
+        escalation_probability=psi.escalation_probability if psi else 0.0,
+        elections=[ElectionSchema.model_validate(e) for e in elections],
+        protests=[ProtestEventSchema.model_validate(p) for p in protests],
+        sentiment=SentimentScoreSchema.model_validate(sentiment) if sentiment else None,
+        market_indicator=MarketIndicatorSchema.model_validate(market) if market else None,
+    )
+
+
+def _fill(session, countries: int, protests: int, ticks: int, now: datetime) -> None:
+    rnd = random.Random(42)
+    session.execute(insert(Country), [
+        {"id": i, "name": f"Country {i}", "iso_code": f"{i:03d}", "region": "Europe", "latitude": 0, "longitude": 0}
+        for i in range(1, countries + 1)
+    ])
+    session.execute(insert(PSIScore), [
+        {"country_id": i, "psi_score": round(rnd.uniform(5, 95), 1), "risk_level": "Moderate",
+         "escalation_probability": round(rnd.random(), 3), "updated_at": now}
+        for i in range(1, countries + 1)
+    ])
+    session.execute(insert(Election), [
+        {"country_id": i, "type": "presidential", "date": now + timedelta(days=rnd.randint(-30, 400), minutes=rnd.randint(0, 1439))}
+        for i in range(1, countries + 1) for _ in range(8)
+    ])
+    session.execute(insert(ProtestEvent), [
+        {"country_id": i, "severity_score": round(rnd.uniform(0.2, 4.5), 1), "location": "Square",
+         "date": now - timedelta(minutes=rnd.randint(0, 60 * 24 * 30))}
+        for i in range(1, countries + 1) for _ in range(protests)
+    ])
+    for model, fields in (
+        (SentimentScore, lambda: {"score": rnd.uniform(-1, 1), "volatility_index": rnd.random()}),
+        (MarketIndicator, lambda: {"currency_volatility": rnd.uniform(0.5, 3), "bond_yield_change": rnd.uniform(-0.5, 1.5)}),
+    ):
+        session.execute(insert(model), [
+            {"country_id": i, "timestamp": now - timedelta(seconds=30 * t), **fields()}
+            for i in range(1, countries + 1) for t in range(ticks)
+        ])
+    session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--protests", type=int, default=50)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    now = datetime.utcnow()
+    today = now.date()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        migrate(engine)
+        session = sessionmaker(bind=engine)()
+        _fill(session, args.countries, args.protests, args.ticks, now)
+        ids = list(range(1, args.countries + 1))
+
+        def old() -> bytes:
+            session.expunge_all()
+            return dumps(jsonable_encoder([_per_country(session, cid, today) for cid in ids]))
+
+        def new() -> bytes:
+            return dumps(load_country_details(session, None, today))
+
+        assert json.loads(old()) == json.loads(new()), "payloads differ"
+        print(f"{args.countries} countries, every detail panel:")
+        for name, fn in (("per country", old), ("batched", new)):
+            began = time.perf_counter()
+            for _ in range(args.repeat):
+                fn()
+            print(f"  {name:<12} {(time.perf_counter() - began) / args.repeat * 1e3:8.1f} ms")
+        began = time.perf_counter()
+        for cid in ids[:50]:
+            load_country_details(session, [cid], today)
+        print(f"  single panel {(time.perf_counter() - began) / 50 * 1e3:8.2f} ms (batch of one)")
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark hot time-series queries with and without the composite indexes.
+
+Fills a scratch SQLite database with --rows rows per time-series table spread
+over --countries countries, then times the query shapes update_psi_scores and
+the dashboard endpoints issue, first without and then with the indexes.
+
+    cd backend && python -m benchmarks.bench_indexes --rows 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, text
+
+from app import models  # noqa: F401
+from app.database import Base
+from app.migrations import migrate
+
+INDEXED_TABLES = ("elections", "protests", "sentiment_scores", "market_indicators", "psi_scores")
+
+HOT_QUERIES = {
+    "nearest election": (
+        "SELECT * FROM elections WHERE country_id = :cid AND date >= :now "
+        "ORDER BY date LIMIT 1"
+    ),
+    "30-day protests": (
+        "SELECT AVG(severity_score), COUNT(*) FROM protests "
+        "WHERE country_id = :cid AND date >= :since"
+    ),
+    "latest sentiment": (
+        "SELECT * FROM sentiment_scores WHERE country_id = :cid ORDER BY timestamp DESC LIMIT 1"
+    ),
+    "latest market": (
+        "SELECT * FROM market_indicators WHERE country_id = :cid ORDER BY timestamp DESC LIMIT 1"
+    ),
+    "latest psi": (
+        "SELECT * FROM psi_scores WHERE country_id = :cid ORDER BY updated_at DESC LIMIT 1"
+    ),
+}
+
+
+def _fill(engine, rows: int, countries: int) -> None:
+    """Bulk-load synthetic rows; timestamps span one year."""
+    now = datetime.utcnow()
+    span = 365 * 24 * 3600
+    rnd = random.Random(42)
+    batch = 50_000
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO countries (id, name, iso_code, region, latitude, longitude) VALUES (:id, :n, :iso, 'Europe', 0, 0)"),
+            [{"id": i, "n": f"Country {i}", "iso": f"{i:03d}"} for i in range(1, countries + 1)],
+        )
+    tables = {
+        "elections": ("INSERT INTO elections (country_id, date, type) VALUES (:c, :t, 'presidential')",
+                      lambda c, t: {"c": c, "t": t + timedelta(days=rnd.randint(0, 365))}),
+        "protests": ("INSERT INTO protests (country_id, severity_score, location, date) VALUES (:c, :s, 'Square', :t)",
+                     lambda c, t: {"c": c, "t": t, "s": rnd.uniform(0.2, 4.5)}),
+        "sentiment_scores": ("INSERT INTO sentiment_scores (country_id, score, volatility_index, timestamp) VALUES (:c, :s, :v, :t)",
+                             lambda c, t: {"c": c, "t": t, "s": rnd.uniform(-1, 1), "v": rnd.random()}),
+        "market_indicators": ("INSERT INTO market_indicators (country_id, currency_volatility, bond_yield_change, timestamp) VALUES (:c, :s, :v, :t)",
+                              lambda c, t: {"c": c, "t": t, "s": rnd.uniform(0.5, 3), "v": rnd.uniform(-0.5, 1.5)}),
+        "psi_scores": ("INSERT INTO psi_scores (country_id, psi_score, risk_level, escalation_probability, updated_at) VALUES (:c, :s, 'Stable', :v, :t)",
+                       lambda c, t: {"c": c, "t": t, "s": rnd.uniform(0, 100), "v": rnd.random()}),
+    }
+    for table, (sql, make) in tables.items():
+        start = time.perf_counter()
+        for offset in range(0, rows, batch):
+            chunk = [
+                make(rnd.randint(1, countries), now - timedelta(seconds=rnd.randint(0, span)))
+                for _ in range(min(batch, rows - offset))
+            ]
+            with engine.begin() as conn:
+                conn.execute(text(sql), chunk)
+        print(f"  loaded {rows:,} rows into {table} in {time.perf_counter() - start:.1f}s")
+
+
+def _drop_indexes(engine) -> None:
+    with engine.begin() as conn:
+        for table in INDEXED_TABLES:
+            for (name,) in conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :t AND name LIKE 'ix_%country%'"),
+                {"t": table},
+            ).fetchall():
+                conn.execute(text(f"DROP INDEX {name}"))
+        conn.execute(text("DELETE FROM schema_version"))
+
+
+def _time_queries(engine, countries: int, samples: int) -> dict[str, float]:
+    """Median latency (ms) of each hot query over random countries."""
+    now = datetime.utcnow()
+    since = now - timedelta(days=30)
+    rnd = random.Random(7)
+    results = {}
+    with engine.connect() as conn:
+        for label, sql in HOT_QUERIES.items():
+            timings = []
+            for _ in range(samples):
+                params = {"cid": rnd.randint(1, countries), "since": since, "now": now}
+                start = time.perf_counter()
+                conn.execute(text(sql), params).fetchall()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[label] = statistics.median(timings)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows per time-series table")
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--samples", type=int, default=20, help="timed executions per query")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        migrate(engine)
+        print(f"Loading {args.rows:,} rows x {len(INDEXED_TABLES)} tables over {args.countries} countries")
+        _fill(engine, args.rows, args.countries)
+
+        _drop_indexes(engine)
+        without = _time_queries(engine, args.countries, max(3, args.samples // 4))
+        start = time.perf_counter()
+        migrate(engine)
+        print(f"  migration built indexes in {time.perf_counter() - start:.1f}s")
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+        with_idx = _time_queries(engine, args.countries, args.samples)
+
+    print(f"\n{'query':<20}{'no index (ms)':>16}{'indexed (ms)':>16}{'speedup':>10}")
+    for label in HOT_QUERIES:
+        print(f"{label:<20}{without[label]:>16.2f}{with_idx[label]:>16.3f}{without[label] / with_idx[label]:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
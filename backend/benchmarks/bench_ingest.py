@@ -0,0 +1,101 @@
+"""
+Benchmark bulk ingestion: NDJSON protests through Ingestor into SQLite.
+
+Fills a scratch database with --countries countries, then feeds --rows
+protest lines in --chunk-size chunks and runs the single recompute, as
+'python -m app.cli ingest' does in a fresh process (so the recompute is
+the first of the day and rescores every country). Reports validation and
+row building, the INSERTs and the recompute separately, against the
+100k rows/s target.
+
+    cd backend && python -m benchmarks.bench_ingest --rows 200000
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401
+from app.database import Base, create_sqlite_engine
+from app.migrations import migrate
+from app.models import Country
+from app.services.ingest import CHUNK_SIZE, Ingestor, iter_line_chunks
+
+TARGET_ROWS_PER_SECOND = 100_000
+
+
+def _lines(rows: int, countries: int, now: datetime) -> list[bytes]:
+    rnd = random.Random(42)
+    return [
+        json.dumps({
+            "country_id": rnd.randint(1, countries),
+            "severity_score": round(rnd.uniform(0.2, 4.5), 1),
+            "location": "Capital",
+            "date": (now - timedelta(minutes=rnd.randint(0, 29 * 24 * 60))).isoformat(),
+        }).encode() + b"\n"
+        for _ in range(rows)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--countries", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    now = datetime.utcnow()
+    lines = _lines(args.rows, args.countries, now)
+    chunks = list(iter_line_chunks(lines, args.chunk_size))
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        migrate(engine)
+        session = sessionmaker(bind=engine)()
+        session.execute(insert(Country), [
+            {"id": i, "name": f"Country {i}", "iso_code": f"{i:03d}", "region": "Europe",
+             "latitude": 0, "longitude": 0}
+            for i in range(1, args.countries + 1)
+        ])
+        session.commit()
+
+        # Validation and row building alone (with the collector paused, as
+        # feed() does), on a loader that never inserts
+        dry = Ingestor("protests", now=now)
+        dry.feed(session, [])
+        gc.disable()
+        began = time.perf_counter()
+        for chunk in chunks:
+            dry._to_rows(*dry._parse(chunk))
+        build = time.perf_counter() - began
+        gc.enable()
+
+        ingestor = Ingestor("protests", now=now)
+        began = time.perf_counter()
+        for chunk in chunks:
+            ingestor.feed(session, chunk)
+        fed = time.perf_counter()
+        report = ingestor.finish(session)
+        done = time.perf_counter()
+        session.close()
+        engine.dispose()
+
+    total = done - began
+    rate = report.accepted / total
+    print(f"ingest {report.accepted} protests in {len(chunks)} chunks, {report.recomputed} countries rescored")
+    print(f"  validate + rows   {build:6.2f} s")
+    print(f"  insert            {fed - began - build:6.2f} s")
+    print(f"  recompute         {done - fed:6.2f} s")
+    print(f"  total             {total:6.2f} s  {rate:9,.0f} rows/s "
+          f"({rate / TARGET_ROWS_PER_SECOND:.0%} of the {TARGET_ROWS_PER_SECOND:,} rows/s target)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark /leaderboard: ORDER BY over psi_scores vs the in-memory Leaderboard.
+
+Fills a scratch database with --countries countries across six regions,
+each with --history PSI rows, then times the previous top-10 query against
+Leaderboard.top() (global, ?region= and ?level=), and the cost of applying
+one recompute that moves --changed countries. Also reports how many of
+the old query's rows are superseded history (or repeat a country).
+
+    cd backend && python -m benchmarks.bench_leaderboard --countries 200 --history 50
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401
+from app.database import Base, create_sqlite_engine
+from app.migrations import migrate
+from app.models import Country, PSIScore
+from app.psi_engine import RISK_LEVELS
+from app.services.leaderboard import Leaderboard
+
+REGIONS = ["Europe", "Asia", "Africa", "Americas", "Middle East", "Oceania"]
+
+
+def _level(psi: float) -> str:
+    return next(level for low, high, level in RISK_LEVELS if psi <= high)
+
+
+def _old_top(db) -> list[tuple]:
+    """The previous get_leaderboard query."""
+    return db.execute(
+        select(Country.id, Country.name, Country.iso_code, PSIScore.psi_score, PSIScore.risk_level)
+        .join(Country, PSIScore.country_id == Country.id)
+        .order_by(PSIScore.psi_score.desc())
+        .limit(10)
+    ).all()
+
+
+def _fill(session, countries: int, history: int, now: datetime) -> None:
+    rnd = random.Random(42)
+    session.execute(insert(Country), [
+        {"id": i, "name": f"Country {i}", "iso_code": f"{i:03d}", "region": REGIONS[i % len(REGIONS)],
+         "latitude": 0, "longitude": 0}
+        for i in range(1, countries + 1)
+    ])
+    rows = []
+    for i in range(1, countries + 1):
+        for h in range(history):
+            psi = round(rnd.uniform(5, 95), 1)
+            rows.append({"country_id": i, "psi_score": psi, "risk_level": _level(psi),
+                         "escalation_probability": 0.1, "updated_at": now - timedelta(minutes=h)})
+    session.execute(insert(PSIScore), rows)
+    session.commit()
+
+
+def _ms(fn, repeat: int) -> float:
+    began = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - began) / repeat * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--history", type=int, default=50)
+    parser.add_argument("--changed", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    now = datetime.utcnow()
+    rnd = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        migrate(engine)
+        session = sessionmaker(bind=engine)()
+        _fill(session, args.countries, args.history, now)
+
+        board = Leaderboard()
+        began = time.perf_counter()
+        board.rebuild(session)
+        rebuild_ms = (time.perf_counter() - began) * 1e3
+
+        old = _old_top(session)
+        print(f"{args.countries} countries x {args.history} PSI rows:")
+        current = {row[1]: row[4] for row in board.top(args.countries)}
+        stale = sum(current[row[0]] != row[3] for row in old)
+        duplicates = len(old) - len({row[0] for row in old})
+        print(f"  old query top 10: {stale} stale history rows, {duplicates} duplicate countries")
+        print(f"  rebuild            {rebuild_ms:8.2f} ms (startup)")
+        print(f"  ORDER BY LIMIT 10  {_ms(lambda: _old_top(session), max(1, args.repeat // 10)):8.3f} ms")
+        for label, kwargs in (
+            ("top 10", {}),
+            ("?region=Asia", {"region": "Asia"}),
+            ("?level=High", {"risk_level": "High"}),
+            ("?region&level", {"region": "Asia", "risk_level": "Crisis"}),
+            ("?limit=100", {"limit": 100}),
+        ):
+            print(f"  {label:<18} {_ms(lambda: board.top(**kwargs), args.repeat):8.3f} ms")
+        print(f"  levels             {_ms(board.counts, args.repeat):8.3f} ms")
+
+        def recompute() -> None:
+            rows = []
+            for cid in rnd.sample(range(1, args.countries + 1), args.changed):
+                psi = round(rnd.uniform(5, 95), 1)
+                rows.append({"country_id": cid, "psi_score": psi, "risk_level": _level(psi)})
+            board.on_psi_recomputed({"rows": rows})
+
+        print(f"  apply {args.changed} changes   {_ms(recompute, args.repeat):8.3f} ms")
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
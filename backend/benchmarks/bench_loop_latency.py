@@ -0,0 +1,138 @@
+"""
+Load test: /health and /live latency while ingest + recompute cycles run.
+
+Serves the app with uvicorn on a scratch database, then probes GET /health
+and WebSocket ping round-trips on /live, first idle and then while write
+cycles (a bulk tick insert plus run_mock_cycle) run back to back. Cycles run
+either "inline" on the event loop (the old mock_data_updater) or on the
+worker executor.
+
+    cd backend && python -m benchmarks.bench_loop_latency --seconds 10   # needs httpx
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+PORT = 8799
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+def _write_cycle(db, rows: int, rnd: random.Random) -> None:
+    from sqlalchemy import insert
+    from app.models import SentimentScore, MarketIndicator
+    from app.services.mock_data import run_mock_cycle
+
+    now = datetime.utcnow()
+    db.execute(insert(SentimentScore), [
+        {"country_id": rnd.randint(1, 20), "score": rnd.uniform(-1, 1), "volatility_index": rnd.random(), "timestamp": now}
+        for _ in range(rows)
+    ])
+    db.execute(insert(MarketIndicator), [
+        {"country_id": rnd.randint(1, 20), "currency_volatility": rnd.uniform(0.5, 3), "bond_yield_change": 0.1, "timestamp": now}
+        for _ in range(rows)
+    ])
+    run_mock_cycle(db)
+
+
+async def _writer(mode: str, stop: threading.Event, rows: int, cycles: list) -> None:
+    """Runs on the server's loop, like mock_data_updater."""
+    from app.database import SessionLocal
+    from app.services.worker import run_with_session
+
+    rnd = random.Random(1)
+    while not stop.is_set():
+        if mode == "inline":
+            db = SessionLocal()
+            try:
+                _write_cycle(db, rows, rnd)
+            finally:
+                db.close()
+        else:
+            await run_with_session(_write_cycle, rows, rnd)
+        cycles.append(1)
+        await asyncio.sleep(0)
+
+
+async def _probe_health(stop: asyncio.Event, latencies: list) -> None:
+    import httpx
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{PORT}") as client:
+        while not stop.is_set():
+            start = time.perf_counter()
+            await client.get("/health")
+            latencies.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(0.005)
+
+
+async def _probe_live(stop: asyncio.Event, latencies: list) -> None:
+    import websockets
+    async with websockets.connect(f"ws://127.0.0.1:{PORT}/live") as ws:
+        while not stop.is_set():
+            start = time.perf_counter()
+            await (await ws.ping())
+            latencies.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(0.005)
+
+
+async def _phase(server_loop, mode: str, seconds: float, rows: int) -> dict:
+    stop = asyncio.Event()
+    health, live, cycles = [], [], []
+    writer_stop = threading.Event()
+    writer = None
+    if mode != "idle":
+        writer = asyncio.run_coroutine_threadsafe(_writer(mode, writer_stop, rows, cycles), server_loop)
+    probes = [asyncio.create_task(_probe_health(stop, health)), asyncio.create_task(_probe_live(stop, live))]
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*probes)
+    if writer is not None:
+        writer_stop.set()
+        await asyncio.wrap_future(writer)
+    return {"health": health, "live": live, "cycles": len(cycles)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=10, help="duration of each phase")
+    parser.add_argument("--rows-per-cycle", type=int, default=20_000, help="tick rows inserted per write cycle")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The app reads DATABASE_URL at import time
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'load.db')}"
+        import uvicorn
+        from app.main import app
+
+        server = uvicorn.Server(uvicorn.Config(app, port=PORT, log_level="warning", ws_ping_interval=None))
+        server_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=server_loop.run_until_complete, args=(server.serve(),), daemon=True)
+        thread.start()
+        while not server.started:
+            time.sleep(0.05)
+
+        print(f"{'mode':<8}{'probe':<8}{'n':>7}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}{'cycles':>8}")
+        try:
+            for mode in ("idle", "inline", "worker"):
+                r = asyncio.run(_phase(server_loop, mode, args.seconds, args.rows_per_cycle))
+                for probe in ("health", "live"):
+                    lat = r[probe]
+                    print(
+                        f"{mode:<8}{probe:<8}{len(lat):>7}{statistics.median(lat):>9.2f}"
+                        f"{_percentile(lat, 0.99):>9.2f}{max(lat):>9.1f}{r['cycles']:>8}"
+                    )
+        finally:
+            server.should_exit = True
+            thread.join(10)
+
+
+if __name__ == "__main__":
+    main()
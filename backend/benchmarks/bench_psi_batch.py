@@ -0,0 +1,102 @@
+"""
+Benchmark calculate_psi_batch against the scalar calculate_psi loop.
+
+Generates --rows random (country, day) input rows, scores them both ways,
+checks the results are bit-identical and reports throughput.
+
+    cd backend && python -m benchmarks.bench_psi_batch --rows 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.psi_engine import (
+    RISK_LEVEL_NAMES,
+    calculate_escalation_probability,
+    calculate_escalation_probability_batch,
+    calculate_psi,
+    calculate_psi_batch,
+)
+
+
+def _inputs(rows: int, seed: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    days = rng.integers(-5, 400, rows).astype(np.float64)
+    days[rng.random(rows) < 0.3] = np.nan  # no upcoming election
+    return {
+        "election_days_remaining": days,
+        "protest_severity": np.round(rng.uniform(0, 4.5, rows), 1),
+        "protest_count": rng.integers(0, 8, rows).astype(np.float64),
+        "sentiment_score": np.round(rng.uniform(-0.8, 0.6, rows), 2),
+        "sentiment_volatility": np.round(rng.uniform(0.1, 0.9, rows), 2),
+        "currency_volatility": np.round(rng.uniform(0.5, 15, rows), 2),
+        "news_negativity": rng.uniform(0.1, 0.6, rows),
+        "psi_trend_slope": rng.uniform(0, 0.5, rows),
+    }
+
+
+def _scalar(cols: dict[str, np.ndarray]) -> tuple[list, list, list, float]:
+    # Columns as Python scalars, as the per-row path would receive them
+    days = [None if d != d else int(d) for d in cols["election_days_remaining"].tolist()]
+    sev = cols["protest_severity"].tolist()
+    count = [int(c) for c in cols["protest_count"].tolist()]
+    score = cols["sentiment_score"].tolist()
+    vol = cols["sentiment_volatility"].tolist()
+    cur = cols["currency_volatility"].tolist()
+    news = cols["news_negativity"].tolist()
+    slope = cols["psi_trend_slope"].tolist()
+
+    start = time.perf_counter()
+    psi, levels, esc = [], [], []
+    for i in range(len(sev)):
+        p, level = calculate_psi(days[i], sev[i], count[i], score[i], vol[i], cur[i], news[i])
+        psi.append(p)
+        levels.append(level)
+        esc.append(calculate_escalation_probability(slope[i], min(count[i] / 5, 1.0), min(cur[i] / 5, 1.0)))
+    return psi, levels, esc, time.perf_counter() - start
+
+
+def _batch(cols: dict[str, np.ndarray]):
+    start = time.perf_counter()
+    psi, codes = calculate_psi_batch(
+        cols["election_days_remaining"],
+        cols["protest_severity"],
+        cols["protest_count"],
+        cols["sentiment_score"],
+        cols["sentiment_volatility"],
+        cols["currency_volatility"],
+        cols["news_negativity"],
+    )
+    esc = calculate_escalation_probability_batch(
+        cols["psi_trend_slope"],
+        np.minimum(cols["protest_count"] / 5, 1.0),
+        np.minimum(cols["currency_volatility"] / 5, 1.0),
+    )
+    return psi, codes, esc, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cols = _inputs(args.rows, args.seed)
+    s_psi, s_levels, s_esc, s_time = _scalar(cols)
+    b_psi, b_codes, b_esc, b_time = _batch(cols)
+
+    identical = (
+        np.array_equal(np.asarray(s_psi), b_psi)
+        and [RISK_LEVEL_NAMES[c] for c in b_codes.tolist()] == s_levels
+        and np.array_equal(np.asarray(s_esc), b_esc)
+    )
+    print(f"rows:      {args.rows:,}")
+    print(f"scalar:    {s_time:8.3f}s  ({args.rows / s_time:>12,.0f} rows/s)")
+    print(f"batch:     {b_time:8.3f}s  ({args.rows / b_time:>12,.0f} rows/s)")
+    print(f"speedup:   {s_time / b_time:8.1f}x")
+    print(f"identical: {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Load test: dashboard read latency while the ingest/recompute writer runs.
+
+For each storage profile ("default" = stock SQLite journaling, "production"
+= WAL + tuned pragmas with a separate read-only pool) this seeds a scratch
+database, starts reader threads issuing the /countries query in a loop, and
+measures their latency first with the writer idle and then while a writer
+thread runs back-to-back ingest + recompute cycles.
+
+    cd backend && python -m benchmarks.bench_read_during_write --seconds 10
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401
+from app.database import Base, create_sqlite_engine
+from app.migrations import migrate
+from app.models import SentimentScore, MarketIndicator
+from app.services.mock_data import run_mock_cycle, seed_countries
+from app.services.queries import latest_psi_by_country
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+def _writer(session_factory, stop: threading.Event, rows_per_cycle: int, cycles: list) -> None:
+    """Back-to-back write cycles: a bulk tick insert plus a mock cycle and recompute."""
+    rnd = random.Random(1)
+    while not stop.is_set():
+        db = session_factory()
+        try:
+            now = datetime.utcnow()
+            db.execute(insert(SentimentScore), [
+                {"country_id": rnd.randint(1, 20), "score": rnd.uniform(-1, 1), "volatility_index": rnd.random(), "timestamp": now}
+                for _ in range(rows_per_cycle)
+            ])
+            db.execute(insert(MarketIndicator), [
+                {"country_id": rnd.randint(1, 20), "currency_volatility": rnd.uniform(0.5, 3), "bond_yield_change": 0.1, "timestamp": now}
+                for _ in range(rows_per_cycle)
+            ])
+            run_mock_cycle(db)
+            cycles.append(now)
+        finally:
+            db.close()
+
+
+def _reader(session_factory, stop: threading.Event, latencies: list, errors: list) -> None:
+    while not stop.is_set():
+        db = session_factory()
+        start = time.perf_counter()
+        try:
+            latest_psi_by_country(db)
+            latencies.append((time.perf_counter() - start) * 1000)
+        except OperationalError:
+            errors.append(time.perf_counter() - start)
+        finally:
+            db.close()
+
+
+def _measure(read_factory, write_factory, readers: int, seconds: float, rows_per_cycle: int, with_writer: bool):
+    stop = threading.Event()
+    latencies, errors, cycles = [], [], []
+    threads = [threading.Thread(target=_reader, args=(read_factory, stop, latencies, errors)) for _ in range(readers)]
+    if with_writer:
+        threads.append(threading.Thread(target=_writer, args=(write_factory, stop, rows_per_cycle, cycles)))
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return latencies, errors, cycles
+
+
+def run_profile(profile: str, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'load.db')}"
+        write_engine = create_sqlite_engine(url, profile=profile)
+        if profile == "production":
+            read_engine = create_sqlite_engine(url, read_only=True, pool_size=args.readers, profile=profile)
+        else:
+            read_engine = create_sqlite_engine(url, pool_size=args.readers, profile=profile)
+        Base.metadata.create_all(bind=write_engine)
+        migrate(write_engine)
+        write_factory = sessionmaker(bind=write_engine)
+        read_factory = sessionmaker(bind=read_engine)
+        db = write_factory()
+        seed_countries(db)
+        run_mock_cycle(db)
+        db.close()
+
+        results = {}
+        for label, with_writer in (("idle", False), ("writing", True)):
+            latencies, errors, cycles = _measure(
+                read_factory, write_factory, args.readers, args.seconds, args.rows_per_cycle, with_writer
+            )
+            results[label] = {
+                "reads": len(latencies),
+                "p50": statistics.median(latencies) if latencies else float("nan"),
+                "p99": _percentile(latencies, 0.99) if latencies else float("nan"),
+                "max": max(latencies) if latencies else float("nan"),
+                "errors": len(errors),
+                "write_cycles": len(cycles),
+            }
+        write_engine.dispose()
+        read_engine.dispose()
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=10, help="duration of each phase")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--rows-per-cycle", type=int, default=20_000, help="tick rows the writer inserts per cycle")
+    args = parser.parse_args()
+
+    print(f"{'profile':<12}{'phase':<9}{'reads':>8}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}{'errors':>8}{'writes':>8}")
+    for profile in ("default", "production"):
+        for phase, r in run_profile(profile, args).items():
+            print(
+                f"{profile:<12}{phase:<9}{r['reads']:>8}{r['p50']:>9.2f}{r['p99']:>9.2f}"
+                f"{r['max']:>9.1f}{r['errors']:>8}{r['write_cycles']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
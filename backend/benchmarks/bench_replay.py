@@ -0,0 +1,95 @@
+"""
+Benchmark the replay engine over a year of synthetic history.
+
+Fills a scratch database with --days of inputs for --countries countries in
+the shape retention leaves behind (daily rollups for sentiment and market,
+raw protests and elections), then replays it into scenario_psi with a
+process pool and in-process, and reports wall time and throughput.
+
+    cd backend && python -m benchmarks.bench_replay --countries 200 --days 365
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401
+from app.database import Base, create_sqlite_engine
+from app.migrations import migrate
+from app.models import Country, Election, ProtestEvent, SentimentRollup, MarketRollup
+from app.services.replay import run_replay
+
+
+def _fill(session, countries: int, start: datetime, days: int) -> None:
+    rnd = random.Random(42)
+    session.execute(insert(Country), [
+        {"id": i, "name": f"Country {i}", "iso_code": f"{i:03d}", "region": "Europe", "latitude": 0, "longitude": 0}
+        for i in range(1, countries + 1)
+    ])
+    sentiment, market, protests, elections = [], [], [], []
+    for cid in range(1, countries + 1):
+        for d in range(days):
+            day = start + timedelta(days=d)
+            samples = 2880  # one tick per 30 s
+            sentiment.append({
+                "country_id": cid, "resolution": "day", "bucket_start": day, "samples": samples,
+                "score_sum": rnd.uniform(-0.8, 0.6) * samples, "score_max": 0.6,
+                "volatility_index_sum": rnd.uniform(0.1, 0.9) * samples, "volatility_index_max": 0.9,
+            })
+            market.append({
+                "country_id": cid, "resolution": "day", "bucket_start": day, "samples": samples,
+                "currency_volatility_sum": rnd.uniform(0.5, 3.0) * samples, "currency_volatility_max": 5.0,
+                "bond_yield_change_sum": rnd.uniform(-0.5, 1.5) * samples, "bond_yield_change_max": 1.5,
+            })
+            for _ in range(rnd.randint(0, 3)):
+                protests.append({
+                    "country_id": cid, "severity_score": round(rnd.uniform(0.2, 4.5), 1),
+                    "location": "Square", "date": day + timedelta(minutes=rnd.randint(0, 1439)),
+                })
+        for _ in range(4):
+            elections.append({
+                "country_id": cid, "type": "presidential",
+                "date": start + timedelta(days=rnd.randint(0, days + 60)),
+            })
+    for model, rows in ((SentimentRollup, sentiment), (MarketRollup, market), (ProtestEvent, protests), (Election, elections)):
+        session.execute(insert(model), rows)
+    session.commit()
+    print(f"  loaded {len(sentiment) + len(market):,} rollups, {len(protests):,} protests, {len(elections):,} elections")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--step", choices=["hour", "day"], default="day")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    start = datetime(2025, 1, 1)
+    end = start + timedelta(days=args.days - 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        engine = create_sqlite_engine(url)
+        Base.metadata.create_all(bind=engine)
+        migrate(engine)
+        session = sessionmaker(bind=engine)()
+        _fill(session, args.countries, start, args.days)
+
+        for workers in (args.workers, 1):
+            began = time.perf_counter()
+            report = run_replay(session, f"bench-{workers}", start, end, args.step, workers, url=url)
+            elapsed = time.perf_counter() - began
+            print(
+                f"  {workers:>2} worker(s): {report.rows:,} rows ({report.countries} countries x {report.steps} steps), "
+                f"{report.transitions:,} transitions in {elapsed:.2f}s ({report.rows / elapsed:,.0f} rows/s)"
+            )
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark dashboard serialization: per-row Pydantic vs row tuples + RowLayout.
+
+Builds a scratch database with --countries countries, a PSI score each and
+--days of daily timeline rollups, then times the /countries, /leaderboard
+and /timeline builders both ways (query + encode, as served on a cache
+miss) and the /live snapshot frame, reporting CPU time per request.
+
+    cd backend && python -m benchmarks.bench_serialize --countries 200 --days 30
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401
+from app.database import Base, create_sqlite_engine
+from app.main import LEADERBOARD_LAYOUT, _build_countries, _build_timeline
+from app.models import Country, PSIScore, PSIDailyRollup
+from app.schemas import CountryWithPSI, LeaderboardEntry, TimelineEntry
+from app.services.psi_history import load_timeline
+from app.services.psi_stream import PSIStream
+from app.services.queries import latest_psi_by_country
+from app.services.serialize import dumps
+
+
+def _stdlib_encode(content) -> bytes:
+    """The previous snapshot_cache.encode_json."""
+    return json.dumps(jsonable_encoder(content), separators=(",", ":")).encode()
+
+
+def _pydantic_countries(db) -> bytes:
+    return _stdlib_encode([
+        CountryWithPSI(
+            id=c.id, name=c.name, iso_code=c.iso_code, region=c.region, latitude=c.latitude, longitude=c.longitude,
+            psi_score=psi.psi_score if psi else 0.0, risk_level=psi.risk_level if psi else "Stable",
+        )
+        for c, psi in latest_psi_by_country(db)
+    ])
+
+
+def _pydantic_leaderboard(db) -> bytes:
+    top = db.query(PSIScore, Country).join(Country, PSIScore.country_id == Country.id).order_by(PSIScore.psi_score.desc()).limit(10).all()
+    return _stdlib_encode([
+        LeaderboardEntry(
+            rank=i + 1, country_id=c.id, country_name=c.name, iso_code=c.iso_code,
+            psi_score=psi.psi_score, risk_level=psi.risk_level,
+        )
+        for i, (psi, c) in enumerate(top)
+    ])
+
+
+def _rows_leaderboard(db) -> bytes:
+    """The same query as row tuples (the in-memory board is in bench_leaderboard)."""
+    top = db.execute(
+        select(Country.id, Country.name, Country.iso_code, PSIScore.psi_score, PSIScore.risk_level)
+        .join(Country, PSIScore.country_id == Country.id)
+        .order_by(PSIScore.psi_score.desc())
+        .limit(10)
+    )
+    return LEADERBOARD_LAYOUT.encode((i + 1, *row) for i, row in enumerate(top))
+
+
+def _pydantic_timeline(db, days: int, today: date) -> bytes:
+    return _stdlib_encode([
+        TimelineEntry(
+            date=day, country_id=cid, psi_score=last, risk_level=level,
+            psi_min=low, psi_max=high, psi_mean=round(mean, 1),
+        )
+        for day, cid, last, level, low, high, mean in load_timeline(db, days, today)
+    ])
+
+
+def _fill(session, countries: int, days: int, today: date) -> None:
+    rnd = random.Random(42)
+    now = datetime.utcnow()
+    session.execute(insert(Country), [
+        {"id": i, "name": f"Country {i}", "iso_code": f"{i:03d}", "region": "Europe",
+         "latitude": rnd.uniform(-60, 60), "longitude": rnd.uniform(-180, 180)}
+        for i in range(1, countries + 1)
+    ])
+    session.execute(insert(PSIScore), [
+        {"country_id": i, "psi_score": round(rnd.uniform(5, 95), 1), "risk_level": "Moderate",
+         "escalation_probability": round(rnd.random(), 3), "updated_at": now}
+        for i in range(1, countries + 1)
+    ])
+    rollups = []
+    for d in range(days):
+        day = (today - timedelta(days=d)).isoformat()
+        for i in range(1, countries + 1):
+            psi = round(rnd.uniform(5, 95), 1)
+            rollups.append({
+                "day": day, "country_id": i, "psi_last": psi, "risk_level_last": "Moderate",
+                "psi_min": psi - 3, "psi_max": psi + 3, "psi_sum": psi * 96, "samples": 96, "updated_at": now,
+            })
+    session.execute(insert(PSIDailyRollup), rollups)
+    session.commit()
+
+
+def _cpu_per_call(fn, repeat: int) -> float:
+    fn()  # warm up
+    began = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - began) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    today = datetime.utcnow().date()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        _fill(session, args.countries, args.days, today)
+
+        stream = PSIStream()
+        stream.update(
+            [(i, 50.0 + i % 40, "Elevated", 0.25) for i in range(1, args.countries + 1)],
+            datetime.utcnow().isoformat(),
+        )
+        cases = [
+            ("/countries", lambda: _pydantic_countries(session), lambda: _build_countries(session)),
+            ("/leaderboard", lambda: _pydantic_leaderboard(session), lambda: _rows_leaderboard(session)),
+            (f"/timeline?days={args.days}", lambda: _pydantic_timeline(session, args.days, today),
+             lambda: _build_timeline(session, args.days, today)),
+            ("/live snapshot", lambda: json.dumps(stream._message(list(stream.last), snapshot=True)),
+             lambda: dumps(stream._message(list(stream.last), snapshot=True)).decode()),
+        ]
+        print(f"{args.countries} countries, CPU time per request:")
+        for name, old, new in cases:
+            assert json.loads(old()) == json.loads(new()), name
+            t_old, t_new = _cpu_per_call(old, args.repeat), _cpu_per_call(new, args.repeat)
+            print(f"  {name:<22} before {t_old * 1e3:8.3f} ms   after {t_new * 1e3:8.3f} ms   {t_old / t_new:5.1f}x")
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+from app.services.alerts import AlertEngine
+
+
+def _move(engine, country_id, old, new):
+    rows = [{"country_id": country_id, "psi_score": new, "previous_psi_score": old}]
+    return sorted(a["alert_id"] for a in engine.evaluate(rows, "t"))
+
+
+def test_fires_once_when_rising_through_threshold():
+    engine = AlertEngine(hysteresis=5.0)
+    engine.add(1, 7, 50.0)
+    assert _move(engine, 7, 40.0, 49.9) == []
+    assert _move(engine, 7, 49.9, 50.0) == [1]  # reaching the threshold counts
+    assert _move(engine, 7, 50.0, 60.0) == []
+
+
+def test_hysteresis_band_keeps_alert_disarmed():
+    engine = AlertEngine(hysteresis=5.0)
+    engine.add(1, 7, 50.0)
+    assert _move(engine, 7, 40.0, 55.0) == [1]
+    assert _move(engine, 7, 55.0, 45.0) == []  # exactly threshold - hysteresis
+    assert _move(engine, 7, 45.0, 55.0) == []
+
+
+def test_rearms_below_hysteresis_band():
+    engine = AlertEngine(hysteresis=5.0)
+    engine.add(1, 7, 50.0)
+    assert _move(engine, 7, 40.0, 55.0) == [1]
+    assert _move(engine, 7, 55.0, 44.9) == []
+    assert _move(engine, 7, 44.9, 51.0) == [1]
+
+
+def test_equal_thresholds_fire_and_remove_independently():
+    engine = AlertEngine(hysteresis=5.0)
+    for alert_id in (3, 1, 2):
+        engine.add(alert_id, 7, 50.0)
+    engine.add(4, 8, 50.0)  # another country
+    assert _move(engine, 7, 40.0, 50.0) == [1, 2, 3]
+    engine.remove(2)
+    assert len(engine) == 3
+    assert _move(engine, 7, 50.0, 30.0) == []
+    assert _move(engine, 7, 30.0, 70.0) == [1, 3]
+
+
+def test_new_alert_below_current_psi_starts_disarmed():
+    engine = AlertEngine(hysteresis=5.0)
+    engine.add(1, 7, 10.0)
+    _move(engine, 7, 20.0, 60.0)  # now at 60
+    engine.add(2, 7, 50.0)
+    assert _move(engine, 7, 60.0, 65.0) == []
+    assert _move(engine, 7, 65.0, 40.0) == []
+    assert _move(engine, 7, 40.0, 65.0) == [2]
@@ -0,0 +1,48 @@
+import asyncio
+
+from app.services import cluster as cluster_module
+from app.services.cluster import Cluster
+
+
+async def _never(message):
+    pass
+
+
+def test_failed_leader_steps_down_and_follows(tmp_path, monkeypatch):
+    monkeypatch.setattr(cluster_module, "RETRY_INTERVAL", 0.05)
+    prefix = str(tmp_path / "db")
+    a, b = Cluster(prefix), Cluster(prefix)
+    a_led, b_led = asyncio.Event(), asyncio.Event()
+    a_heard = []
+
+    async def lead_a():
+        a_led.set()
+        raise RuntimeError("leader state failed to load")
+
+    async def lead_b():
+        b_led.set()
+        await asyncio.Event().wait()
+
+    async def scenario():
+        run_a = asyncio.create_task(
+            a.run(lead_a, lambda: [], _never, a_heard.append)
+        )
+        await asyncio.wait_for(a_led.wait(), 1)
+        run_b = asyncio.create_task(
+            b.run(lead_b, lambda: [{"type": "greeting"}], _never, lambda m: None)
+        )
+        try:
+            await asyncio.wait_for(b_led.wait(), 2)
+            for _ in range(40):
+                if a_heard:
+                    break
+                await asyncio.sleep(0.05)
+        finally:
+            for task in (run_a, run_b):
+                task.cancel()
+            await asyncio.gather(run_a, run_b, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert b_led.is_set()
+    assert a_heard == [{"type": "greeting"}]
+    assert not a.is_leader and not b.is_leader  # both released the lock on cancel
@@ -0,0 +1,26 @@
+import pytest
+from starlette.requests import Request
+
+from app.services.columnar import MEDIA_TYPE, accepts_columnar
+
+
+def _request(accept):
+    headers = [] if accept is None else [(b"accept", accept.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (MEDIA_TYPE, True),
+    (f"application/json;q=0.5, {MEDIA_TYPE}", True),
+    (f"{MEDIA_TYPE}; q=0.8, */*;q=0.1", True),
+    (f"{MEDIA_TYPE};q=0", False),
+    (f"{MEDIA_TYPE};q=0.0, application/json", False),
+    (f"{MEDIA_TYPE};q=0.5, application/json", False),
+    (f"{MEDIA_TYPE};q=oops", False),
+    (f"{MEDIA_TYPE}-v2", False),
+    ("application/json", False),
+    ("*/*", False),
+    (None, False),
+])
+def test_accepts_columnar(accept, expected):
+    assert accepts_columnar(_request(accept)) is expected
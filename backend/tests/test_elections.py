@@ -0,0 +1,56 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert, update
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, create_sqlite_engine
+from app.models import Country, Election
+from app.services.elections import ElectionCalendar
+
+TODAY = date(2026, 3, 1)
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.execute(insert(Country), [
+        {"id": 1, "name": "Country 1", "iso_code": "001", "region": "Europe", "latitude": 0, "longitude": 0}
+    ])
+    session.execute(insert(Election), [
+        {"id": 1, "country_id": 1, "date": datetime(2026, 3, 20), "type": "general"}
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_in_place_edit_is_cached_until_bump(db):
+    calendar = ElectionCalendar()
+    assert calendar.next_by_country(db, TODAY)[1].days_remaining == 19
+    db.execute(update(Election).where(Election.id == 1).values(date=datetime(2026, 3, 10)))
+    db.commit()
+    assert calendar.next_by_country(db, TODAY)[1].days_remaining == 19
+    calendar.bump()
+    assert calendar.next_by_country(db, TODAY)[1].days_remaining == 9
+
+
+def test_rolled_back_insert_does_not_linger(db):
+    calendar = ElectionCalendar()
+    db.add(Election(id=2, country_id=1, date=datetime(2026, 3, 5), type="snap"))
+    db.flush()
+    # The recompute reads uncached and sees its own transaction's election
+    assert calendar.next_by_country(db, TODAY, cached=False)[1].id == 2
+    db.rollback()
+    calendar.bump()
+    assert calendar.next_by_country(db, TODAY)[1].id == 1
+    assert [e.id for e in calendar.upcoming(db, TODAY)] == [1]
+
+
+def test_new_day_refreshes_days_remaining(db):
+    calendar = ElectionCalendar()
+    assert calendar.upcoming(db, TODAY)[0].days_remaining == 19
+    assert calendar.upcoming(db, date(2026, 3, 2))[0].days_remaining == 18
@@ -0,0 +1,28 @@
+from app.services.events import EventBus
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def on_event(self, payload):
+        self.calls += 1
+
+
+def test_unsubscribe_bound_method():
+    bus = EventBus()
+    counter = Counter()
+    bus.subscribe("topic", counter.on_event)
+    bus.unsubscribe("topic", counter.on_event)
+    bus.publish("topic", {})
+    assert counter.calls == 0
+
+
+def test_unsubscribe_keeps_other_instances():
+    bus = EventBus()
+    first, second = Counter(), Counter()
+    bus.subscribe("topic", first.on_event)
+    bus.subscribe("topic", second.on_event)
+    bus.unsubscribe("topic", first.on_event)
+    bus.publish("topic", {})
+    assert (first.calls, second.calls) == (0, 1)
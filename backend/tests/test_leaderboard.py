@@ -0,0 +1,105 @@
+import random
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, create_sqlite_engine
+from app.models import Country, PSIScore
+from app.psi_engine import RISK_LEVELS
+from app.services.leaderboard import Leaderboard
+
+REGIONS = ["Europe", "Asia", "Africa"]
+
+
+def _level(psi):
+    return next(level for low, high, level in RISK_LEVELS if psi <= high)
+
+
+def _order_by(db, region=None, level=None, limit=10):
+    """The ORDER BY query the in-memory boards replace (one psi_scores row per country here)."""
+    query = (
+        select(Country.id, PSIScore.psi_score, PSIScore.risk_level)
+        .join(Country, PSIScore.country_id == Country.id)
+        .order_by(PSIScore.psi_score.desc(), Country.id)
+        .limit(limit)
+    )
+    if region is not None:
+        query = query.where(Country.region == region)
+    if level is not None:
+        query = query.where(PSIScore.risk_level == level)
+    return [tuple(row) for row in db.execute(query)]
+
+
+def _top(board, **kwargs):
+    return [(cid, psi, level) for _, cid, _, _, psi, level in board.top(**kwargs)]
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    rnd = random.Random(3)
+    session.execute(insert(Country), [
+        {"id": i, "name": f"Country {i}", "iso_code": f"{i:03d}", "region": REGIONS[i % 3],
+         "latitude": 0, "longitude": 0}
+        for i in range(1, 31)
+    ])
+    scores = [round(rnd.uniform(5, 95), 0) for _ in range(30)]  # whole numbers, so ties happen
+    session.execute(insert(PSIScore), [
+        {"id": i, "country_id": i, "psi_score": psi, "risk_level": _level(psi),
+         "escalation_probability": 0.1, "updated_at": datetime(2026, 1, 1)}
+        for i, psi in enumerate(scores, 1)
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _assert_matches(db, board):
+    for region in (None, *REGIONS):
+        for level in (None, *(level for _, _, level in RISK_LEVELS)):
+            for limit in (1, 3, 100):
+                assert _top(board, region=region, risk_level=level, limit=limit) == _order_by(
+                    db, region, level, limit
+                ), (region, level, limit)
+
+
+def _set(db, country_id, psi):
+    db.execute(update(PSIScore).where(PSIScore.country_id == country_id).values(
+        psi_score=psi, risk_level=_level(psi)))
+    db.commit()
+    return {"country_id": country_id, "psi_score": psi, "risk_level": _level(psi)}
+
+
+def test_rebuild_matches_order_by(db):
+    board = Leaderboard()
+    board.rebuild(db)
+    _assert_matches(db, board)
+
+
+def test_apply_delta_matches_order_by(db):
+    board = Leaderboard()
+    board.rebuild(db)
+    old = db.scalar(select(PSIScore.risk_level).where(PSIScore.country_id == 4))
+    moved = [_set(db, 4, 96.0), _set(db, 5, 1.0), _set(db, 6, 50.0)]
+    assert moved[0]["risk_level"] != old  # a country changing level leaves its old board
+    board.apply({"snapshot": False, "data": moved})
+    _assert_matches(db, board)
+    assert board.counts()[old] == len(_order_by(db, level=old, limit=100))
+
+
+def test_apply_snapshot_and_recompute_rows_match_order_by(db):
+    board = Leaderboard()
+    board.rebuild(db)
+    rnd = random.Random(8)
+    snapshot = [_set(db, cid, round(rnd.uniform(0, 100), 0)) for cid in range(1, 31)]
+    board.apply({"snapshot": True, "data": snapshot})
+    _assert_matches(db, board)
+    for _ in range(5):
+        rows = [_set(db, rnd.randint(1, 30), round(rnd.uniform(0, 100), 0)) for _ in range(4)]
+        board.on_psi_recomputed({"rows": rows})
+        _assert_matches(db, board)
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, create_sqlite_engine
+from app.models import Country, MarketIndicator, ProtestEvent
+from app.services import psi_batch
+from app.services.protest_window import ProtestWindow
+from app.services.trends import TrendEngine
+
+NOW = datetime(2026, 3, 1, 12)
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(psi_batch, "protest_window", ProtestWindow())
+    monkeypatch.setattr(psi_batch, "trend_engine", TrendEngine())
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.execute(insert(Country), [
+        {"id": i, "name": f"Country {i}", "iso_code": f"{i:03d}", "region": "Europe", "latitude": 0, "longitude": 0}
+        for i in (1, 2)
+    ])
+    session.add(ProtestEvent(country_id=1, severity_score=2.0, location="x", date=NOW - timedelta(hours=2)))
+    session.commit()
+    psi_batch.recompute_psi(session, NOW)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_failed_recompute_drops_rolled_back_rows_from_windows(db, monkeypatch):
+    db.add(ProtestEvent(country_id=1, severity_score=4.0, location="x", date=NOW - timedelta(hours=1)))
+    db.add(MarketIndicator(country_id=2, currency_volatility=9.0, bond_yield_change=0.0, timestamp=NOW))
+
+    def fail(*args):
+        raise RuntimeError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(psi_batch, "record_psi_history", fail)
+        with pytest.raises(RuntimeError):
+            psi_batch.recompute_psi(db, NOW + timedelta(minutes=5))
+    db.rollback()
+
+    # The rolled-back rows' ids are reused by the next inserts
+    db.add(ProtestEvent(country_id=2, severity_score=1.0, location="x", date=NOW - timedelta(hours=1)))
+    db.commit()
+    window, trends = psi_batch.protest_window, psi_batch.trend_engine
+    psi_batch.recompute_psi(db, NOW + timedelta(minutes=10))
+    stats = window.stats()
+    assert {cid: (s.severity_sum, s.count) for cid, s in stats.items()} == {1: (2.0, 1), 2: (1.0, 1)}
+    assert trends._market.get(2).n == 0
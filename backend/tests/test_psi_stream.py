@@ -0,0 +1,70 @@
+from app.services.psi_stream import PSIStream
+
+
+def _stream(buffer_size=4):
+    stream = PSIStream(buffer_size=buffer_size)
+    stream.update([(1, 10.0, "Stable", 0.1), (2, 20.0, "Stable", 0.1), (3, 30.0, "Moderate", 0.2)], "t0")
+    return stream
+
+
+def _scores(message):
+    return {d["country_id"]: d["psi_score"] for d in message["data"]}
+
+
+def test_since_inside_ring_gets_one_merged_delta():
+    stream = _stream()
+    since = stream.seq
+    stream.update([(1, 11.0, "Stable", 0.1)], "t1")
+    stream.update([(2, 21.0, "Stable", 0.1)], "t2")
+    stream.update([(1, 12.0, "Stable", 0.1)], "t3")
+    [message] = stream.resume(since, stream.epoch)
+    assert not message["snapshot"]
+    assert message["seq"] == stream.seq == since + 3
+    assert _scores(message) == {1: 12.0, 2: 21.0}  # latest state per country
+
+
+def test_since_outside_ring_gets_snapshot():
+    stream = _stream(buffer_size=2)
+    since = stream.seq
+    for i in range(3):
+        stream.update([(1, 40.0 + i, "Moderate", 0.2)], f"t{i}")
+    [message] = stream.resume(since, stream.epoch)
+    assert message["snapshot"]
+    assert _scores(message) == {1: 42.0, 2: 20.0, 3: 30.0}
+
+
+def test_epoch_mismatch_gets_snapshot():
+    stream = _stream()
+    since = stream.seq
+    stream.update([(1, 11.0, "Stable", 0.1)], "t1")
+    for epoch in (None, "another-process"):
+        [message] = stream.resume(since, epoch)
+        assert message["snapshot"] and message["epoch"] == stream.epoch
+
+
+def test_since_ahead_of_stream_gets_snapshot():
+    stream = _stream()
+    [message] = stream.resume(stream.seq + 5, stream.epoch)
+    assert message["snapshot"]
+
+
+def test_up_to_date_client_gets_nothing():
+    stream = _stream()
+    stream.update([(1, 11.0, "Stable", 0.1)], "t1")
+    assert stream.resume(stream.seq, stream.epoch) == []
+
+
+def test_new_client_gets_snapshot():
+    stream = _stream()
+    [message] = stream.resume(None)
+    assert message["snapshot"] and message["seq"] == stream.seq
+
+
+def test_follower_adopts_leader_epoch_and_resumes():
+    leader, follower = _stream(), PSIStream()
+    follower.apply(leader.snapshot())
+    since = leader.seq
+    follower.apply(leader.update([(3, 31.0, "Moderate", 0.2)], "t1"))
+    assert (follower.seq, follower.epoch) == (leader.seq, leader.epoch)
+    [message] = follower.resume(since, leader.epoch)
+    assert not message["snapshot"] and _scores(message) == {3: 31.0}
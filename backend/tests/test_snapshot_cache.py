@@ -0,0 +1,23 @@
+from app.services.snapshot_cache import SnapshotCache
+
+
+def test_limit_caps_entries_per_family_and_generation():
+    cache = SnapshotCache()
+    builds = []
+
+    def build(ids):
+        return lambda: builds.append(ids) or list(ids)
+
+    for ids in ((1,), (2,), (3,), (1,)):
+        cache.get(("sets", ids), build(ids), limit=2)
+    assert builds == [(1,), (2,), (3,)]  # (1,) was cached, (3,) was over the limit
+    cache.get(("sets", (3,)), build((3,)), limit=2)
+    assert builds[-1] == (3,) and len(builds) == 4
+    cache.get(("all",), build(()))  # other families are unaffected
+    cache.get(("all",), build(()))
+    assert len(builds) == 5
+
+    cache.bump()
+    cache.get(("sets", (3,)), build((3,)), limit=2)
+    cache.get(("sets", (3,)), build((3,)), limit=2)
+    assert len(builds) == 6
@@ -1,9 +1,9 @@
 'use client';
 
-import { useEffect, useState, useCallback } from 'react';
+import { useEffect, useState, useCallback, useRef } from 'react';
 import dynamic from 'next/dynamic';
 import { AnimatePresence } from 'framer-motion';
-import { fetchCountries, fetchCountry, fetchLeaderboard, fetchUpcomingElections, getWebSocketUrl } from '@/lib/api';
+import { fetchCountries, fetchCountry, fetchCountryDetails, fetchLeaderboard, fetchUpcomingElections, getWebSocketUrl } from '@/lib/api';
 import type { CountryWithPSI, CountryDetail, LeaderboardEntry } from '@/app/types';
 import LeftPanel from '@/components/LeftPanel';
 import RightPanel from '@/components/RightPanel';
@@ -26,6 +26,32 @@ export default function Home() {
   const [upcomingElections, setUpcomingElections] = useState<import('@/lib/api').UpcomingElection[]>([]);
   const [selectedCountry, setSelectedCountry] = useState<CountryDetail | null>(null);
   const [loading, setLoading] = useState(true);
+  // Every country's detail panel, prefetched once so clicks open instantly.
+  // A psi_update evicts the countries it names; clicks on those refetch.
+  const details = useRef(new Map<number, CountryDetail>());
+  const evictedDuringPrefetch = useRef<Set<number> | null>(null);
+
+  const evictDetails = useCallback((ids: number[]) => {
+    for (const id of ids) {
+      details.current.delete(id);
+      evictedDuringPrefetch.current?.add(id);
+    }
+  }, []);
+
+  useEffect(() => {
+    const evicted = new Set<number>();
+    evictedDuringPrefetch.current = evicted;
+    fetchCountryDetails()
+      .then((all) => {
+        for (const d of all) {
+          if (!evicted.has(d.id)) details.current.set(d.id, d);
+        }
+      })
+      .catch(() => {})
+      .finally(() => {
+        if (evictedDuringPrefetch.current === evicted) evictedDuringPrefetch.current = null;
+      });
+  }, []);
 
   const loadData = useCallback(async () => {
     try {
@@ -49,13 +75,27 @@ export default function Home() {
   }, [loadData]);
 
   useEffect(() => {
-    const wsUrl = getWebSocketUrl();
     let ws: WebSocket | null = null;
-    try {
-      ws = new WebSocket(wsUrl);
+    let lastSeq: number | null = null;
+    let lastEpoch: string | null = null;
+    let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+    let closed = false;
+
+    const connect = () => {
+      try {
+        ws = new WebSocket(getWebSocketUrl(lastSeq, lastEpoch));
+      } catch {
+        // WebSocket not available, use polling
+        reconnectTimer = setInterval(loadData, 10000);
+        return;
+      }
       ws.onmessage = (event) => {
         const msg = JSON.parse(event.data);
         if (msg.type === 'psi_update' && msg.data) {
+          // The first snapshot on connect is the state the prefetch already has
+          const initial = msg.snapshot && lastSeq === null;
+          lastSeq = msg.seq ?? lastSeq;
+          lastEpoch = msg.epoch ?? lastEpoch;
           setCountries((prev) => {
             const map = new Map(prev.map((c) => [c.id, c]));
             for (const u of msg.data) {
@@ -66,19 +106,31 @@ export default function Home() {
             }
             return Array.from(map.values());
           });
+          if (!initial) evictDetails(msg.data.map((u: { country_id: number }) => u.country_id));
           loadData();
         }
       };
       ws.onerror = () => {};
-    } catch {
-      // WebSocket not available, use polling
-      const interval = setInterval(loadData, 10000);
-      return () => clearInterval(interval);
-    }
-    return () => ws?.close();
-  }, [loadData]);
+      ws.onclose = () => {
+        // Resume from the last seen seq; the server replays missed deltas
+        if (!closed) reconnectTimer = setTimeout(connect, 3000);
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      if (reconnectTimer) clearTimeout(reconnectTimer);
+      ws?.close();
+    };
+  }, [loadData, evictDetails]);
 
   const handleCountryClick = useCallback(async (country: CountryWithPSI) => {
+    const cached = details.current.get(country.id);
+    if (cached) {
+      setSelectedCountry(cached);
+      return;
+    }
     try {
       const detail = await fetchCountry(country.id);
       setSelectedCountry(detail);
@@ -32,8 +32,15 @@ export default function TimelineSlider({ countries }: TimelineSliderProps) {
   }, [days]);
 
   const countryNames = new Map(countries.map((c) => [c.id, c.name]));
-  const topRisks = [...timeline]
-    .sort((a, b) => b.psi_score - a.psi_score)
+  const peak = (t: TimelineEntry) => t.psi_max ?? t.psi_score;
+  // One row per country: its highest daily PSI within the lookback
+  const peaks = new Map<number, TimelineEntry>();
+  for (const t of timeline) {
+    const best = peaks.get(t.country_id);
+    if (!best || peak(t) > peak(best)) peaks.set(t.country_id, t);
+  }
+  const topRisks = Array.from(peaks.values())
+    .sort((a, b) => peak(b) - peak(a))
     .slice(0, 8);
 
   return (
@@ -83,7 +90,7 @@ export default function TimelineSlider({ countries }: TimelineSliderProps) {
                     {countryNames.get(t.country_id) ?? `Country ${t.country_id}`}
                   </span>
                   <span className={`font-bold ${RISK_CLASSES[t.risk_level] || 'text-slate-400'}`}>
-                    {t.psi_score.toFixed(1)}
+                    {peak(t).toFixed(1)}
                   </span>
                 </div>
               ))}
@@ -12,6 +12,13 @@ export async function fetchCountry(id: number): Promise<import('@/app/types').Co
   return res.json();
 }
 
+export async function fetchCountryDetails(ids?: number[]): Promise<import('@/app/types').CountryDetail[]> {
+  const query = ids && ids.length ? `?ids=${ids.join(',')}` : '';
+  const res = await fetch(`${API_BASE}/countries/detail${query}`);
+  if (!res.ok) throw new Error('Failed to fetch country details');
+  return res.json();
+}
+
 export async function fetchLeaderboard(): Promise<import('@/app/types').LeaderboardEntry[]> {
   const res = await fetch(`${API_BASE}/leaderboard`);
   if (!res.ok) throw new Error('Failed to fetch leaderboard');
@@ -34,9 +41,9 @@ export async function fetchUpcomingElections(): Promise<UpcomingElection[]> {
   return res.json();
 }
 
-export function getWebSocketUrl(): string {
+export function getWebSocketUrl(since?: number | null, epoch?: string | null): string {
   const base = process.env.NEXT_PUBLIC_WS_URL || 'ws://localhost:8000';
-  return `${base}/live`;
+  return since != null && epoch ? `${base}/live?since=${since}&epoch=${epoch}` : `${base}/live`;
 }
 
 export interface TimelineEntry {
@@ -44,6 +51,9 @@ export interface TimelineEntry {
   country_id: number;
   psi_score: number;
   risk_level: string;
+  psi_min?: number;
+  psi_max?: number;
+  psi_mean?: number;
 }
 
 export async function fetchTimeline(days: number = 30): Promise<TimelineEntry[]> {